@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+from fastapi import HTTPException, Request
+from starlette.datastructures import State
+
+READY_DB = 0b01
+READY_NLP = 0b10
+
+DB_UNAVAILABLE_DETAIL = "Database unavailable. Check backend logs and DB path configuration."
+NLP_UNAVAILABLE_DETAIL = "NLP unavailable. Check backend logs and NLP model installation."
+
+
+def refresh_ready_mask(state: State) -> None:
+    """Recompute the readiness bitfield after db_ready/nlp_ready change."""
+    state.ready_mask = (READY_DB if state.db_ready else 0) | (READY_NLP if state.nlp_ready else 0)
+
+
+def require_ready(mask: int) -> Callable[[Request], Awaitable[None]]:
+    # Async so FastAPI runs the gate inline instead of dispatching it to the threadpool.
+    async def dependency(request: Request) -> None:
+        ready_mask = request.app.state.ready_mask
+        if ready_mask & mask == mask:
+            return
+        if mask & READY_DB and not ready_mask & READY_DB:
+            raise HTTPException(status_code=503, detail=DB_UNAVAILABLE_DETAIL)
+        raise HTTPException(status_code=503, detail=NLP_UNAVAILABLE_DETAIL)
+
+    return dependency
+
+
+require_db = require_ready(READY_DB)
+require_db_and_nlp = require_ready(READY_DB | READY_NLP)
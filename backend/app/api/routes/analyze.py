@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import sqlite3
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 
+from app.api.dependencies import NLP_UNAVAILABLE_DETAIL, require_db_and_nlp
 from app.api.schemas.v1.analyze import AnalyzeRequest, AnalyzeResponse
 from app.services.use_cases import AnalyzeNoteUseCase
 
@@ -12,35 +15,34 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-@router.post("/analyze", response_model=AnalyzeResponse)
-def analyze_note(payload: AnalyzeRequest, request: Request) -> AnalyzeResponse:
-    if not bool(getattr(request.app.state, "db_ready", False)):
-        raise HTTPException(
-            status_code=503,
-            detail="Database unavailable. Check backend logs and DB path configuration.",
-        )
-    if not bool(getattr(request.app.state, "nlp_ready", False)):
-        raise HTTPException(
-            status_code=503,
-            detail="NLP unavailable. Check backend logs and NLP model installation.",
-        )
-
-    settings = request.app.state.settings
-    nlp_adapter = request.app.state.nlp_adapter
+@router.post(
+    "/analyze",
+    response_model=AnalyzeResponse,
+    response_class=ORJSONResponse,
+    dependencies=[Depends(require_db_and_nlp)],
+)
+async def analyze_note(payload: AnalyzeRequest, request: Request) -> ORJSONResponse:
+    state = request.app.state
+    nlp_adapter = state.nlp_adapter
     if nlp_adapter is None:
-        raise HTTPException(
-            status_code=503,
-            detail="NLP unavailable. Check backend logs and NLP model installation.",
-        )
+        raise HTTPException(status_code=503, detail=NLP_UNAVAILABLE_DETAIL)
 
     use_case = AnalyzeNoteUseCase(
-        settings.db_path,
+        state.settings.db_path,
         nlp_adapter=nlp_adapter,
-        typo_engine=getattr(request.app.state, "typo_engine", None),
+        typo_engine=state.typo_engine,
+        classification_cache=state.classification_cache,
+        classifier=state.classifier,
     )
 
+    # Tokenization and classification block on NLP/SQLite; keep them off the event loop.
+    loop = asyncio.get_running_loop()
     try:
-        tokens = use_case.execute(payload.text)
+        tokens = await loop.run_in_executor(
+            state.analysis_executor,
+            use_case.execute,
+            payload.text,
+        )
     except sqlite3.OperationalError as exc:
         logger.exception("analyze_db_operational_error")
         raise HTTPException(
@@ -48,4 +50,6 @@ def analyze_note(payload: AnalyzeRequest, request: Request) -> AnalyzeResponse:
             detail=f"Database unavailable: {exc}",
         ) from exc
 
-    return AnalyzeResponse(tokens=tokens)
+    # Tokens are built from trusted classifier output; serialize once with orjson
+    # instead of re-validating through response_model and encoding with stdlib json.
+    return ORJSONResponse(AnalyzeResponse.model_construct(tokens=tokens).model_dump())
@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Request
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, Request, Response
 
 router = APIRouter()
 
@@ -9,9 +12,25 @@ def api_root() -> dict[str, str]:
 
 
 @router.get("/health")
-def health(request: Request) -> dict[str, object]:
-    db_ready = bool(getattr(request.app.state, "db_ready", False))
-    nlp_ready = bool(getattr(request.app.state, "nlp_ready", False))
+async def health(request: Request) -> Response:
+    state = request.app.state
+    body = _health_body(
+        state.db_ready,
+        state.nlp_ready,
+        state.db_error,
+        state.nlp_error,
+    )
+    return Response(content=body, media_type="application/json")
+
+
+@lru_cache(maxsize=16)
+def _health_body(
+    db_ready: bool,
+    nlp_ready: bool,
+    db_error: object | None,
+    nlp_error: object | None,
+) -> bytes:
+    # Readiness only changes at startup or reset, so pollers get pre-encoded bytes.
     status = "ok" if db_ready and nlp_ready else "degraded"
     payload: dict[str, object] = {
         "status": status,
@@ -22,11 +41,9 @@ def health(request: Request) -> dict[str, object]:
         },
     }
 
-    db_error = getattr(request.app.state, "db_error", None)
-    nlp_error = getattr(request.app.state, "nlp_error", None)
     if db_error:
         payload["db_error"] = str(db_error)
     if nlp_error:
         payload["nlp_error"] = str(nlp_error)
 
-    return payload
+    return orjson.dumps(payload)
@@ -3,8 +3,9 @@ from __future__ import annotations
 import logging
 import sqlite3
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 
+from app.api.dependencies import require_db
 from app.api.schemas.v1.sentencebank import (
     AddSentenceRequest,
     AddSentenceResponse,
@@ -12,29 +13,22 @@ from app.api.schemas.v1.sentencebank import (
 )
 from app.services.use_cases import SentencebankUseCase
 
-router = APIRouter()
+# Every route here reads or writes the database.
+router = APIRouter(dependencies=[Depends(require_db)])
 logger = logging.getLogger(__name__)
 
 
-def _require_db_ready(request: Request) -> None:
-    if not bool(getattr(request.app.state, "db_ready", False)):
-        raise HTTPException(
-            status_code=503,
-            detail="Database unavailable. Check backend logs and DB path configuration.",
-        )
-
-
 def _sentencebank_use_case(request: Request) -> SentencebankUseCase:
+    state = request.app.state
     return SentencebankUseCase(
-        db_path=request.app.state.settings.db_path,
-        translation_service=getattr(request.app.state, "translation_service", None),
+        db_path=state.settings.db_path,
+        translation_service=state.translation_service,
+        connection_pool=state.db_pool,
     )
 
 
 @router.post("/sentencebank/sentences", response_model=AddSentenceResponse)
 def add_sentence(payload: AddSentenceRequest, request: Request) -> AddSentenceResponse:
-    _require_db_ready(request)
-
     try:
         return _sentencebank_use_case(request).add_sentence(payload.source_text)
     except ValueError as exc:
@@ -49,8 +43,6 @@ def add_sentence(payload: AddSentenceRequest, request: Request) -> AddSentenceRe
 
 @router.get("/sentencebank/sentences", response_model=SentenceListResponse)
 def list_sentences(request: Request) -> SentenceListResponse:
-    _require_db_ready(request)
-
     try:
         return _sentencebank_use_case(request).list_sentences()
     except sqlite3.OperationalError as exc:
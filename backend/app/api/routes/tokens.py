@@ -36,7 +36,7 @@ class TokenIgnoreResponse(BaseModel):
 
 @router.post("/tokens/feedback", response_model=TokenFeedbackResponse)
 def post_token_feedback(payload: TokenFeedbackRequest, request: Request) -> TokenFeedbackResponse:
-    engine = getattr(request.app.state, "typo_engine", None)
+    engine = request.app.state.typo_engine
     if engine is None:
         raise HTTPException(status_code=503, detail="Typo engine unavailable.")
     try:
@@ -50,12 +50,15 @@ def post_token_feedback(payload: TokenFeedbackRequest, request: Request) -> Toke
     except sqlite3.OperationalError as exc:
         logger.exception("token_feedback_db_operational_error")
         raise HTTPException(status_code=503, detail=f"Database unavailable: {exc}") from exc
+    classification_cache = request.app.state.classification_cache
+    if classification_cache is not None:
+        classification_cache.clear()
     return TokenFeedbackResponse(status="recorded")
 
 
 @router.post("/tokens/ignore", response_model=TokenIgnoreResponse)
 def post_token_ignore(payload: TokenIgnoreRequest, request: Request) -> TokenIgnoreResponse:
-    engine = getattr(request.app.state, "typo_engine", None)
+    engine = request.app.state.typo_engine
     if engine is None:
         raise HTTPException(status_code=503, detail="Typo engine unavailable.")
     try:
@@ -67,4 +70,7 @@ def post_token_ignore(payload: TokenIgnoreRequest, request: Request) -> TokenIgn
     except sqlite3.OperationalError as exc:
         logger.exception("token_ignore_db_operational_error")
         raise HTTPException(status_code=503, detail=f"Database unavailable: {exc}") from exc
+    classification_cache = request.app.state.classification_cache
+    if classification_cache is not None:
+        classification_cache.clear()
     return TokenIgnoreResponse(status="ignored")
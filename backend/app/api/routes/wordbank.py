@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import sqlite3
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
+from app.api.dependencies import refresh_ready_mask, require_db
 from app.api.schemas.v1.wordbank import (
+    AddWordBatchRequest,
+    AddWordBatchResponse,
     AddWordRequest,
     AddWordResponse,
     GeneratePhraseTranslationRequest,
@@ -20,33 +24,52 @@ from app.api.schemas.v1.wordbank import (
 )
 from app.services.use_cases import WordbankUseCase
 
-router = APIRouter()
+# Every route here reads or writes the database.
+router = APIRouter(dependencies=[Depends(require_db)])
 logger = logging.getLogger(__name__)
 
 
-def _require_db_ready(request: Request) -> None:
-    if not bool(getattr(request.app.state, "db_ready", False)):
-        raise HTTPException(
-            status_code=503,
-            detail="Database unavailable. Check backend logs and DB path configuration.",
-        )
-
-
 def _wordbank_use_case(request: Request) -> WordbankUseCase:
+    state = request.app.state
     return WordbankUseCase(
-        db_path=request.app.state.settings.db_path,
-        typo_engine=getattr(request.app.state, "typo_engine", None),
-        translation_service=getattr(request.app.state, "translation_service", None),
-        nlp_adapter=getattr(request.app.state, "nlp_adapter", None),
+        db_path=state.settings.db_path,
+        typo_engine=state.typo_engine,
+        translation_service=state.translation_service,
+        nlp_adapter=state.nlp_adapter,
+        classification_cache=state.classification_cache,
+        connection_pool=state.db_pool,
+        write_lock=state.write_lock,
+        wordbank_snapshot=state.wordbank_snapshot,
     )
 
 
 @router.post("/wordbank/lexemes", response_model=AddWordResponse)
-def add_word(payload: AddWordRequest, request: Request) -> AddWordResponse:
-    _require_db_ready(request)
+async def add_word(payload: AddWordRequest, request: Request) -> AddWordResponse:
+    try:
+        return await asyncio.to_thread(
+            _wordbank_use_case(request).add_word,
+            payload.surface_token,
+            payload.lemma_candidate,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    except sqlite3.OperationalError as exc:
+        logger.exception("wordbank_db_operational_error")
+        raise HTTPException(
+            status_code=503,
+            detail=f"Database unavailable: {exc}",
+        ) from exc
+
 
+@router.post("/wordbank/lexemes/batch", response_model=AddWordBatchResponse)
+async def add_words(payload: AddWordBatchRequest, request: Request) -> AddWordBatchResponse:
     try:
-        return _wordbank_use_case(request).add_word(payload.surface_token, payload.lemma_candidate)
+        items = await asyncio.to_thread(
+            _wordbank_use_case(request).add_words,
+            [(item.surface_token, item.lemma_candidate) for item in payload.items],
+        )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except RuntimeError as exc:
@@ -57,12 +80,11 @@ def add_word(payload: AddWordRequest, request: Request) -> AddWordResponse:
             status_code=503,
             detail=f"Database unavailable: {exc}",
         ) from exc
+    return AddWordBatchResponse.model_construct(items=items)
 
 
 @router.post("/wordbank/translation", response_model=GenerateTranslationResponse)
 def generate_translation(payload: GenerateTranslationRequest, request: Request) -> GenerateTranslationResponse:
-    _require_db_ready(request)
-
     try:
         return _wordbank_use_case(request).generate_translation(payload.surface_token, payload.lemma_candidate)
     except ValueError as exc:
@@ -80,8 +102,6 @@ def generate_reverse_translation(
     payload: GenerateReverseTranslationRequest,
     request: Request,
 ) -> GenerateReverseTranslationResponse:
-    _require_db_ready(request)
-
     try:
         return _wordbank_use_case(request).generate_reverse_translation(payload.source_word)
     except ValueError as exc:
@@ -99,8 +119,6 @@ def generate_phrase_translation(
     payload: GeneratePhraseTranslationRequest,
     request: Request,
 ) -> GeneratePhraseTranslationResponse:
-    _require_db_ready(request)
-
     try:
         return _wordbank_use_case(request).generate_phrase_translation(payload.source_text)
     except ValueError as exc:
@@ -114,11 +132,11 @@ def generate_phrase_translation(
 
 
 @router.get("/wordbank/lemmas", response_model=LemmaListResponse)
-def list_lemmas(request: Request) -> LemmaListResponse:
-    _require_db_ready(request)
-
+async def list_lemmas(request: Request) -> Response:
+    # response_model stays for the OpenAPI schema; the body is encoded by the use case.
     try:
-        return _wordbank_use_case(request).list_lemmas()
+        body = await asyncio.to_thread(_wordbank_use_case(request).list_lemmas_json)
+        return Response(content=body, media_type="application/json")
     except sqlite3.OperationalError as exc:
         logger.exception("wordbank_db_operational_error")
         raise HTTPException(
@@ -128,11 +146,9 @@ def list_lemmas(request: Request) -> LemmaListResponse:
 
 
 @router.get("/wordbank/lemmas/{lemma}", response_model=LemmaDetailsResponse)
-def get_lemma_details(lemma: str, request: Request) -> LemmaDetailsResponse:
-    _require_db_ready(request)
-
+async def get_lemma_details(lemma: str, request: Request) -> LemmaDetailsResponse:
     try:
-        return _wordbank_use_case(request).get_lemma_details(lemma)
+        return await asyncio.to_thread(_wordbank_use_case(request).get_lemma_details, lemma)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except LookupError as exc:
@@ -147,12 +163,11 @@ def get_lemma_details(lemma: str, request: Request) -> LemmaDetailsResponse:
 
 @router.delete("/wordbank/database", response_model=ResetDatabaseResponse)
 def reset_database(request: Request) -> ResetDatabaseResponse:
-    _require_db_ready(request)
-
     try:
         response = _wordbank_use_case(request).reset_database()
         request.app.state.db_ready = True
         request.app.state.db_error = None
+        refresh_ready_mask(request.app.state)
         return response
     except OSError as exc:
         logger.exception("wordbank_db_reset_os_error")
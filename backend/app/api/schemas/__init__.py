@@ -1,14 +1,19 @@
-from app.api.schemas.v1 import (
-    AddWordRequest,
-    AddWordResponse,
-    AnalyzedToken,
-    AnalyzeRequest,
-    AnalyzeResponse,
-    LemmaDetailsResponse,
-    LemmaListResponse,
-    LemmaSummary,
-    ResetDatabaseResponse,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.api.schemas.v1 import (
+        AddWordRequest,
+        AddWordResponse,
+        AnalyzedToken,
+        AnalyzeRequest,
+        AnalyzeResponse,
+        LemmaDetailsResponse,
+        LemmaListResponse,
+        LemmaSummary,
+        ResetDatabaseResponse,
+    )
 
 __all__ = [
     "AnalyzeRequest",
@@ -21,3 +26,12 @@ __all__ = [
     "LemmaDetailsResponse",
     "ResetDatabaseResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy like app.api.schemas.v1: nothing is imported until a name is used.
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from app.api.schemas import v1
+
+    return getattr(v1, name)
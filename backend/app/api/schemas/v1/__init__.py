@@ -1,27 +1,61 @@
-from app.api.schemas.v1.analyze import AnalyzedToken, AnalyzeRequest, AnalyzeResponse
-from app.api.schemas.v1.sentencebank import (
-    AddSentenceRequest,
-    AddSentenceResponse,
-    SentenceListResponse,
-    SentenceSummary,
-)
-from app.api.schemas.v1.wordbank import (
-    AddWordRequest,
-    AddWordResponse,
-    GeneratePhraseTranslationRequest,
-    GeneratePhraseTranslationResponse,
-    GenerateReverseTranslationRequest,
-    GenerateReverseTranslationResponse,
-    LemmaDetailsResponse,
-    LemmaListResponse,
-    LemmaSummary,
-    ResetDatabaseResponse,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.api.schemas.v1.analyze import AnalyzedToken, AnalyzeRequest, AnalyzeResponse
+    from app.api.schemas.v1.sentencebank import (
+        AddSentenceRequest,
+        AddSentenceResponse,
+        SentenceListResponse,
+        SentenceSummary,
+    )
+    from app.api.schemas.v1.wordbank import (
+        AddWordBatchRequest,
+        AddWordBatchResponse,
+        AddWordRequest,
+        AddWordResponse,
+        GeneratePhraseTranslationRequest,
+        GeneratePhraseTranslationResponse,
+        GenerateReverseTranslationRequest,
+        GenerateReverseTranslationResponse,
+        LemmaDetailsResponse,
+        LemmaListResponse,
+        LemmaSummary,
+        ResetDatabaseResponse,
+    )
+
+# Re-exports resolve on first access (PEP 562), so importing one schema module does not
+# build the pydantic validators of every other one.
+_EXPORTS = {
+    "AnalyzeRequest": "analyze",
+    "AnalyzeResponse": "analyze",
+    "AnalyzedToken": "analyze",
+    "AddWordBatchRequest": "wordbank",
+    "AddWordBatchResponse": "wordbank",
+    "AddWordRequest": "wordbank",
+    "AddWordResponse": "wordbank",
+    "GeneratePhraseTranslationRequest": "wordbank",
+    "GeneratePhraseTranslationResponse": "wordbank",
+    "GenerateReverseTranslationRequest": "wordbank",
+    "GenerateReverseTranslationResponse": "wordbank",
+    "AddSentenceRequest": "sentencebank",
+    "AddSentenceResponse": "sentencebank",
+    "SentenceSummary": "sentencebank",
+    "SentenceListResponse": "sentencebank",
+    "LemmaSummary": "wordbank",
+    "LemmaListResponse": "wordbank",
+    "LemmaDetailsResponse": "wordbank",
+    "ResetDatabaseResponse": "wordbank",
+}
 
 __all__ = [
     "AnalyzeRequest",
     "AnalyzeResponse",
     "AnalyzedToken",
+    "AddWordBatchRequest",
+    "AddWordBatchResponse",
     "AddWordRequest",
     "AddWordResponse",
     "GeneratePhraseTranslationRequest",
@@ -37,3 +71,12 @@ __all__ = [
     "LemmaDetailsResponse",
     "ResetDatabaseResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
@@ -10,6 +10,10 @@ class AddWordRequest(BaseModel):
     lemma_candidate: str | None = None
 
 
+class AddWordBatchRequest(BaseModel):
+    items: list[AddWordRequest] = Field(..., min_length=1, max_length=500)
+
+
 class GenerateTranslationRequest(BaseModel):
     surface_token: str = Field(..., min_length=1)
     lemma_candidate: str | None = None
@@ -50,6 +54,10 @@ class AddWordResponse(BaseModel):
     message: str
 
 
+class AddWordBatchResponse(BaseModel):
+    items: list[AddWordResponse]
+
+
 class LemmaSummary(BaseModel):
     lemma: str
     english_translation: str | None
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass
+class LRUCache(Generic[K, V]):
+    max_size: int = 4096
+
+    def __post_init__(self) -> None:
+        self._store: OrderedDict[K, V] = OrderedDict()
+        # Shared across request worker threads.
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            try:
+                # Relinks the existing node; no second hash or reinsertion.
+                self._store.move_to_end(key)
+            except KeyError:
+                return None
+            return self._store[key]
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            if key in self._store:
+                self._store.move_to_end(key)
+            self._store[key] = value
+            while len(self._store) > self.max_size:
+                self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
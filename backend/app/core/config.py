@@ -21,6 +21,7 @@ class Settings:
     cors_origins: tuple[str, ...] = DEFAULT_CORS_ORIGINS
     typo_enabled: bool = True
     typo_dictionary_path: Path | None = None
+    typo_index_cache_path: Path | None = None
     translation_enabled: bool = True
     translation_deepl_api_key: str | None = None
     translation_deepl_api_url: str | None = None
@@ -46,6 +47,9 @@ def load_settings() -> Settings:
         typo_dictionary_path=Path(os.getenv("DANOTE_TYPO_DICTIONARY_PATH"))
         if os.getenv("DANOTE_TYPO_DICTIONARY_PATH")
         else None,
+        typo_index_cache_path=Path(
+            os.getenv("DANOTE_TYPO_INDEX_CACHE_PATH", DATA_DIR / "typo_symspell_index.pkl.gz")
+        ),
         translation_enabled=os.getenv("DANOTE_TRANSLATION_ENABLED", "1").lower()
         not in {"0", "false", "no"},
         translation_deepl_api_key=os.getenv("DANOTE_DEEPL_API_KEY"),
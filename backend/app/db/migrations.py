@@ -4,12 +4,29 @@ import sqlite3
 from pathlib import Path
 
 MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+# Migrations ship with the code, so the directory is listed once per process.
+_MIGRATION_FILES = tuple(sorted(MIGRATIONS_DIR.glob("*.sql")))
+
+
+# Per-connection settings; journal_mode is persisted in the file by apply_migrations.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+# Statement-cache slots per connection; repository SQL lives in module constants, so
+# each statement is compiled once per connection and re-bound on later calls.
+CACHED_STATEMENTS = 256
 
 
 def get_connection(db_path: Path) -> sqlite3.Connection:
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, cached_statements=CACHED_STATEMENTS)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
@@ -18,6 +35,11 @@ def apply_migrations(db_path: Path) -> list[str]:
 
     applied_now: list[str] = []
     with get_connection(db_path) as conn:
+        # Only takes effect on a fresh file (including one recreated by a reset).
+        conn.execute("PRAGMA page_size = 4096")
+        # WAL is sticky, so switching once here covers every later connection; page_size
+        # has to be set first because it is frozen once the file is in WAL mode.
+        conn.execute("PRAGMA journal_mode = WAL")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS schema_migrations (
@@ -32,16 +54,23 @@ def apply_migrations(db_path: Path) -> list[str]:
             for row in conn.execute("SELECT version FROM schema_migrations").fetchall()
         }
 
-        for migration_file in sorted(MIGRATIONS_DIR.glob("*.sql")):
-            version = migration_file.name
-            if version in applied_versions:
-                continue
-
-            conn.executescript(migration_file.read_text(encoding="utf-8"))
-            conn.execute(
+        pending = [
+            migration_file
+            for migration_file in _MIGRATION_FILES
+            if migration_file.name not in applied_versions
+        ]
+        if pending:
+            # One transaction for the whole batch: a single commit on a cold start, and a
+            # failing migration rolls back every pending one along with its version rows.
+            conn.executescript(
+                "BEGIN;\n"
+                + ";\n".join(migration_file.read_text(encoding="utf-8") for migration_file in pending)
+                + ";\n"
+            )
+            applied_now = [migration_file.name for migration_file in pending]
+            conn.executemany(
                 "INSERT INTO schema_migrations (version) VALUES (?)",
-                (version,),
+                [(version,) for version in applied_now],
             )
-            applied_now.append(version)
 
     return applied_now
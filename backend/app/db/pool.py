@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from app.db.migrations import CACHED_STATEMENTS
+
+# Applied once per pooled connection; WAL lets readers proceed while a writer commits.
+# mmap_size lets reads come straight from the OS page cache instead of pread() copies;
+# the wordbank file is far smaller than the 256 MiB window, so it is mapped whole.
+_MMAP_SIZE_PRAGMA = "PRAGMA mmap_size = 268435456"
+_CACHE_SIZE_PRAGMA = "PRAGMA cache_size = -131072"
+_POOLED_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",
+    _MMAP_SIZE_PRAGMA,
+    _CACHE_SIZE_PRAGMA,
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA foreign_keys = ON",
+)
+_READ_ONLY_CONNECTION_PRAGMAS = (
+    "PRAGMA query_only = ON",
+    _MMAP_SIZE_PRAGMA,
+    _CACHE_SIZE_PRAGMA,
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+def open_pooled_connection(db_path: Path) -> sqlite3.Connection:
+    # check_same_thread=False only so close() can close every connection at shutdown, once
+    # no worker threads remain; otherwise a connection is used only by the thread that opened it.
+    # Autocommit: single statements commit on their own, and multi-statement writers open
+    # their transaction with BEGIN IMMEDIATE instead of sqlite3's implicit DEFERRED BEGIN.
+    conn = sqlite3.connect(
+        db_path,
+        isolation_level=None,
+        check_same_thread=False,
+        cached_statements=CACHED_STATEMENTS,
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in _POOLED_CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def open_read_only_connection(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        f"{db_path.resolve().as_uri()}?mode=ro",
+        uri=True,
+        check_same_thread=False,
+        cached_statements=CACHED_STATEMENTS,
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in _READ_ONLY_CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+class ConnectionPool:
+    """Long-lived per-thread SQLite connections for a single database file."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        self._generation = 0
+
+    def connection(self) -> sqlite3.Connection:
+        return self._thread_connection("conn", open_pooled_connection)
+
+    def read_connection(self) -> sqlite3.Connection:
+        """Read-only connection; under WAL, readers never wait on the writer."""
+        return self._thread_connection("read_conn", open_read_only_connection)
+
+    def _thread_connection(
+        self,
+        slot: str,
+        opener: Callable[[Path], sqlite3.Connection],
+    ) -> sqlite3.Connection:
+        conn, generation = getattr(self._local, slot, (None, -1))
+        if conn is not None and generation == self._generation:
+            return conn
+        if conn is not None:
+            # Retired by close_all(); only this thread uses it, so it can be closed safely.
+            with self._lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+            conn.close()
+
+        conn = opener(self.db_path)
+        with self._lock:
+            self._connections.append(conn)
+            setattr(self._local, slot, (conn, self._generation))
+        return conn
+
+    def close_all(self) -> None:
+        """Retire every pooled connection.
+
+        Connections may be mid-query on other threads, so they are not closed here; each
+        owning thread closes its stale connection and opens a new one on its next checkout.
+        """
+        with self._lock:
+            self._generation += 1
+
+    def close(self) -> None:
+        """Close every connection; only for shutdown, once no other thread uses the pool."""
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+            self._generation += 1
+        for conn in connections:
+            conn.close()
@@ -17,6 +17,8 @@ def seed_starter_data(db_path: Path) -> dict[str, int]:
     inserted_surface_forms = 0
 
     with get_connection(db_path) as conn:
+        # One explicit write transaction for the whole seed, committed once on exit.
+        conn.execute("BEGIN IMMEDIATE")
         for lemma, payload in STARTER_LEXEMES.items():
             source = str(payload["source"])
             forms = list(payload["forms"])
@@ -50,15 +52,15 @@ def seed_starter_data(db_path: Path) -> dict[str, int]:
                 (lexeme_id, *forms),
             )
 
-            for form in forms:
-                cursor = conn.execute(
-                    """
-                    INSERT OR IGNORE INTO surface_forms (lexeme_id, form, source)
-                    VALUES (?, ?, ?)
-                    """,
-                    (lexeme_id, form, "seed"),
-                )
-                inserted_surface_forms += 1 if cursor.rowcount == 1 else 0
+            # executemany's rowcount is the total across rows, i.e. the forms actually inserted.
+            cursor = conn.executemany(
+                """
+                INSERT OR IGNORE INTO surface_forms (lexeme_id, form, source)
+                VALUES (?, ?, 'seed')
+                """,
+                [(lexeme_id, form) for form in forms],
+            )
+            inserted_surface_forms += cursor.rowcount
 
     return {
         "inserted_lexemes": inserted_lexemes,
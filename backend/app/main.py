@@ -1,18 +1,30 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Callable
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.api.dependencies import refresh_ready_mask
 from app.api.router import api_router
 from app.core.config import Settings, load_settings
 from app.db.migrations import apply_migrations
+from app.db.pool import ConnectionPool
 from app.core.logging import configure_logging
 from app.nlp.adapter import NLPAdapter
+from app.nlp.batching import BatchingNLPAdapter
+from app.services.token_classifier import (
+    LemmaAwareClassifier,
+    WordbankSnapshotCache,
+    new_classification_cache,
+)
 from app.services.translation import DeepLTranslationService
 from app.services.typo.typo_engine import TypoEngine
 
@@ -40,6 +52,7 @@ def create_app(
         try:
             app_settings.db_path.parent.mkdir(parents=True, exist_ok=True)
             applied = apply_migrations(app_settings.db_path)
+            app.state.db_pool = ConnectionPool(app_settings.db_path)
             app.state.db_ready = True
             app.state.db_error = None
         except Exception as exc:
@@ -53,6 +66,9 @@ def create_app(
         adapter: NLPAdapter | None = None
         try:
             adapter = nlp_adapter_factory(app_settings)
+            if callable(getattr(adapter, "tokenize_many", None)):
+                # Coalesce concurrent analyze requests into batched pipeline calls.
+                adapter = BatchingNLPAdapter(adapter)
             app.state.nlp_ready = True
             app.state.nlp_error = None
         except Exception as exc:
@@ -82,11 +98,26 @@ def create_app(
                 typo_engine = TypoEngine(
                     db_path=app_settings.db_path,
                     dictionary_paths=dictionary_paths,
+                    index_cache_path=app_settings.typo_index_cache_path,
                 )
             except Exception:
                 logger.exception("backend_typo_engine_startup_failed")
                 typo_engine = None
         app.state.typo_engine = typo_engine
+        # Built once; wordbank writes invalidate its results via app.state.classification_cache
+        # and app.state.wordbank_snapshot.
+        app.state.classifier = (
+            LemmaAwareClassifier(
+                app_settings.db_path,
+                nlp_adapter=adapter,
+                typo_engine=typo_engine,
+                cache=app.state.classification_cache,
+                connection_pool=app.state.db_pool,
+                wordbank_snapshot=app.state.wordbank_snapshot,
+            )
+            if adapter is not None
+            else None
+        )
         if app_settings.translation_enabled:
             if app_settings.translation_deepl_api_key:
                 try:
@@ -94,6 +125,12 @@ def create_app(
                         api_key=app_settings.translation_deepl_api_key,
                         base_url=app_settings.translation_deepl_api_url,
                     )
+                    # Connect in the background so the first translation skips the handshake.
+                    threading.Thread(
+                        target=app.state.translation_service.warm_up,
+                        name="danote-translation-warmup",
+                        daemon=True,
+                    ).start()
                 except Exception:
                     logger.exception("backend_translation_startup_failed")
                     app.state.translation_service = None
@@ -103,6 +140,13 @@ def create_app(
         else:
             app.state.translation_service = None
 
+        # Dedicated pool so analyze throughput is not capped by the default sync threadpool.
+        app.state.analysis_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="danote-analyze",
+        )
+
+        refresh_ready_mask(app.state)
         startup_status = "ok" if app.state.db_ready and app.state.nlp_ready else "degraded"
         logger.info(
             "backend_startup",
@@ -122,20 +166,39 @@ def create_app(
             },
         )
         yield
+        app.state.analysis_executor.shutdown(wait=True)
+        app.state.analysis_executor = None
+        if app.state.db_pool is not None:
+            app.state.db_pool.close()
+            app.state.db_pool = None
         translation_service = getattr(app.state, "translation_service", None)
         close = getattr(translation_service, "close", None)
         if callable(close):
             close()
 
-    app = FastAPI(title="Danote Backend", version="0.1.0", lifespan=lifespan)
+    app = FastAPI(
+        title="Danote Backend",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
     app.state.settings = app_settings
     app.state.db_ready = False
     app.state.db_error = None
+    app.state.db_pool = None
     app.state.nlp_ready = False
     app.state.nlp_error = None
+    app.state.ready_mask = 0
     app.state.nlp_adapter = None
     app.state.typo_engine = None
+    app.state.classifier = None
     app.state.translation_service = None
+    app.state.analysis_executor = None
+    app.state.classification_cache = new_classification_cache()
+    # In-memory copy of the wordbank's forms and lemmas; wordbank writes invalidate it.
+    app.state.wordbank_snapshot = WordbankSnapshotCache()
+    # Serializes wordbank write transactions across request threads.
+    app.state.write_lock = threading.Lock()
     app.add_middleware(
         CORSMiddleware,
         allow_origins=list(app_settings.cors_origins),
@@ -1,9 +1,30 @@
-from app.nlp.adapter import NLPAdapter, NLPToken
-from app.nlp.danish import DaCyLemmyNLPAdapter, load_danish_nlp_adapter
-
-__all__ = [
-    "NLPAdapter",
-    "NLPToken",
-    "DaCyLemmyNLPAdapter",
-    "load_danish_nlp_adapter",
-]
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.nlp.adapter import NLPAdapter, NLPToken
+    from app.nlp.batching import BatchingNLPAdapter
+    from app.nlp.danish import DaCyLemmyNLPAdapter, load_danish_nlp_adapter
+
+# Resolved on first access (PEP 562): importing app.nlp.adapter alone should not pull in
+# the DaCy adapter module and its version-checking dependencies.
+_EXPORTS = {
+    "NLPAdapter": "adapter",
+    "NLPToken": "adapter",
+    "BatchingNLPAdapter": "batching",
+    "DaCyLemmyNLPAdapter": "danish",
+    "load_danish_nlp_adapter": "danish",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
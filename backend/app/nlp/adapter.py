@@ -17,7 +17,11 @@ class NLPAdapter(Protocol):
     def tokenize(self, text: str) -> list[NLPToken]:
         ...
 
+    def tokenize_many(self, texts: list[str]) -> list[list[NLPToken]]:
+        ...
+
     def lemma_candidates_for_token(self, token: str) -> list[str]:
+        """Best-first candidates, already lowercased and whitespace-collapsed."""
         ...
 
     def lemma_for_token(self, token: str) -> str | None:
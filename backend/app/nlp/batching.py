@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+
+from app.nlp.adapter import NLPAdapter, NLPToken
+
+
+@dataclass(eq=False)
+class _PendingTokenize:
+    text: str
+    done: threading.Event = field(default_factory=threading.Event)
+    tokens: list[NLPToken] | None = None
+    error: BaseException | None = None
+    # Set (with done) when the previous leader hands leadership to this waiter.
+    promoted: bool = False
+
+
+class BatchingNLPAdapter:
+    """Coalesces concurrent tokenize() calls into batched tokenize_many() calls.
+
+    The first caller to find no active batch becomes the leader: while other callers
+    are queued it waits briefly for more to enqueue their texts, then runs the
+    wrapped adapter's batched entry point for one batch (its own text included) and
+    hands leadership to the next queued caller.
+    """
+
+    def __init__(
+        self,
+        adapter: NLPAdapter,
+        *,
+        max_batch_size: int = 32,
+        max_wait_seconds: float = 0.005,
+    ):
+        self._adapter = adapter
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._lock = threading.Lock()
+        self._batch_full = threading.Condition(self._lock)
+        self._queue: list[_PendingTokenize] = []
+        self._leader_active = False
+
+    def tokenize(self, text: str) -> list[NLPToken]:
+        pending = _PendingTokenize(text)
+        with self._lock:
+            self._queue.append(pending)
+            is_leader = not self._leader_active
+            self._leader_active = True
+            if len(self._queue) >= self._max_batch_size:
+                self._batch_full.notify()
+
+        if is_leader:
+            self._lead(pending)
+        pending.done.wait()
+        while pending.promoted:
+            pending.promoted = False
+            pending.done.clear()
+            self._lead(pending)
+            pending.done.wait()
+
+        if pending.error is not None:
+            raise pending.error
+        return pending.tokens or []
+
+    def tokenize_many(self, texts: list[str]) -> list[list[NLPToken]]:
+        return self._adapter.tokenize_many(texts)
+
+    def lemma_candidates_for_token(self, token: str) -> list[str]:
+        return self._adapter.lemma_candidates_for_token(token)
+
+    def lemma_candidates_many(self, tokens: list[str]) -> list[list[str]]:
+        lemma_candidates_many = getattr(self._adapter, "lemma_candidates_many", None)
+        if lemma_candidates_many is None:
+            return [self._adapter.lemma_candidates_for_token(token) for token in tokens]
+        return lemma_candidates_many(tokens)
+
+    def lemma_for_token(self, token: str) -> str | None:
+        return self._adapter.lemma_for_token(token)
+
+    def metadata(self) -> dict[str, str]:
+        return self._adapter.metadata()
+
+    def _lead(self, own: _PendingTokenize) -> None:
+        # A leader is always at the head of the queue, so the batch it takes includes
+        # its own text; it runs that one batch and never serves later arrivals.
+        batch: list[_PendingTokenize] = []
+        try:
+            with self._lock:
+                # Every caller still awaiting a result is queued. A lone caller has nobody
+                # to batch with; otherwise stop waiting as soon as a full batch is queued.
+                if self._max_wait_seconds > 0 and len(self._queue) > 1:
+                    self._batch_full.wait_for(
+                        lambda: len(self._queue) >= self._max_batch_size,
+                        timeout=self._max_wait_seconds,
+                    )
+                batch = self._queue[: self._max_batch_size]
+                del self._queue[: self._max_batch_size]
+            self._run_batch(batch)
+        except BaseException:
+            if own not in batch:
+                # Interrupted before taking the batch: drop own so it is not promoted.
+                with self._lock:
+                    self._queue = [pending for pending in self._queue if pending is not own]
+            raise
+        finally:
+            self._hand_off()
+
+    def _run_batch(self, batch: list[_PendingTokenize]) -> None:
+        try:
+            results = self._adapter.tokenize_many([pending.text for pending in batch])
+            for pending, tokens in zip(batch, results, strict=True):
+                pending.tokens = tokens
+        except Exception as exc:
+            _fail(batch, exc)
+            return
+        except BaseException:
+            _fail(batch, RuntimeError("NLP tokenize batch was aborted"))
+            raise
+        for pending in batch:
+            pending.done.set()
+
+    def _hand_off(self) -> None:
+        with self._lock:
+            if not self._queue:
+                self._leader_active = False
+                return
+            successor = self._queue[0]
+            successor.promoted = True
+        successor.done.set()
+
+
+def _fail(batch: list[_PendingTokenize], error: BaseException) -> None:
+    for pending in batch:
+        pending.error = error
+        pending.done.set()
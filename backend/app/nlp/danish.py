@@ -3,20 +3,38 @@ from __future__ import annotations
 import logging
 from importlib.metadata import version as package_version
 
-from packaging.specifiers import SpecifierSet
-from packaging.version import InvalidVersion, Version
-
+from app.core.cache import LRUCache
 from app.core.config import Settings
 from app.nlp.adapter import NLPAdapter, NLPToken
 from app.nlp.lemma_candidate_ranker import (
     merge_candidates,
     pick_best_candidate,
     rank_candidates,
+    rank_candidates_batched,
 )
 
 
 logger = logging.getLogger(__name__)
 
+_PIPE_BATCH_SIZE = 32
+# Vocabulary is Zipfian, so most single-token lookups are repeats of a few thousand words.
+_LEMMA_CANDIDATE_CACHE_SIZE = 100_000
+# Keyed by (word_class, lowered text); casing variants of a surface share entries.
+_LEMMATIZE_CACHE_SIZE = 100_000
+# Components whose output the adapter never reads: tokens only need POS/tag/morph, and
+# lemmas come from lemmy. Names vary across DaCy releases, so absent ones are skipped.
+_UNUSED_PIPES = frozenset(
+    {
+        "parser",
+        "ner",
+        "lemmatizer",
+        "trainable_lemmatizer",
+        "coref",
+        "span_resolver",
+        "span_cleaner",
+    }
+)
+
 
 class DaCyLemmyNLPAdapter(NLPAdapter):
     def __init__(self, model_name: str):
@@ -26,7 +44,16 @@ class DaCyLemmyNLPAdapter(NLPAdapter):
         import lemmy
 
         self._nlp = dacy.load(model_name)
+        self._disable_unused_pipes()
+        # Snapshot after disabling: these are exactly the components nlp() would run.
+        self._word_components = tuple(component for _, component in getattr(self._nlp, "pipeline", ()))
         self._lemmatizer = lemmy.load("da")
+        self._lemmatize_cache: LRUCache[tuple[str, str], tuple[str, ...]] = LRUCache(
+            max_size=_LEMMATIZE_CACHE_SIZE
+        )
+        self._candidate_cache: LRUCache[str, tuple[str, ...]] = LRUCache(
+            max_size=_LEMMA_CANDIDATE_CACHE_SIZE
+        )
         self._warn_if_spacy_version_incompatible()
 
     def tokenize(self, text: str) -> list[NLPToken]:
@@ -36,6 +63,14 @@ class DaCyLemmyNLPAdapter(NLPAdapter):
         doc = self._nlp(text)
         return [self._to_nlp_token(token) for token in doc if not token.is_space]
 
+    def tokenize_many(self, texts: list[str]) -> list[list[NLPToken]]:
+        results: list[list[NLPToken]] = [[] for _ in texts]
+        indexed = [(index, text) for index, text in enumerate(texts) if text.strip()]
+        docs = self._nlp.pipe((text for _, text in indexed), batch_size=_PIPE_BATCH_SIZE)
+        for (index, _), doc in zip(indexed, docs):
+            results[index] = [self._to_nlp_token(token) for token in doc if not token.is_space]
+        return results
+
     def lemma_for_token(self, token: str) -> str | None:
         candidates = self.lemma_candidates_for_token(token)
         return candidates[0] if candidates else None
@@ -45,12 +80,62 @@ class DaCyLemmyNLPAdapter(NLPAdapter):
         if not cleaned:
             return []
 
-        doc = self._nlp(cleaned)
+        # Keyed on the exact surface: casing can change the tagger's word class.
+        cached = self._candidate_cache.get(cleaned)
+        if cached is None:
+            cached = self._lemma_candidates_uncached(cleaned)
+            self._candidate_cache.set(cleaned, cached)
+        return list(cached)
+
+    def lemma_candidates_many(self, tokens: list[str]) -> list[list[str]]:
+        """Batched lemma_candidates_for_token; cache misses go through one nlp.pipe call."""
+        cleaned_tokens = [token.strip() for token in tokens]
+        misses = list(
+            dict.fromkeys(
+                cleaned
+                for cleaned in cleaned_tokens
+                if cleaned and self._candidate_cache.get(cleaned) is None
+            )
+        )
+        if misses:
+            docs = self._nlp.pipe(misses, batch_size=_PIPE_BATCH_SIZE)
+            ranking_inputs = [self._ranking_inputs_from_doc(doc) for doc in docs]
+            ranked_lists = rank_candidates_batched(*zip(*ranking_inputs)) if ranking_inputs else []
+            for cleaned, ranked in zip(misses, ranked_lists):
+                self._candidate_cache.set(cleaned, tuple(ranked))
+        return [self.lemma_candidates_for_token(cleaned) for cleaned in cleaned_tokens]
+
+    def _lemma_candidates_uncached(self, cleaned: str) -> tuple[str, ...]:
+        return self._lemma_candidates_from_doc(self._word_doc(cleaned))
+
+    def _word_doc(self, cleaned: str):
+        """Run a single word through the enabled components without Language.__call__.
+
+        Skips the per-call component_cfg merging and error-handler setup, which
+        dominate for one-token inputs.
+        """
+        make_doc = getattr(self._nlp, "make_doc", None)
+        if make_doc is None:
+            return self._nlp(cleaned)
+        doc = make_doc(cleaned)
+        for component in self._word_components:
+            doc = component(doc)
+        return doc
+
+    def _lemma_candidates_from_doc(self, doc) -> tuple[str, ...]:
         for spacy_token in doc:
             if spacy_token.is_space or spacy_token.is_punct:
                 continue
-            return self._lemma_candidates_from_token(spacy_token)
-        return []
+            return tuple(self._lemma_candidates_from_token(spacy_token))
+        return ()
+
+    def _ranking_inputs_from_doc(self, doc) -> tuple[str, str | None, list[str], list[str]]:
+        """rank_candidates arguments for the doc's first word; empty candidates if none."""
+        for spacy_token in doc:
+            if spacy_token.is_space or spacy_token.is_punct:
+                continue
+            return self._ranking_inputs_from_token(spacy_token)
+        return ("", None, [], [])
 
     def metadata(self) -> dict[str, str]:
         return {
@@ -74,19 +159,41 @@ class DaCyLemmyNLPAdapter(NLPAdapter):
         )
 
     def _lemma_candidates_from_token(self, token) -> list[str]:
-        word_class = token.pos_ or token.tag_ or "X"
-        normalized_text = token.text.lower()
-        primary_candidates = self._lemmatizer.lemmatize(word_class, normalized_text)
-        fallback_candidates = self._lemmatizer.lemmatize("", normalized_text)
-        merged = merge_candidates(primary_candidates, fallback_candidates)
+        surface, word_class, merged, primary_candidates = self._ranking_inputs_from_token(token)
         return rank_candidates(
-            surface=token.text,
+            surface=surface,
             tag=word_class,
             candidates=merged,
             primary_tag_candidates=primary_candidates,
         )
 
+    def _ranking_inputs_from_token(self, token) -> tuple[str, str | None, list[str], list[str]]:
+        word_class = token.pos_ or token.tag_ or "X"
+        normalized_text = token.text.lower()
+        primary_candidates = self._lemmatize_cached(word_class, normalized_text)
+        fallback_candidates = self._lemmatize_cached("", normalized_text)
+        merged = merge_candidates(primary_candidates, fallback_candidates)
+        return token.text, word_class, merged, list(primary_candidates)
+
+    def _lemmatize_cached(self, word_class: str, normalized_text: str) -> tuple[str, ...]:
+        key = (word_class, normalized_text)
+        cached = self._lemmatize_cache.get(key)
+        if cached is None:
+            cached = tuple(self._lemmatizer.lemmatize(word_class, normalized_text))
+            self._lemmatize_cache.set(key, cached)
+        return cached
+
+    def _disable_unused_pipes(self) -> None:
+        pipe_names = getattr(self._nlp, "pipe_names", ())
+        unused = [name for name in pipe_names if name in _UNUSED_PIPES]
+        if unused:
+            self._nlp.select_pipes(disable=unused)
+            logger.info("nlp_pipes_disabled", extra={"model": self.model_name, "pipes": unused})
+
     def _warn_if_spacy_version_incompatible(self) -> None:
+        from packaging.specifiers import SpecifierSet
+        from packaging.version import InvalidVersion, Version
+
         runtime_version_str = package_version("spacy")
         model_spec = str(self._nlp.meta.get("spacy_version") or "").strip()
         if not model_spec:
@@ -120,8 +227,9 @@ class DaCyLemmyNLPAdapter(NLPAdapter):
 
     def _lemma_from_token(self, token) -> str | None:
         word_class = token.pos_ or token.tag_ or "X"
-        primary_candidates = self._lemmatizer.lemmatize(word_class, token.text.lower())
-        fallback_candidates = self._lemmatizer.lemmatize("", token.text.lower())
+        normalized_text = token.text.lower()
+        primary_candidates = self._lemmatize_cached(word_class, normalized_text)
+        fallback_candidates = self._lemmatize_cached("", normalized_text)
         return pick_best_candidate(
             surface=token.text,
             tag=word_class,
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from itertools import chain
 
 
 _INFLECTION_SUFFIXES = (
@@ -37,14 +39,23 @@ _PREFIX_REDUCTION_BONUS = -0.12
 
 
 def normalize_candidate(text: str) -> str:
-    return " ".join(text.strip().split()).lower()
+    # Fast path: lowercase, single-word text is already normalized. isprintable()
+    # rejects every whitespace character except the ASCII space checked explicitly.
+    if text.islower() and text.isprintable() and " " not in text:
+        return text
+    return _normalize_slow(text)
+
+
+@lru_cache(maxsize=65536)
+def _normalize_slow(text: str) -> str:
+    return " ".join(text.split()).lower()
 
 
 def merge_candidates(primary_tag_candidates: Iterable[str], fallback_candidates: Iterable[str]) -> list[str]:
     merged: list[str] = []
     seen: set[str] = set()
 
-    for raw in list(primary_tag_candidates) + list(fallback_candidates):
+    for raw in chain(primary_tag_candidates, fallback_candidates):
         candidate = normalize_candidate(raw)
         if not candidate or candidate in seen:
             continue
@@ -54,12 +65,13 @@ def merge_candidates(primary_tag_candidates: Iterable[str], fallback_candidates:
     return merged
 
 
-def rank_candidates(
+def _score_candidates(
     surface: str,
     tag: str | None,
     candidates: Iterable[str],
-    primary_tag_candidates: Iterable[str] | None = None,
-) -> list[str]:
+    primary_tag_candidates: Iterable[str] | None,
+) -> tuple[str, str, list[str], list[float]]:
+    """Return (normalized surface, normalized tag, normalized candidates, scores); lower scores rank first."""
     normalized_surface = normalize_candidate(surface)
     normalized_tag = (tag or "").upper()
     normalized_candidates = []
@@ -68,46 +80,114 @@ def rank_candidates(
         if candidate:
             normalized_candidates.append(candidate)
     if not normalized_candidates:
-        return []
+        return normalized_surface, normalized_tag, normalized_candidates, []
+
+    primary_set = set()
+    for raw_candidate in primary_tag_candidates or ():
+        candidate = normalize_candidate(raw_candidate)
+        if candidate:
+            primary_set.add(candidate)
 
-    primary_set = {
-        normalize_candidate(candidate)
-        for candidate in (primary_tag_candidates or [])
-        if normalize_candidate(candidate)
-    }
+    # Per-call invariants; the additions below keep their original order so float
+    # sums (and therefore tie-breaks) are unchanged.
+    surface_len = len(normalized_surface)
+    low_confidence_tag = normalized_tag in _LOW_CONFIDENCE_TAGS
+    verb_like_tag = normalized_tag in _VERB_LIKE_TAGS
 
-    scored: list[tuple[float, int, str]] = []
+    scores: list[float] = []
     for index, candidate in enumerate(normalized_candidates):
+        candidate_len = len(candidate)
         score = 0.0
-        if normalized_tag not in _LOW_CONFIDENCE_TAGS:
+        if not low_confidence_tag:
             score += _SOURCE_PRIMARY_BONUS if candidate in primary_set else _SOURCE_FALLBACK_PENALTY
         if candidate == normalized_surface:
             score += _SURFACE_MATCH_BONUS
-        score += _LENGTH_WEIGHT * len(candidate)
-        score += _LENGTH_DELTA_WEIGHT * abs(len(normalized_surface) - len(candidate))
+        score += _LENGTH_WEIGHT * candidate_len
+        score += _LENGTH_DELTA_WEIGHT * abs(surface_len - candidate_len)
         if candidate.endswith(_INFLECTION_SUFFIXES):
             score += _INFLECTION_SUFFIX_PENALTY
-        if len(candidate) <= 2:
+        if candidate_len <= 2:
             score += _VERY_SHORT_BONUS
-        if normalized_tag in _LOW_CONFIDENCE_TAGS:
+        if low_confidence_tag:
             score += _LOW_CONFIDENCE_TAG_PENALTY
-        if normalized_tag in _VERB_LIKE_TAGS:
+        if verb_like_tag:
             score += _VERB_TAG_BONUS
-        if len(normalized_surface) > len(candidate) and normalized_surface.startswith(candidate):
+        if surface_len > candidate_len and normalized_surface.startswith(candidate):
             score += _PREFIX_REDUCTION_BONUS
         score += _INDEX_WEIGHT * index
-        scored.append((score, index, candidate))
+        scores.append(score)
 
-    scored.sort(key=lambda item: (item[0], item[1], item[2]))
-    ranked = [candidate for _, _, candidate in scored]
+    return normalized_surface, normalized_tag, normalized_candidates, scores
 
+
+def _keeps_short_noun_surface(normalized_surface: str, normalized_tag: str) -> bool:
     # Very short Danish nouns can over-collapse (e.g. "hus" -> "hu").
-    if normalized_tag == "NOUN" and len(normalized_surface) <= 3 and normalized_surface in ranked:
+    return normalized_tag == "NOUN" and len(normalized_surface) <= 3
+
+
+def rank_candidates(
+    surface: str,
+    tag: str | None,
+    candidates: Iterable[str],
+    primary_tag_candidates: Iterable[str] | None = None,
+) -> list[str]:
+    normalized_surface, normalized_tag, normalized_candidates, scores = _score_candidates(
+        surface, tag, candidates, primary_tag_candidates
+    )
+
+    # Indices are unique, so a stable sort on score alone matches the old
+    # (score, index, candidate) ordering without building tuples.
+    ranked = [normalized_candidates[index] for index in sorted(range(len(scores)), key=scores.__getitem__)]
+
+    if _keeps_short_noun_surface(normalized_surface, normalized_tag) and normalized_surface in ranked:
         return [normalized_surface] + [candidate for candidate in ranked if candidate != normalized_surface]
 
     return ranked
 
 
+def _top_candidate(
+    surface: str,
+    tag: str | None,
+    candidates: Iterable[str],
+    primary_tag_candidates: Iterable[str] | None,
+) -> str | None:
+    """rank_candidates(...)[0] without sorting: one O(M) argmin pass."""
+    normalized_surface, normalized_tag, normalized_candidates, scores = _score_candidates(
+        surface, tag, candidates, primary_tag_candidates
+    )
+    if not normalized_candidates:
+        return None
+    if _keeps_short_noun_surface(normalized_surface, normalized_tag) and normalized_surface in normalized_candidates:
+        return normalized_surface
+    # min() returns the first minimum, matching the stable sort's lowest-index tie-break.
+    return normalized_candidates[min(range(len(scores)), key=scores.__getitem__)]
+
+
+def rank_candidates_batched(
+    surfaces: Sequence[str],
+    tags: Sequence[str | None],
+    candidate_lists: Sequence[Iterable[str]],
+    primary_lists: Sequence[Iterable[str] | None],
+) -> list[list[str]]:
+    """Rank several tokens' candidates at once, scoring each distinct input only once.
+
+    Ranking depends only on the normalized surface, the upper-cased tag and the
+    candidate lists, so casing variants and repeats within a batch share one result.
+    """
+    ranked_by_key: dict[tuple, list[str]] = {}
+    results: list[list[str]] = []
+    for surface, tag, candidates, primary in zip(surfaces, tags, candidate_lists, primary_lists):
+        candidates = tuple(candidates)
+        primary = tuple(primary or ())
+        key = (normalize_candidate(surface), (tag or "").upper(), candidates, primary)
+        ranked = ranked_by_key.get(key)
+        if ranked is None:
+            ranked = rank_candidates(surface, tag, candidates, primary)
+            ranked_by_key[key] = ranked
+        results.append(list(ranked))
+    return results
+
+
 def pick_best_candidate(
     surface: str,
     tag: str | None,
@@ -115,13 +195,12 @@ def pick_best_candidate(
     fallback_candidates: Iterable[str],
 ) -> str | None:
     merged = merge_candidates(primary_tag_candidates, fallback_candidates)
-    ranked = rank_candidates(
+    return _top_candidate(
         surface=surface,
         tag=tag,
         candidates=merged,
         primary_tag_candidates=primary_tag_candidates,
     )
-    return ranked[0] if ranked else None
 
 
 def pick_best_candidate_in_lexicon(
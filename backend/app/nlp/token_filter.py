@@ -1,8 +1,21 @@
 from __future__ import annotations
 
+import re
+from collections.abc import Iterable
+
+from app.nlp.adapter import NLPToken
+
+# Any letter or digit (Unicode-aware); equivalent to str.isalnum() per character.
+_WORDLIKE_CHAR_RE = re.compile(r"[^\W_]")
+
 
 def is_wordlike_token(text: str) -> bool:
-    cleaned = text.strip()
-    if not cleaned:
-        return False
-    return any(character.isalnum() for character in cleaned)
+    return _WORDLIKE_CHAR_RE.search(text) is not None
+
+
+def filter_wordlike_tokens(tokens: Iterable[NLPToken]) -> list[NLPToken]:
+    return [
+        token
+        for token in tokens
+        if not token.is_punctuation and _WORDLIKE_CHAR_RE.search(token.text) is not None
+    ]
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import sqlite3
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
+from app.core.cache import LRUCache
 from app.db.migrations import get_connection
+from app.db.pool import ConnectionPool
 from app.nlp.adapter import NLPAdapter
 from app.nlp.lemma_candidate_ranker import (
     normalize_candidate,
     pick_best_candidate_in_lexicon,
 )
+from app.nlp.token_filter import is_wordlike_token
 from app.services.typo.typo_engine import TypoEngine, TypoSuggestion
 
 
@@ -31,13 +37,91 @@ class TokenClassification:
     reason_tags: tuple[str, ...] = ()
 
 
+# Bound parameters per IN (...) list, well under SQLite's variable limit.
+_IN_QUERY_CHUNK = 500
+
+
+@dataclass(frozen=True)
+class _BatchLookups:
+    """Wordbank facts for a whole classify_many call, fetched with a few IN (...) queries."""
+
+    exact_forms: dict[str, tuple[str, str]]
+    exact_lemmas: frozenset[str]
+    candidates: dict[str, list[str]]
+    candidate_lexemes: frozenset[str]
+
+
+# Keyed by (surface token, sentence_start): typo gating depends on casing and position.
+ClassificationCache = LRUCache[tuple[str, bool], TokenClassification]
+
+
+def new_classification_cache(max_size: int = 50_000) -> ClassificationCache:
+    return LRUCache[tuple[str, bool], TokenClassification](max_size=max_size)
+
+
+@dataclass(frozen=True)
+class WordbankSnapshot:
+    """Every surface form and lemma in the wordbank, for in-memory membership checks."""
+
+    forms: dict[str, tuple[str, str]]
+    lemmas: frozenset[str]
+
+
+class WordbankSnapshotCache:
+    """Lazily loaded WordbankSnapshot; wordbank writes must call invalidate()."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshot: WordbankSnapshot | None = None
+        self._generation = 0
+
+    def get(self, conn) -> WordbankSnapshot:
+        with self._lock:
+            snapshot, generation = self._snapshot, self._generation
+        if snapshot is not None:
+            return snapshot
+        snapshot = _load_wordbank_snapshot(conn)
+        with self._lock:
+            # A write invalidated while we were loading: use this snapshot once, don't keep it.
+            if self._generation == generation:
+                self._snapshot = snapshot
+        return snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._generation += 1
+
+
+def _load_wordbank_snapshot(conn) -> WordbankSnapshot:
+    forms: dict[str, tuple[str, str]] = {}
+    # Lowest id first, matching which row the per-token form lookups return.
+    for form, lemma in conn.execute(
+        """
+        SELECT sf.form, l.lemma
+        FROM surface_forms sf
+        JOIN lexemes l ON l.id = sf.lexeme_id
+        ORDER BY sf.form, sf.id
+        """
+    ):
+        forms.setdefault(form, (lemma, form))
+    lemmas = frozenset(row[0] for row in conn.execute("SELECT lemma FROM lexemes"))
+    return WordbankSnapshot(forms=forms, lemmas=lemmas)
+
+
 class _NullNLPAdapter:
     def tokenize(self, text: str):
         return []
 
+    def tokenize_many(self, texts: list[str]):
+        return [[] for _ in texts]
+
     def lemma_candidates_for_token(self, token: str) -> list[str]:
         return []
 
+    def lemma_candidates_many(self, tokens: list[str]) -> list[list[str]]:
+        return [[] for _ in tokens]
+
     def lemma_for_token(self, token: str) -> str | None:
         return None
 
@@ -45,9 +129,11 @@ class _NullNLPAdapter:
         return {"adapter": "null"}
 
 
+@lru_cache(maxsize=131_072)
 def normalize_token(token: str) -> str:
     # Collapse internal whitespace and normalize case for stable exact lookup.
-    return " ".join(token.strip().split()).lower()
+    # str.split() with no separator already drops leading/trailing whitespace.
+    return " ".join(token.split()).lower()
 
 
 class LemmaAwareClassifier:
@@ -56,29 +142,144 @@ class LemmaAwareClassifier:
         db_path: Path,
         nlp_adapter: NLPAdapter | None = None,
         typo_engine: TypoEngine | None = None,
+        cache: ClassificationCache | None = None,
+        connection_pool: ConnectionPool | None = None,
+        wordbank_snapshot: WordbankSnapshotCache | None = None,
     ):
         self.db_path = db_path
         self.nlp_adapter = nlp_adapter or _NullNLPAdapter()
         self.typo_engine = typo_engine
+        self.cache = cache
+        self.connection_pool = connection_pool
+        self.wordbank_snapshot = wordbank_snapshot
 
     def classify(self, token: str) -> TokenClassification:
-        with get_connection(self.db_path) as conn:
-            return self._classify_with_connection(token, conn)
+        # Shares classify_many's cache so repeat tokens return the same interned result.
+        key = (token, False)
+        self._drop_cache_if_ignores_changed()
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached is not None:
+            return cached
+        with self._connect() as conn:
+            lookups = None
+            if self.wordbank_snapshot is not None:
+                lookups = self._batch_lookups([normalize_token(token)], conn)
+            result = self._classify_with_connection(token, conn, lookups=lookups)
+        if self.cache is not None:
+            self.cache.set(key, result)
+        return result
 
     def classify_many(self, tokens: list[str]) -> list[TokenClassification]:
         if not tokens:
             return []
-        with get_connection(self.db_path) as conn:
-            results: list[TokenClassification] = []
+        self._drop_cache_if_ignores_changed()
+        with self._connect() as conn:
+            # Notes repeat words heavily; classify each (surface, position) pair once.
+            resolved: dict[tuple[str, bool], TokenClassification] = {}
+            pending: dict[tuple[str, bool], None] = {}
             for index, token in enumerate(tokens):
-                sentence_start = index == 0
-                results.append(self._classify_with_connection(token, conn, sentence_start=sentence_start))
-            return results
+                key = (token, index == 0)
+                if key in resolved or key in pending:
+                    continue
+                cached = self.cache.get(key) if self.cache is not None else None
+                if cached is not None:
+                    resolved[key] = cached
+                else:
+                    pending[key] = None
+
+            if pending:
+                # One read transaction: the batch queries share a snapshot and a single
+                # shared-lock acquisition; the connection context ends it on exit.
+                conn.execute("BEGIN")
+                lookups = self._batch_lookups([normalize_token(token) for token, _ in pending], conn)
+                for key in pending:
+                    token, sentence_start = key
+                    result = self._classify_with_connection(
+                        token,
+                        conn,
+                        sentence_start=sentence_start,
+                        lookups=lookups,
+                    )
+                    if self.cache is not None:
+                        self.cache.set(key, result)
+                    resolved[key] = result
+
+            return [resolved[(token, index == 0)] for index, token in enumerate(tokens)]
+
+    def _drop_cache_if_ignores_changed(self) -> None:
+        # Cached results embed typo-engine ignore decisions, which lapse with expires_at.
+        refresh = getattr(self.typo_engine, "refresh_ignored_tokens", None)
+        if self.cache is not None and callable(refresh) and refresh():
+            self.cache.clear()
+
+    def _batch_lookups(self, normalized_tokens: list[str], conn) -> _BatchLookups:
+        unique = list(
+            dict.fromkeys(
+                normalized for normalized in normalized_tokens if normalized and is_wordlike_token(normalized)
+            )
+        )
+
+        # With a warm snapshot every wordbank check below is a dict/set lookup, not SQL.
+        snapshot = self.wordbank_snapshot.get(conn) if self.wordbank_snapshot is not None else None
+        if snapshot is not None:
+            exact_forms = {
+                normalized: snapshot.forms[normalized] for normalized in unique if normalized in snapshot.forms
+            }
+            exact_lemmas = frozenset(normalized for normalized in unique if normalized in snapshot.lemmas)
+        else:
+            exact_forms, exact_lemmas = _select_exact_matches(conn, unique)
+
+        misses = [
+            normalized
+            for normalized in unique
+            if normalized not in exact_forms and normalized not in exact_lemmas
+        ]
+        lemma_candidates_many = getattr(self.nlp_adapter, "lemma_candidates_many", None)
+        if misses and lemma_candidates_many is not None:
+            # One batched pipeline call; its output is reused rather than re-asked per token.
+            candidates = {
+                normalized: self._lemma_candidates_for_token(normalized, raw_candidates)
+                for normalized, raw_candidates in zip(misses, lemma_candidates_many(misses))
+            }
+        else:
+            candidates = {normalized: self._lemma_candidates_for_token(normalized) for normalized in misses}
+
+        if snapshot is not None:
+            candidate_lexemes = snapshot.lemmas
+        else:
+            all_candidates = list(dict.fromkeys(c for values in candidates.values() for c in values))
+            candidate_lexemes = frozenset(
+                row[0]
+                for row in _select_in(
+                    conn,
+                    "SELECT lemma FROM lexemes WHERE lemma IN ({placeholders})",
+                    all_candidates,
+                )
+            )
+        return _BatchLookups(
+            exact_forms=exact_forms,
+            exact_lemmas=exact_lemmas,
+            candidates=candidates,
+            candidate_lexemes=candidate_lexemes,
+        )
 
-    def _classify_with_connection(self, token: str, conn, sentence_start: bool = False) -> TokenClassification:
+    def _connect(self) -> sqlite3.Connection:
+        # Classification only reads, so pooled callers never queue behind a writer.
+        if self.connection_pool is not None:
+            return self.connection_pool.read_connection()
+        return get_connection(self.db_path)
+
+    def _classify_with_connection(
+        self,
+        token: str,
+        conn,
+        sentence_start: bool = False,
+        lookups: _BatchLookups | None = None,
+    ) -> TokenClassification:
         normalized = normalize_token(token)
 
-        if not normalized:
+        # Punctuation, symbols and emoji can never be wordbank entries; skip SQL and NLP.
+        if not normalized or not is_wordlike_token(normalized):
             return TokenClassification(
                 surface_token=token,
                 normalized_token=normalized,
@@ -87,52 +288,64 @@ class LemmaAwareClassifier:
                 match_source="none",
             )
 
-        exact_row = conn.execute(
-            """
-            SELECT l.lemma, sf.form
-            FROM surface_forms sf
-            JOIN lexemes l ON l.id = sf.lexeme_id
-            WHERE sf.form = ?
-            LIMIT 1
-            """,
-            (normalized,),
-        ).fetchone()
-
-        if exact_row is not None:
+        if lookups is not None:
+            exact_match = lookups.exact_forms.get(normalized)
+        else:
+            exact_row = conn.execute(
+                """
+                SELECT l.lemma, sf.form
+                FROM surface_forms sf
+                JOIN lexemes l ON l.id = sf.lexeme_id
+                WHERE sf.form = ?
+                LIMIT 1
+                """,
+                (normalized,),
+            ).fetchone()
+            exact_match = (exact_row["lemma"], exact_row["form"]) if exact_row is not None else None
+
+        if exact_match is not None:
+            exact_lemma, exact_form = exact_match
             return TokenClassification(
                 surface_token=token,
                 normalized_token=normalized,
-                lemma_candidate=exact_row["lemma"],
+                lemma_candidate=exact_lemma,
                 classification="known",
                 match_source="exact",
-                matched_lemma=exact_row["lemma"],
-                matched_surface_form=exact_row["form"],
+                matched_lemma=exact_lemma,
+                matched_surface_form=exact_form,
                 reason_tags=("exact_match",),
             )
 
         # Also treat exact lexeme lemma matches as known when no explicit surface form exists.
-        lemma_exact_row = conn.execute(
-            """
-            SELECT lemma
-            FROM lexemes
-            WHERE lemma = ?
-            LIMIT 1
-            """,
-            (normalized,),
-        ).fetchone()
-        if lemma_exact_row is not None:
+        if lookups is not None:
+            lemma_exact = normalized if normalized in lookups.exact_lemmas else None
+        else:
+            lemma_exact_row = conn.execute(
+                """
+                SELECT lemma
+                FROM lexemes
+                WHERE lemma = ?
+                LIMIT 1
+                """,
+                (normalized,),
+            ).fetchone()
+            lemma_exact = lemma_exact_row["lemma"] if lemma_exact_row is not None else None
+        if lemma_exact is not None:
             return TokenClassification(
                 surface_token=token,
                 normalized_token=normalized,
-                lemma_candidate=lemma_exact_row["lemma"],
+                lemma_candidate=lemma_exact,
                 classification="known",
                 match_source="exact",
-                matched_lemma=lemma_exact_row["lemma"],
+                matched_lemma=lemma_exact,
                 matched_surface_form=normalized,
                 reason_tags=("exact_match",),
             )
 
-        lemma_candidates = self._lemma_candidates_for_token(normalized)
+        if lookups is not None and normalized in lookups.candidates:
+            lemma_candidates = lookups.candidates[normalized]
+        else:
+            lemma_candidates = self._lemma_candidates_for_token(normalized)
         if not lemma_candidates:
             return self._new_with_typo_fallback(
                 token=token,
@@ -140,17 +353,19 @@ class LemmaAwareClassifier:
                 sentence_start=sentence_start,
             )
 
-        placeholders = ", ".join("?" for _ in lemma_candidates)
-        lemma_rows = conn.execute(
-            f"""
-            SELECT lemma
-            FROM lexemes
-            WHERE lemma IN ({placeholders})
-            """,
-            tuple(lemma_candidates),
-        ).fetchall()
-
-        lexeme_set = {normalize_candidate(row["lemma"]) for row in lemma_rows}
+        if lookups is not None:
+            lexeme_set = {candidate for candidate in lemma_candidates if candidate in lookups.candidate_lexemes}
+        else:
+            placeholders = ", ".join("?" for _ in lemma_candidates)
+            lemma_rows = conn.execute(
+                f"""
+                SELECT lemma
+                FROM lexemes
+                WHERE lemma IN ({placeholders})
+                """,
+                tuple(lemma_candidates),
+            ).fetchall()
+            lexeme_set = {normalize_candidate(row["lemma"]) for row in lemma_rows}
         matched_lemma = pick_best_candidate_in_lexicon(
             surface=normalized,
             tag=None,
@@ -224,16 +439,15 @@ class LemmaAwareClassifier:
             reason_tags=typo_result.reason_tags,
         )
 
-    def _lemma_candidates_for_token(self, normalized_token: str) -> list[str]:
-        raw_candidates = self.nlp_adapter.lemma_candidates_for_token(normalized_token)
-        candidates: list[str] = []
-        seen: set[str] = set()
-        for raw_candidate in raw_candidates:
-            candidate = normalize_token(raw_candidate)
-            if not candidate or candidate in seen:
-                continue
-            seen.add(candidate)
-            candidates.append(candidate)
+    def _lemma_candidates_for_token(
+        self,
+        normalized_token: str,
+        raw_candidates: list[str] | None = None,
+    ) -> list[str]:
+        if raw_candidates is None:
+            raw_candidates = self.nlp_adapter.lemma_candidates_for_token(normalized_token)
+        # Adapters return normalized candidates (see NLPAdapter); only drop empties and repeats.
+        candidates = [candidate for candidate in dict.fromkeys(raw_candidates) if candidate]
 
         if candidates:
             return candidates
@@ -244,5 +458,43 @@ class LemmaAwareClassifier:
         return [fallback]
 
 
+def _select_exact_matches(conn, unique: list[str]) -> tuple[dict[str, tuple[str, str]], frozenset[str]]:
+    exact_forms: dict[str, tuple[str, str]] = {}
+    exact_lemmas: set[str] = set()
+    # One round trip per chunk: form rows carry the form, lemma-only rows carry NULL.
+    for form, lemma in _select_in(
+        conn,
+        """
+        SELECT sf.form, l.lemma
+        FROM surface_forms sf
+        JOIN lexemes l ON l.id = sf.lexeme_id
+        WHERE sf.form IN ({placeholders})
+        UNION ALL
+        SELECT NULL, lemma
+        FROM lexemes
+        WHERE lemma IN ({placeholders})
+        """,
+        unique,
+    ):
+        if form is None:
+            exact_lemmas.add(lemma)
+        else:
+            exact_forms.setdefault(form, (lemma, form))
+    return exact_forms, frozenset(exact_lemmas)
+
+
+def _select_in(conn, sql_template: str, values: list[str]) -> list[tuple]:
+    """Run a `... IN ({placeholders})` query over values in parameter-limit-sized chunks.
+
+    Placeholders are numbered, so a template may repeat {placeholders} and bind each chunk once.
+    """
+    rows: list[tuple] = []
+    for start in range(0, len(values), _IN_QUERY_CHUNK):
+        chunk = values[start : start + _IN_QUERY_CHUNK]
+        placeholders = ", ".join(f"?{index}" for index in range(1, len(chunk) + 1))
+        rows.extend(conn.execute(sql_template.format(placeholders=placeholders), chunk).fetchall())
+    return rows
+
+
 # Backward-compatible alias for prior checkpoints.
 ExactLookupClassifier = LemmaAwareClassifier
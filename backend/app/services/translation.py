@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import math
+import random
+import threading
 import time
 from typing import Protocol
 
 import httpx
 
+from app.core.cache import LRUCache
+
 
 class TranslationError(RuntimeError):
     """Raised when a translation provider cannot return a translation."""
@@ -16,6 +24,33 @@ class TranslationService(Protocol):
     def translate_en_to_da(self, text: str) -> str | None: ...
 
 
+# DeepL accepts at most 50 texts per /v2/translate request.
+_MAX_TEXTS_PER_REQUEST = 50
+# Requests are user-paced (seconds apart), so keep the idle connection well past httpx's
+# 5s default instead of paying a fresh TCP+TLS handshake on most calls.
+_CLIENT_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=120.0)
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _has_letters(text: str) -> bool:
+    # Numbers, punctuation and symbols translate to themselves; no API call needed.
+    return any(char.isalpha() for char in text)
+
+
 @dataclass
 class DeepLTranslationService:
     """Danish->English translator backed by the DeepL API."""
@@ -43,7 +78,16 @@ class DeepLTranslationService:
     backoff_seconds: float = 0.5
     max_backoff_seconds: float = 8.0
     min_request_interval_seconds: float = 0.35
+    result_cache_size: int = 10_000
+    # DeepL answering with no text is cached briefly; errors are never cached.
+    empty_result_ttl_seconds: float = 300.0
     _client: httpx.Client | None = field(default=None, init=False, repr=False, compare=False)
+    _client_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    # Translations are deterministic per (direction, text): (translation, expires_at) entries,
+    # where only empty (None) results expire.
+    _results: LRUCache[tuple[str, str], tuple[str | None, float]] = field(
+        init=False, repr=False, compare=False
+    )
     _next_allowed_request_at: float = field(default=0.0, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
@@ -51,6 +95,7 @@ class DeepLTranslationService:
         if not normalized_key:
             raise TranslationError("DeepL API key is required for translation.")
         self.api_key = normalized_key
+        self._results = LRUCache(max_size=self.result_cache_size)
 
         if self.base_url is None:
             self.base_url = "https://api-free.deepl.com" if normalized_key.endswith(":fx") else "https://api.deepl.com"
@@ -66,51 +111,123 @@ class DeepLTranslationService:
 
     def _ensure_client(self) -> httpx.Client:
         if self._client is None:
-            self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout_seconds)
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.base_url,
+                        timeout=self.timeout_seconds,
+                        limits=_CLIENT_LIMITS,
+                    )
         return self._client
 
+    def warm_up(self) -> None:
+        """Open the client's connection (DNS, TCP, TLS) before the first translation request.
+
+        Best effort: /v2/usage costs no character quota, and failures are left for the
+        first real request to report.
+        """
+        try:
+            self._ensure_client().get("/v2/usage", headers={"Authorization": f"DeepL-Auth-Key {self.api_key}"})
+        except httpx.HTTPError:
+            pass
+
     def close(self) -> None:
         if self._client is not None:
             self._client.close()
             self._client = None
 
+    def __enter__(self) -> DeepLTranslationService:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
     def translate_da_to_en(self, text: str) -> str | None:
         normalized = text.strip()
         if not normalized:
             return None
-
-        cleaned = self._translate_with_context(
+        if not _has_letters(normalized):
+            return normalized
+        return self._cached(("da-en", normalized), self._translate_da_to_en_uncached)
+
+    def translate_da_to_en_batch(self, texts: list[str]) -> list[str | None]:
+        """translate_da_to_en for many texts, sending up to 50 uncached texts per request."""
+        stripped = [text.strip() for text in texts]
+        results: dict[str, str | None] = {}
+        pending: list[str] = []
+        for normalized in dict.fromkeys(stripped):
+            if not normalized:
+                results[normalized] = None
+            elif not _has_letters(normalized):
+                results[normalized] = normalized
+            else:
+                hit, cached = self._cache_get(("da-en", normalized))
+                if hit:
+                    results[normalized] = cached
+                elif self._is_homograph(normalized):
+                    # Rare (a handful of tokens), so these keep their own per-text request.
+                    results[normalized] = self._cached(("da-en", normalized), self._translate_da_to_en_uncached)
+                else:
+                    pending.append(normalized)
+
+        for start in range(0, len(pending), _MAX_TEXTS_PER_REQUEST):
+            chunk = pending[start : start + _MAX_TEXTS_PER_REQUEST]
+            translated = self._translate_many_with_context(
+                texts=chunk,
+                context=self.context_template,
+                source_code=self.source_code,
+                target_code=self.target_code,
+            )
+            for normalized, cleaned in zip(chunk, translated):
+                self._cache_set(("da-en", normalized), cleaned)
+                results[normalized] = cleaned
+
+        return [results[normalized] for normalized in stripped]
+
+    def _translate_da_to_en_uncached(self, normalized: str) -> str | None:
+        if self._is_homograph(normalized):
+            return self._translate_homograph(normalized)
+        return self._translate_with_context(
             text=normalized,
             context=self.context_template,
             source_code=self.source_code,
             target_code=self.target_code,
         )
-        if cleaned is None:
-            return None
 
-        if self._should_disambiguate(source_text=normalized, translated_text=cleaned):
-            source_normalized = self._normalize_for_compare(normalized)
-            try:
-                disambiguated = self._translate_with_context(
-                    text=normalized,
-                    context=self.homograph_disambiguation_template.format(word=normalized),
-                    source_code=self.source_code,
-                    target_code=self.target_code,
-                )
-            except TranslationError:
-                disambiguated = None
-            if disambiguated and self._normalize_for_compare(disambiguated) != source_normalized:
-                return disambiguated
-            fallback = self.homograph_fallback_translations.get(source_normalized)
-            if fallback:
-                return fallback
-
-        return cleaned
+    def _translate_homograph(self, normalized: str) -> str | None:
+        # The generic context echoes these back untranslated, so ask with the
+        # disambiguation context first instead of spending a request to find that out.
+        source_normalized = self._normalize_for_compare(normalized)
+        try:
+            disambiguated = self._translate_with_context(
+                text=normalized,
+                context=self.homograph_disambiguation_template.format(word=normalized),
+                source_code=self.source_code,
+                target_code=self.target_code,
+            )
+        except TranslationError:
+            disambiguated = None
+        if disambiguated and self._normalize_for_compare(disambiguated) != source_normalized:
+            return disambiguated
+        fallback = self.homograph_fallback_translations.get(source_normalized)
+        if fallback:
+            return fallback
+        return self._translate_with_context(
+            text=normalized,
+            context=self.context_template,
+            source_code=self.source_code,
+            target_code=self.target_code,
+        )
 
     def translate_en_to_da(self, text: str) -> str | None:
         normalized = text.strip()
         if not normalized:
             return None
+        if not _has_letters(normalized):
+            return normalized
+        return self._cached(("en-da", normalized), self._translate_en_to_da_uncached)
+
+    def _translate_en_to_da_uncached(self, normalized: str) -> str | None:
         return self._translate_with_context(
             text=normalized,
             context="Kildeteksten er engelsk. Giv den bedste naturlige danske oversaettelse.",
@@ -118,6 +235,30 @@ class DeepLTranslationService:
             target_code="DA",
         )
 
+    def _cached(self, key: tuple[str, str], translate: Callable[[str], str | None]) -> str | None:
+        hit, cached = self._cache_get(key)
+        if hit:
+            return cached
+        translated = translate(key[1])
+        self._cache_set(key, translated)
+        return translated
+
+    def _cache_get(self, key: tuple[str, str]) -> tuple[bool, str | None]:
+        entry = self._results.get(key)
+        if entry is None:
+            return False, None
+        translated, expires_at = entry
+        if expires_at <= time.monotonic():
+            return False, None
+        return True, translated
+
+    def _cache_set(self, key: tuple[str, str], translated: str | None) -> None:
+        if translated is not None:
+            expires_at = math.inf
+        else:
+            expires_at = time.monotonic() + self.empty_result_ttl_seconds
+        self._results.set(key, (translated, expires_at))
+
     def _translate_with_context(
         self,
         *,
@@ -126,8 +267,24 @@ class DeepLTranslationService:
         source_code: str,
         target_code: str,
     ) -> str | None:
+        return self._translate_many_with_context(
+            texts=[text],
+            context=context,
+            source_code=source_code,
+            target_code=target_code,
+        )[0]
+
+    def _translate_many_with_context(
+        self,
+        *,
+        texts: list[str],
+        context: str,
+        source_code: str,
+        target_code: str,
+    ) -> list[str | None]:
+        """One request for all texts; results are aligned with texts by index."""
         payload = {
-            "text": [text],
+            "text": texts,
             "source_lang": source_code,
             "target_lang": target_code,
             "context": context,
@@ -143,22 +300,19 @@ class DeepLTranslationService:
             raise TranslationError("DeepL translation response was not valid JSON.") from exc
 
         entries = body.get("translations")
-        if not isinstance(entries, list) or not entries:
-            return None
-
-        first = entries[0]
-        translated = first.get("text") if isinstance(first, dict) else None
+        if not isinstance(entries, list):
+            entries = []
 
-        cleaned = translated.strip() if isinstance(translated, str) else ""
-        return cleaned or None
+        results: list[str | None] = []
+        for index in range(len(texts)):
+            entry = entries[index] if index < len(entries) else None
+            translated = entry.get("text") if isinstance(entry, dict) else None
+            cleaned = translated.strip() if isinstance(translated, str) else ""
+            results.append(cleaned or None)
+        return results
 
-    def _should_disambiguate(self, *, source_text: str, translated_text: str) -> bool:
-        source_normalized = self._normalize_for_compare(source_text)
-        translated_normalized = self._normalize_for_compare(translated_text)
-        return (
-            source_normalized == translated_normalized
-            and source_normalized in self.homograph_disambiguation_tokens
-        )
+    def _is_homograph(self, text: str) -> bool:
+        return self._normalize_for_compare(text) in self.homograph_disambiguation_tokens
 
     @staticmethod
     def _normalize_for_compare(text: str) -> str:
@@ -189,13 +343,13 @@ class DeepLTranslationService:
 
     def _sleep_before_retry(self, *, attempt: int, response: httpx.Response | None) -> None:
         retry_after = response.headers.get("Retry-After") if response is not None else None
-        if retry_after:
-            try:
-                delay = float(retry_after)
-            except ValueError:
-                delay = self.backoff_seconds * (2**attempt)
+        server_delay = _parse_retry_after(retry_after) if retry_after else None
+        if server_delay is not None:
+            # Honour the server's floor; spread retries only upward so none arrive early.
+            delay = server_delay * random.uniform(1.0, 1.25)
         else:
-            delay = self.backoff_seconds * (2**attempt)
+            # Full jitter: threads that hit the same 429 burst don't retry in lockstep.
+            delay = random.uniform(0.0, min(self.max_backoff_seconds, self.backoff_seconds * (2**attempt)))
 
         delay = max(0.0, min(delay, self.max_backoff_seconds))
         if delay > 0:
@@ -1,3 +1,26 @@
-from app.services.typo.typo_engine import TypoEngine, TypoResult, TypoSuggestion
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.services.typo.typo_engine import TypoEngine, TypoResult, TypoSuggestion
+
+# Resolved on first access (PEP 562) so light submodules such as typo.normalization can be
+# imported without loading the engine and its symspellpy/rapidfuzz backends.
+_EXPORTS = {
+    "TypoEngine": "typo_engine",
+    "TypoResult": "typo_engine",
+    "TypoSuggestion": "typo_engine",
+}
 
 __all__ = ["TypoEngine", "TypoResult", "TypoSuggestion"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
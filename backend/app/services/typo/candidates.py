@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
+import logging
+import os
+import sys
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
 
 from app.db.migrations import get_connection
 from app.services.typo.normalization import comparison_forms
@@ -13,6 +18,17 @@ except Exception:  # pragma: no cover - optional dependency
     SymSpell = None
     Verbosity = None
 
+try:
+    from rapidfuzz.distance import Levenshtein as RapidLevenshtein
+except Exception:  # pragma: no cover - optional dependency
+    RapidLevenshtein = None
+
+
+logger = logging.getLogger(__name__)
+
+_GENERAL_WORD_COUNT = 10
+_USER_LEMMA_COUNT = 100
+
 
 @dataclass(frozen=True)
 class Candidate:
@@ -31,6 +47,7 @@ class CandidateProvider:
         dictionary_paths: Iterable[Path] | None = None,
         max_dictionary_edit_distance: int = 2,
         prefix_length: int = 7,
+        index_cache_path: Path | None = None,
     ) -> None:
         self.db_path = db_path
         self.dictionary_paths = self._resolve_dictionary_paths(
@@ -39,9 +56,14 @@ class CandidateProvider:
         )
         self.max_dictionary_edit_distance = max_dictionary_edit_distance
         self.prefix_length = prefix_length
+        # Pickled general-dictionary SymSpell index; user lemmas are never part of it.
+        self.index_cache_path = index_cache_path
         self._symspell = None
         self._general_words: set[str] = set()
         self._suggestion_words: set[str] = set()
+        self._known_user_lemmas: set[str] = set()
+        self._suggestion_words_by_length: dict[int, list[str]] = {}
+        self._dictionary_fingerprint = ""
         self.general_word_count = 0
         self._load()
 
@@ -71,8 +93,10 @@ class CandidateProvider:
         for dictionary_path in self.dictionary_paths:
             if not dictionary_path.exists():
                 continue
+            # Interned so the general set, suggestion set and SymSpell index share one
+            # copy of each word.
             words = {
-                line.strip().lower()
+                sys.intern(line.strip().lower())
                 for line in dictionary_path.read_text(encoding="utf-8").splitlines()
                 if line.strip()
             }
@@ -80,32 +104,117 @@ class CandidateProvider:
             if not _is_membership_only_dictionary(dictionary_path):
                 self._suggestion_words.update(words)
         self.general_word_count = len(self._general_words)
+        self._suggestion_words_by_length = {}
+        for word in self._suggestion_words:
+            self._suggestion_words_by_length.setdefault(len(word), []).append(word)
+        self._dictionary_fingerprint = self._compute_dictionary_fingerprint()
+        self._known_user_lemmas = self._load_user_lemmas()
         if SymSpell is not None:
-            self._symspell = SymSpell(
+            self._symspell = self._load_cached_index()
+            if self._symspell is None:
+                self._symspell = self._build_general_index()
+                self._save_cached_index(self._symspell)
+            for lemma in self._known_user_lemmas:
+                self._symspell.create_dictionary_entry(lemma, _USER_LEMMA_COUNT)
+
+    def _build_general_index(self):
+        symspell = SymSpell(
+            max_dictionary_edit_distance=self.max_dictionary_edit_distance,
+            prefix_length=self.prefix_length,
+        )
+        for word in self._suggestion_words:
+            symspell.create_dictionary_entry(word, _GENERAL_WORD_COUNT)
+        return symspell
+
+    def _compute_dictionary_fingerprint(self) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{self.max_dictionary_edit_distance}:{self.prefix_length}".encode())
+        for dictionary_path in self.dictionary_paths:
+            try:
+                stat = dictionary_path.stat()
+            except OSError:
+                digest.update(f"|{dictionary_path}:missing".encode())
+                continue
+            digest.update(f"|{dictionary_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return digest.hexdigest()
+
+    def _index_meta_path(self) -> Path | None:
+        if self.index_cache_path is None:
+            return None
+        return self.index_cache_path.with_name(self.index_cache_path.name + ".meta")
+
+    def _load_cached_index(self):
+        meta_path = self._index_meta_path()
+        if meta_path is None or not self.index_cache_path.exists() or not meta_path.exists():
+            return None
+        try:
+            if meta_path.read_text(encoding="utf-8").strip() != self._dictionary_fingerprint:
+                return None
+            symspell = SymSpell(
                 max_dictionary_edit_distance=self.max_dictionary_edit_distance,
                 prefix_length=self.prefix_length,
             )
-            for word in self._suggestion_words:
-                self._symspell.create_dictionary_entry(word, 10)
-            for lemma in self._load_user_lemmas():
-                self._symspell.create_dictionary_entry(lemma, 100)
+            if not symspell.load_pickle(self.index_cache_path, compressed=True):
+                return None
+        except Exception:
+            logger.warning("typo_index_cache_load_failed", extra={"path": str(self.index_cache_path)})
+            return None
+        return symspell
+
+    def _save_cached_index(self, symspell) -> None:
+        meta_path = self._index_meta_path()
+        if meta_path is None:
+            return
+        tmp_path = self.index_cache_path.with_name(self.index_cache_path.name + ".tmp")
+        try:
+            self.index_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            symspell.save_pickle(tmp_path, compressed=True)
+            os.replace(tmp_path, self.index_cache_path)
+            meta_path.write_text(self._dictionary_fingerprint, encoding="utf-8")
+        except OSError:
+            logger.warning("typo_index_cache_save_failed", extra={"path": str(self.index_cache_path)})
 
     def _load_user_lemmas(self) -> set[str]:
         with get_connection(self.db_path) as conn:
             rows = conn.execute("SELECT lemma FROM lexemes").fetchall()
-        return {str(row["lemma"]).lower() for row in rows}
+        return {sys.intern(str(row["lemma"]).lower()) for row in rows}
 
     def add_user_lexeme(self, lemma: str) -> None:
         normalized = lemma.strip().lower()
         if not normalized:
             return
+        if normalized in self._known_user_lemmas:
+            return
+        # Replace rather than mutate: suggest() iterates the current set on other threads.
+        self._known_user_lemmas = self._known_user_lemmas | {normalized}
         if self._symspell is not None:
-            self._symspell.create_dictionary_entry(normalized, 100)
+            self._symspell.create_dictionary_entry(normalized, _USER_LEMMA_COUNT)
 
     def refresh_user_lexicon(self) -> None:
         if self._symspell is None:
+            self._known_user_lemmas = self._load_user_lemmas()
             return
-        self._load()
+        if self._compute_dictionary_fingerprint() != self._dictionary_fingerprint:
+            self._load()
+            return
+        self._refresh_user_lemmas()
+
+    def _refresh_user_lemmas(self) -> None:
+        """Apply only the user-lemma delta; the general index stays as built."""
+        current = self._load_user_lemmas()
+        added = current - self._known_user_lemmas
+        removed = self._known_user_lemmas - current
+        if len(removed) >= len(self._symspell.words):
+            # SymSpell cannot delete its last entry; rebuild instead.
+            self._load()
+            return
+        for lemma in removed:
+            self._symspell.delete_dictionary_entry(lemma)
+            if lemma in self._suggestion_words:
+                self._symspell.create_dictionary_entry(lemma, _GENERAL_WORD_COUNT)
+        for lemma in added:
+            self._symspell.create_dictionary_entry(lemma, _USER_LEMMA_COUNT)
+        self._known_user_lemmas = current
 
     def is_valid_word(self, token: str) -> bool:
         normalized = token.strip().lower()
@@ -113,6 +222,10 @@ class CandidateProvider:
             return False
         if self.is_known_dictionary_word(normalized):
             return True
+        # Lemmas enter through add_user_lexeme/refresh_user_lexicon, so a miss here needs
+        # no SQLite round-trip; a hit is still confirmed in case the lexeme was deleted.
+        if normalized not in self._known_user_lemmas:
+            return False
         with get_connection(self.db_path) as conn:
             row = conn.execute(
                 "SELECT 1 FROM lexemes WHERE lemma = ? LIMIT 1",
@@ -134,11 +247,29 @@ class CandidateProvider:
                 previous = all_candidates.get(candidate.value)
                 if previous is None or candidate.distance < previous.distance:
                     all_candidates[candidate.value] = candidate
-        ranked = sorted(
-            all_candidates.values(),
-            key=lambda item: (item.distance, -item.frequency, item.value),
-        )
-        return ranked[:max_candidates]
+        return heapq.nsmallest(max_candidates, all_candidates.values(), key=_candidate_order)
+
+    def suggest_many(
+        self,
+        tokens: Sequence[str],
+        *,
+        max_candidates: int = 10,
+        max_distance: int = 2,
+    ) -> dict[str, list[Candidate]]:
+        """suggest() for every token, computed once per distinct normalized form."""
+        by_normalized: dict[str, list[Candidate]] = {}
+        results: dict[str, list[Candidate]] = {}
+        for token in tokens:
+            if token in results:
+                continue
+            # suggest() only depends on the token through its normalized form.
+            normalized = comparison_forms(token).normalized
+            suggestions = by_normalized.get(normalized)
+            if suggestions is None:
+                suggestions = self.suggest(normalized, max_candidates=max_candidates, max_distance=max_distance)
+                by_normalized[normalized] = suggestions
+            results[token] = suggestions
+        return results
 
     def _suggest_one(self, normalized: str, *, max_candidates: int, max_distance: int) -> Iterable[Candidate]:
         if not normalized:
@@ -162,17 +293,38 @@ class CandidateProvider:
                 for result in results[:max_candidates]
             ]
 
-        # Fallback path without SymSpell dependency.
-        user_lemmas = self._load_user_lemmas()
-        words = self._suggestion_words | user_lemmas
+        # Fallback path without SymSpell dependency. The user-lemma set is kept current by
+        # add_user_lexeme/refresh_user_lexicon, so no per-request lexemes scan.
+        user_lemmas = self._known_user_lemmas
+        # Edit distance is at least the length difference, so only words within
+        # max_distance of the query's length can qualify.
+        query_length = len(normalized)
+        lengths = range(query_length - max_distance, query_length + max_distance + 1)
+        words = {word for length in lengths for word in self._suggestion_words_by_length.get(length, ())}
+        words.update(word for word in user_lemmas if len(word) in lengths)
         scored = []
         for word in words:
-            distance = _levenshtein(normalized, word)
+            distance = _bounded_levenshtein(normalized, word, max_distance)
             if distance <= max_distance:
                 source = "from_user_dict" if word in user_lemmas else "from_general_dict"
                 score = 100.0 if source == "from_user_dict" else 10.0
                 scored.append(Candidate(value=word, distance=distance, source_flags=(source,), frequency=score))
-        return sorted(scored, key=lambda item: (item.distance, -item.frequency, item.value))[:max_candidates]
+        # Partial selection: O(N log K) over the whole dictionary instead of a full sort.
+        return heapq.nsmallest(max_candidates, scored, key=_candidate_order)
+
+
+def _candidate_order(item: Candidate) -> tuple[int, float, str]:
+    return (item.distance, -item.frequency, item.value)
+
+
+def _bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """Exact distance when it is <= max_distance; otherwise some value above max_distance."""
+    if RapidLevenshtein is not None:
+        # C implementation that stops as soon as the cutoff is exceeded.
+        return RapidLevenshtein.distance(a, b, score_cutoff=max_distance)
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    return _levenshtein(a, b)
 
 
 def _levenshtein(a: str, b: str) -> int:
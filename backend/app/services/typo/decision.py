@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import math
+from math import exp
 from typing import Literal
 
 from app.services.typo.ranking import RankedCandidate
@@ -81,13 +81,9 @@ def decide_status(
 def _top2_posterior(top_score: float, second_score: float | None, *, temperature: float = 0.35) -> float:
     if second_score is None:
         return 1.0
-    hi = max(top_score, second_score)
-    a = math.exp((top_score - hi) / temperature)
-    b = math.exp((second_score - hi) / temperature)
-    total = a + b
-    if total <= 0:
-        return 0.0
-    return a / total
+    # Two-way softmax a / (a + b) rewritten as a logistic: one exp instead of two.
+    # Ranked scores are sorted, so the exponent is <= 0 and cannot overflow.
+    return 1.0 / (1.0 + exp((second_score - top_score) / temperature))
 
 
 def _blended_confidence(raw_score: float, posterior: float) -> float:
@@ -4,9 +4,20 @@ import re
 from dataclasses import dataclass
 
 
-EMAIL_RE = re.compile(r"^\S+@\S+\.\S+$")
-URL_RE = re.compile(r"^(https?://|www\.)\S+$", flags=re.IGNORECASE)
-PATH_RE = re.compile(r"^([A-Za-z]:\\|/).+")
+# One fullmatch pass decides email/url/path; branch order keeps the old precedence and
+# lastgroup names the reason tag. The "\n" handling mirrors the old "$" anchors
+# and the unanchored path prefix match.
+SKIP_RE = re.compile(
+    r"(?P<email>\S+@\S+\.\S+\n?)"
+    r"|(?P<url>(?:https?://|www\.)\S+\n?)"
+    r"|(?P<path>(?:[A-Za-z]:\\|/)[^\n](?s:.*))",
+    flags=re.IGNORECASE,
+)
+_SKIP_TAGS = {
+    "email": ("gating_skip_email",),
+    "url": ("gating_skip_url",),
+    "path": ("gating_skip_path",),
+}
 
 
 @dataclass(frozen=True)
@@ -27,27 +38,26 @@ def should_run_typo_check(
         return GatingResult(False, ("gating_skip_empty",))
     if len(normalized) < min_len:
         return GatingResult(False, ("gating_skip_short",))
-    if EMAIL_RE.match(normalized):
-        return GatingResult(False, ("gating_skip_email",))
-    if URL_RE.match(normalized):
-        return GatingResult(False, ("gating_skip_url",))
-    if PATH_RE.match(normalized):
-        return GatingResult(False, ("gating_skip_path",))
-    if token.isupper() and any(char.isalpha() for char in token):
+    # Plain words carry none of these markers, so most tokens never enter the regex engine.
+    if "@" in normalized or "/" in normalized or "\\" in normalized or normalized[:4].lower() == "www.":
+        skip = SKIP_RE.fullmatch(normalized)
+        if skip is not None:
+            return GatingResult(False, _SKIP_TAGS[skip.lastgroup])
+    if token.isupper() and any(map(str.isalpha, token)):
         return GatingResult(False, ("gating_skip_acronym",))
 
-    digit_count = sum(char.isdigit() for char in normalized)
-    alpha_count = sum(char.isalpha() for char in normalized)
-    total = len(normalized)
-    if total and digit_count / total > 0.3:
-        return GatingResult(False, ("gating_skip_digit_ratio",))
-    if alpha_count == 0:
-        return GatingResult(False, ("gating_skip_non_alpha",))
+    # All-letter tokens (nearly every word) pass both checks without a per-character scan.
+    if not normalized.isalpha():
+        digit_count = sum(map(str.isdigit, normalized))
+        if digit_count / len(normalized) > 0.3:
+            return GatingResult(False, ("gating_skip_digit_ratio",))
+        if not any(map(str.isalpha, normalized)):
+            return GatingResult(False, ("gating_skip_non_alpha",))
 
     proper_noun_bias = (
         not sentence_start
         and token[:1].isupper()
-        and any(char.isalpha() for char in token)
+        and any(map(str.isalpha, token))
     )
     tags = ("gating_ok",)
     if proper_noun_bias:
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 
 
 EDGE_PUNCT_PATTERN = re.compile(r"^[^\wæøåÆØÅ]+|[^\wæøåÆØÅ]+$", flags=re.UNICODE)
+# Anything comparison_forms could rewrite; most tokens contain none of these.
+DANISH_VARIANT_PATTERN = re.compile("ae|oe|aa|[æøå]")
 
 
 def normalize_apostrophes(token: str) -> str:
@@ -13,12 +15,9 @@ def normalize_apostrophes(token: str) -> str:
 
 def normalize_for_typo_compare(token: str) -> str:
     cleaned = normalize_apostrophes(token.strip().lower())
-    while True:
-        updated = EDGE_PUNCT_PATTERN.sub("", cleaned)
-        if updated == cleaned:
-            break
-        cleaned = updated
-    return cleaned
+    # Both alternatives are greedy and anchored, so one pass already strips each edge
+    # maximally; a second pass can never change the result.
+    return EDGE_PUNCT_PATTERN.sub("", cleaned)
 
 
 @dataclass(frozen=True)
@@ -32,6 +31,8 @@ def comparison_forms(token: str) -> ComparisonForms:
     alternates: set[str] = {normalized}
     if not normalized:
         return ComparisonForms(normalized="", alternates=())
+    if DANISH_VARIANT_PATTERN.search(normalized) is None:
+        return ComparisonForms(normalized=normalized, alternates=(normalized,))
 
     for source, target in (("ae", "æ"), ("oe", "ø"), ("aa", "å")):
         if source in normalized:
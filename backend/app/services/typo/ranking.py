@@ -2,15 +2,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
+import heapq
 import math
 from typing import Iterable
 
 from app.services.typo.candidates import Candidate
 
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
 except Exception:  # pragma: no cover - optional dependency
     fuzz = None
+    process = None
 
 
 @dataclass(frozen=True)
@@ -28,16 +31,25 @@ def rank_candidates(
     token: str,
     candidates: Iterable[Candidate],
     known_lemmas: set[str],
+    limit: int | None = None,
 ) -> list[RankedCandidate]:
+    """Score and order candidates best-first; with ``limit``, only the top ``limit`` are returned."""
     ranked: list[RankedCandidate] = []
-    for candidate in candidates:
-        similarity = _similarity(token, candidate.value)
-        distance_score = max(0.0, 1.0 - (candidate.distance / max(len(token), len(candidate.value), 1)))
+    candidates = list(candidates)
+    if not candidates:
+        return ranked
+    similarities = _similarities(token, [candidate.value for candidate in candidates])
+    token_len = len(token)
+    for candidate, similarity in zip(candidates, similarities):
+        value = candidate.value
+        distance_score = max(0.0, 1.0 - (candidate.distance / max(token_len, len(value), 1)))
         prior_score = _prior_score(candidate.frequency)
-        error_likelihood = _error_likelihood(token, candidate.value)
+        # The candidate's edit distance bounds the weighted cost whenever it was measured
+        # against the token itself, which lets the DP stay inside a narrow band.
+        error_likelihood = _error_likelihood(token, value, candidate.distance)
         source_boost = 0.15 if "from_user_dict" in candidate.source_flags else 0.0
         frequency_score = prior_score * 0.1
-        lemma_family_boost = 0.1 if candidate.value in known_lemmas else 0.0
+        lemma_family_boost = 0.1 if value in known_lemmas else 0.0
         total = (
             (0.28 * distance_score)
             + (0.22 * similarity)
@@ -48,7 +60,7 @@ def rank_candidates(
         )
         ranked.append(
             RankedCandidate(
-                value=candidate.value,
+                value=value,
                 score=max(0.0, min(1.0, total)),
                 source_flags=candidate.source_flags,
                 distance=candidate.distance,
@@ -57,22 +69,46 @@ def rank_candidates(
             )
         )
 
-    return sorted(ranked, key=lambda item: (-item.score, item.distance, item.value))
+    if limit is not None:
+        return heapq.nsmallest(limit, ranked, key=_ranked_order)
+    return sorted(ranked, key=_ranked_order)
 
 
+def _ranked_order(item: RankedCandidate) -> tuple[float, int, str]:
+    return (-item.score, item.distance, item.value)
+
+
+def _similarities(token: str, values: list[str]) -> list[float]:
+    if fuzz is not None and process is not None:
+        # One C-level loop over all candidates instead of a call per pair.
+        scores = [0.0] * len(values)
+        for _, score, index in process.extract(token, values, scorer=fuzz.ratio, processor=None, limit=None):
+            scores[index] = float(score) / 100.0
+        return scores
+    return [_similarity(token, value) for value in values]
+
+
+# difflib fallback only; memoized because recurring (token, candidate) pairs are common.
+@lru_cache(maxsize=65536)
 def _similarity(a: str, b: str) -> float:
-    if fuzz is not None:
-        return float(fuzz.ratio(a, b)) / 100.0
     return SequenceMatcher(a=a, b=b).ratio()
 
 
+_PRIOR_SCALE = math.log1p(200.0)
+
+
+# Candidate frequencies take only a handful of values (general/user dictionary counts).
+@lru_cache(maxsize=1024)
 def _prior_score(frequency: float) -> float:
     # Log-scale frequency so large dictionary counts do not dominate ranking.
-    return max(0.0, min(1.0, math.log1p(max(frequency, 0.0)) / math.log1p(200.0)))
+    return max(0.0, min(1.0, math.log1p(max(frequency, 0.0)) / _PRIOR_SCALE))
 
 
-def _error_likelihood(observed: str, candidate: str) -> float:
-    cost = _weighted_edit_cost(observed, candidate)
+# The weighted edit distance is an O(m*n) pure-Python DP, and the same
+# (token, candidate) pairs recur across notes.
+@lru_cache(maxsize=65536)
+def _error_likelihood(observed: str, candidate: str, max_cost: int | None = None) -> float:
+    cost = _weighted_edit_cost(observed, candidate, max_cost=max_cost)
     scale = max(len(observed), len(candidate), 1)
     return max(0.0, min(1.0, math.exp(-(cost / scale))))
 
@@ -87,36 +123,117 @@ _DANISH_SUBSTITUTION_COSTS: dict[tuple[str, str], float] = {
 }
 
 
-def _weighted_edit_cost(observed: str, candidate: str) -> float:
+# Same table keyed source -> target -> cost, so the DP avoids building a tuple per cell.
+_SUBSTITUTION_COSTS_BY_SOURCE: dict[str, dict[str, float]] = {
+    source: {
+        target: cost
+        for (other_source, target), cost in _DANISH_SUBSTITUTION_COSTS.items()
+        if other_source == source
+    }
+    for source, _ in _DANISH_SUBSTITUTION_COSTS
+}
+_NO_DISCOUNTS: dict[str, float] = {}
+
+
+def _weighted_edit_cost(observed: str, candidate: str, *, max_cost: int | None = None) -> float:
     if observed == candidate:
         return 0.0
-    a = observed.lower()
-    b = candidate.lower()
+    a, b = _trim_common_affixes(observed.lower(), candidate.lower())
+    if not a or not b:
+        return float(len(a) + len(b))
+    if max_cost is not None and abs(len(a) - len(b)) <= max_cost:
+        banded = _banded_weighted_edit_cost(a, b, max_cost)
+        if banded <= max_cost:
+            return banded
+    return _full_weighted_edit_cost(a, b)
+
+
+def _trim_common_affixes(a: str, b: str) -> tuple[str, str]:
+    # A shared prefix or suffix never changes the cost, and typo pairs share most of
+    # their characters, so this usually leaves only a few characters for the DP.
+    limit = min(len(a), len(b))
+    start = 0
+    while start < limit and a[start] == b[start]:
+        start += 1
+    limit -= start
+    end = 0
+    while end < limit and a[-1 - end] == b[-1 - end]:
+        end += 1
+    return a[start : len(a) - end], b[start : len(b) - end]
+
+
+def _full_weighted_edit_cost(a: str, b: str) -> float:
     m = len(a)
     n = len(b)
-    dp = [[0.0] * (n + 1) for _ in range(m + 1)]
-
-    for i in range(1, m + 1):
-        dp[i][0] = dp[i - 1][0] + 1.0
-    for j in range(1, n + 1):
-        dp[0][j] = dp[0][j - 1] + 1.0
+    # The OSA recurrence only reads rows i-2 and i-1, so three rotating rows replace
+    # the full (m+1) x (n+1) matrix.
+    before_previous = [0.0] * (n + 1)
+    previous = [float(j) for j in range(n + 1)]
+    current = [0.0] * (n + 1)
 
     for i in range(1, m + 1):
+        ca = a[i - 1]
+        # One lookup per row; the inner loop then indexes by a single character.
+        substitution_costs = _SUBSTITUTION_COSTS_BY_SOURCE.get(ca, _NO_DISCOUNTS)
+        current[0] = float(i)
         for j in range(1, n + 1):
-            replace_cost = 0.0 if a[i - 1] == b[j - 1] else _substitution_cost(a[i - 1], b[j - 1])
+            cb = b[j - 1]
+            replace_cost = 0.0 if ca == cb else substitution_costs.get(cb, 1.0)
             best = min(
-                dp[i - 1][j] + 1.0,
-                dp[i][j - 1] + 1.0,
-                dp[i - 1][j - 1] + replace_cost,
+                previous[j] + 1.0,
+                current[j - 1] + 1.0,
+                previous[j - 1] + replace_cost,
             )
-            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
-                best = min(best, dp[i - 2][j - 2] + 0.6)
-            dp[i][j] = best
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                best = min(best, before_previous[j - 2] + 0.6)
+            current[j] = best
+        before_previous, previous, current = previous, current, before_previous
+
+    return previous[n]
 
-    return dp[m][n]
 
+def _banded_weighted_edit_cost(a: str, b: str, k: int) -> float:
+    """Same recurrence restricted to |i - j| <= k; exact whenever the result is <= k.
 
-def _substitution_cost(source: str, target: str) -> float:
-    if (source, target) in _DANISH_SUBSTITUTION_COSTS:
-        return _DANISH_SUBSTITUTION_COSTS[(source, target)]
-    return 1.0
+    Insertions and deletions cost 1 and are the only steps that leave a diagonal, so
+    any alignment costing <= k stays inside the band. A larger result only means the
+    true cost also exceeds k, and may be returned early as infinity.
+    """
+    m = len(a)
+    n = len(b)
+    inf = math.inf
+    before_previous = [inf] * (n + 2)
+    previous = [float(j) if j <= k else inf for j in range(n + 2)]
+    current = [inf] * (n + 2)
+    previous_min = 0.0
+
+    for i in range(1, m + 1):
+        ca = a[i - 1]
+        # One lookup per row; the inner loop then indexes by a single character.
+        substitution_costs = _SUBSTITUTION_COSTS_BY_SOURCE.get(ca, _NO_DISCOUNTS)
+        lo = max(1, i - k)
+        hi = min(n, i + k)
+        current[lo - 1] = float(i) if lo == 1 and i <= k else inf
+        row_min = current[lo - 1]
+        for j in range(lo, hi + 1):
+            cb = b[j - 1]
+            replace_cost = 0.0 if ca == cb else substitution_costs.get(cb, 1.0)
+            best = min(
+                previous[j] + 1.0,
+                current[j - 1] + 1.0,
+                previous[j - 1] + replace_cost,
+            )
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                best = min(best, before_previous[j - 2] + 0.6)
+            current[j] = best
+            if best < row_min:
+                row_min = best
+        # Read as row i-1 next iteration, one column past its band.
+        current[hi + 1] = inf
+        # Every alignment passes through row i or i-1 (a transposition skips one row).
+        if row_min > k and previous_min > k:
+            return inf
+        previous_min = row_min
+        before_previous, previous, current = previous, current, before_previous
+
+    return previous[n]
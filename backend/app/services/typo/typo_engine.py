@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Literal
 
+from app.core.cache import LRUCache
 from app.db.migrations import get_connection
-from app.services.typo.cache import LRUCache
 from app.services.typo.candidates import CandidateProvider
 from app.services.typo.decision import decide_status
 from app.services.typo.gating import should_run_typo_check
@@ -16,6 +20,19 @@ from app.services.typo.ranking import rank_candidates
 
 
 TypoStatus = Literal["typo_likely", "uncertain", "new"]
+# Upper bound on how long the ignored-token set is trusted; an entry's expires_at can
+# bring the reload forward.
+_IGNORED_TOKENS_REFRESH_SECONDS = 60.0
+_SELECT_IGNORED_TOKENS_SQL = """
+SELECT token, (julianday(expires_at) - julianday('now')) * 86400.0 AS expires_in
+FROM ignored_tokens
+WHERE expires_at IS NULL OR expires_at > CURRENT_TIMESTAMP
+"""
+_INSERT_TOKEN_EVENT_SQL = """
+INSERT INTO token_events
+(raw_token, normalized_token, final_status, top_suggestion, confidence, latency_ms)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
 
 
 @dataclass(frozen=True)
@@ -24,6 +41,11 @@ class TypoSuggestion:
     score: float
     source_flags: tuple[str, ...]
 
+    @cached_property
+    def as_dict(self) -> dict[str, object]:
+        # Suggestions are immutable and shared via result caches; build the API payload once.
+        return {"value": self.value, "score": self.score, "source_flags": list(self.source_flags)}
+
 
 @dataclass(frozen=True)
 class TypoResult:
@@ -66,15 +88,22 @@ class TypoEngine:
         db_path: Path,
         dictionary_path: Path | None = None,
         dictionary_paths: tuple[Path, ...] | None = None,
+        index_cache_path: Path | None = None,
     ):
         self.db_path = db_path
         self.candidates = CandidateProvider(
             db_path=db_path,
             dictionary_path=dictionary_path,
             dictionary_paths=dictionary_paths,
+            index_cache_path=index_cache_path,
         )
-        self.cache = LRUCache[str, TypoResult](max_size=4096)
-        self._ignored_tokens_cache: set[str] | None = None
+        self.cache = LRUCache[tuple[str, bool], TypoResult](max_size=4096)
+        self._ignored_tokens_cache: frozenset[str] | None = None
+        self._ignored_tokens_reload_at = 0.0
+        self._known_lemmas_cache: set[str] | None = None
+        # Per-thread token_events buffer while inside batch(); the engine is shared by
+        # concurrent request workers.
+        self._event_batch = threading.local()
         self._decision_thresholds = _load_decision_thresholds()
 
     def classify_unknown(
@@ -114,7 +143,7 @@ class TypoEngine:
             self._log_event(token=token, result=result)
             return result
 
-        cache_key = f"{forms.normalized}|{int(sentence_start)}"
+        cache_key = (forms.normalized, sentence_start)
         cached = self.cache.get(cache_key)
         if cached is not None:
             return cached
@@ -142,7 +171,13 @@ class TypoEngine:
             max_distance=max_distance,
         )
         known_lemmas = self._known_lemmas()
-        ranked = rank_candidates(token=forms.normalized, candidates=candidates, known_lemmas=known_lemmas)
+        # decide_status reads the top two and only three suggestions are shown.
+        ranked = rank_candidates(
+            token=forms.normalized,
+            candidates=candidates,
+            known_lemmas=known_lemmas,
+            limit=3,
+        )
         decision = decide_status(
             ranked=ranked,
             proper_noun_bias=gating.proper_noun_bias,
@@ -171,11 +206,30 @@ class TypoEngine:
         self._log_event(token=token, result=result)
         return result
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Buffer token_events rows and write them in one transaction on exit."""
+        if getattr(self._event_batch, "rows", None) is not None:
+            yield
+            return
+        self._event_batch.rows = []
+        try:
+            yield
+        finally:
+            rows = self._event_batch.rows
+            self._event_batch.rows = None
+            self._write_events(rows)
+
     def add_user_lexeme(self, lemma: str) -> None:
         self.candidates.add_user_lexeme(lemma)
+        self._known_lemmas_cache = None
         self.cache.clear()
 
     def invalidate_cache(self) -> None:
+        # Called after lexemes change wholesale (e.g. a database reset), so the provider's
+        # user-lemma set must be re-read too.
+        self.candidates.refresh_user_lexicon()
+        self._known_lemmas_cache = None
         self.cache.clear()
 
     def add_ignored_token(self, token: str, *, scope: str = "global", expires_at: str | None = None) -> None:
@@ -192,8 +246,8 @@ class TypoEngine:
                 """,
                 (normalized, scope, expires_at),
             )
-        if self._ignored_tokens_cache is not None:
-            self._ignored_tokens_cache.add(normalized)
+        # Reload on the next check so the new entry's expires_at sets the reload deadline.
+        self.invalidate_ignored_tokens()
         self.cache.clear()
 
     def add_feedback(
@@ -214,46 +268,63 @@ class TypoEngine:
                 """,
                 (raw_token, predicted_status, json.dumps(suggestions_shown), user_action, chosen_value),
             )
+        self.invalidate_ignored_tokens()
+
+    def invalidate_ignored_tokens(self) -> None:
+        self._ignored_tokens_cache = None
+
+    def refresh_ignored_tokens(self) -> bool:
+        """Reload the ignored-token set once it is due; return True if it changed.
+
+        Callers that cache results derived from ignore decisions (the token classifier)
+        must drop them when this returns True, e.g. after an ignore has expired.
+        """
+        previous = self._ignored_tokens_cache
+        now = time.monotonic()
+        if previous is not None and now < self._ignored_tokens_reload_at:
+            return False
+        tokens, reload_in = self._ignored_tokens_from_db()
+        self._ignored_tokens_cache = tokens
+        self._ignored_tokens_reload_at = now + reload_in
+        return previous is not None and tokens != previous
 
     def _is_ignored(self, normalized: str) -> bool:
-        if self._ignored_tokens_cache is None:
-            self._ignored_tokens_cache = self._ignored_tokens_from_db()
-        return normalized in self._ignored_tokens_cache
+        self.refresh_ignored_tokens()
+        return normalized in (self._ignored_tokens_cache or frozenset())
 
-    def _ignored_tokens_from_db(self) -> set[str]:
+    def _ignored_tokens_from_db(self) -> tuple[frozenset[str], float]:
         with get_connection(self.db_path) as conn:
-            rows = conn.execute(
-                """
-                SELECT token
-                FROM ignored_tokens
-                WHERE expires_at IS NULL OR expires_at > CURRENT_TIMESTAMP
-                """
-            ).fetchall()
-        return {str(row["token"]) for row in rows}
+            rows = conn.execute(_SELECT_IGNORED_TOKENS_SQL).fetchall()
+        reload_in = _IGNORED_TOKENS_REFRESH_SECONDS
+        for row in rows:
+            if row["expires_in"] is not None:
+                reload_in = min(reload_in, max(float(row["expires_in"]), 0.0))
+        return frozenset(str(row["token"]) for row in rows), reload_in
 
     def _known_lemmas(self) -> set[str]:
-        with get_connection(self.db_path) as conn:
-            rows = conn.execute("SELECT lemma FROM lexemes").fetchall()
-        return {str(row["lemma"]) for row in rows}
+        # Lexeme writes go through add_user_lexeme/invalidate_cache, which reset this.
+        known_lemmas = self._known_lemmas_cache
+        if known_lemmas is None:
+            with get_connection(self.db_path) as conn:
+                rows = conn.execute("SELECT lemma FROM lexemes").fetchall()
+            known_lemmas = {str(row["lemma"]) for row in rows}
+            self._known_lemmas_cache = known_lemmas
+        return known_lemmas
 
     def _log_event(self, *, token: str, result: TypoResult) -> None:
         top = result.suggestions[0].value if result.suggestions else None
+        row = (token, result.normalized, result.status, top, result.confidence, result.latency_ms)
+        pending = getattr(self._event_batch, "rows", None)
+        if pending is not None:
+            pending.append(row)
+            return
+        self._write_events([row])
+
+    def _write_events(self, rows: list[tuple[object, ...]]) -> None:
+        if not rows:
+            return
         with get_connection(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO token_events
-                (raw_token, normalized_token, final_status, top_suggestion, confidence, latency_ms)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    token,
-                    result.normalized,
-                    result.status,
-                    top,
-                    result.confidence,
-                    result.latency_ms,
-                ),
-            )
+            conn.executemany(_INSERT_TOKEN_EVENT_SQL, rows)
 
     def _resolve_status_by_dictionary_membership(
         self,
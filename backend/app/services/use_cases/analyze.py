@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import sqlite3
+from contextlib import nullcontext
 
 from app.api.schemas.v1.analyze import AnalyzedToken
 from app.nlp.adapter import NLPAdapter
-from app.nlp.token_filter import is_wordlike_token
-from app.services.token_classifier import LemmaAwareClassifier
+from app.nlp.token_filter import filter_wordlike_tokens
+from app.services.token_classifier import ClassificationCache, LemmaAwareClassifier
 
 
 def strip_inline_comments(text: str) -> str:
@@ -17,67 +17,64 @@ def strip_inline_comments(text: str) -> str:
 
 
 class AnalyzeNoteUseCase:
-    def __init__(self, db_path, nlp_adapter: NLPAdapter, typo_engine=None):
+    def __init__(
+        self,
+        db_path,
+        nlp_adapter: NLPAdapter,
+        typo_engine=None,
+        classification_cache: ClassificationCache | None = None,
+        classifier: LemmaAwareClassifier | None = None,
+    ):
         self._db_path = db_path
         self._nlp_adapter = nlp_adapter
         self._typo_engine = typo_engine
+        self._classifier = classifier or LemmaAwareClassifier(
+            db_path,
+            nlp_adapter=nlp_adapter,
+            typo_engine=typo_engine,
+            cache=classification_cache,
+        )
 
     def execute(self, text: str) -> list[AnalyzedToken]:
         text_without_comments = strip_inline_comments(text)
-        classifier = LemmaAwareClassifier(
-            self._db_path,
-            nlp_adapter=self._nlp_adapter,
-            typo_engine=self._typo_engine,
-        )
+        classifier = self._classifier
 
-        token_metadata: list[tuple[str, str | None, str | None]] = []
-        for nlp_token in self._nlp_adapter.tokenize(text_without_comments):
-            surface = nlp_token.text
-            if not surface.strip():
-                continue
-            if nlp_token.is_punctuation:
-                continue
-            if not is_wordlike_token(surface):
-                continue
-            token_metadata.append((surface, nlp_token.pos, nlp_token.morphology))
+        token_metadata: list[tuple[str, str | None, str | None]] = [
+            (nlp_token.text, nlp_token.pos, nlp_token.morphology)
+            for nlp_token in filter_wordlike_tokens(self._nlp_adapter.tokenize(text_without_comments))
+        ]
 
         surfaces = [surface for surface, _, _ in token_metadata]
+        # Typo-check events for the whole note are written in one transaction.
+        typo_batch = getattr(self._typo_engine, "batch", None)
+        with typo_batch() if typo_batch is not None else nullcontext():
+            results = classifier.classify_many(surfaces)
 
-        tokens: list[AnalyzedToken] = []
-        try:
+        # Results come from our own classifier, so skip per-field validation on construction.
+        tokens: list[AnalyzedToken] = [
+            AnalyzedToken.model_construct(
+                surface_token=result.surface_token,
+                normalized_token=result.normalized_token,
+                lemma_candidate=result.lemma_candidate,
+                pos_tag=pos_tag,
+                morphology=morphology,
+                classification=result.classification,
+                match_source=result.match_source,
+                matched_lemma=result.matched_lemma,
+                matched_surface_form=result.matched_surface_form,
+                suggestions=[suggestion.as_dict for suggestion in result.suggestions],
+                confidence=result.confidence,
+                reason_tags=list(result.reason_tags),
+                status=result.classification,
+                surface=result.surface_token,
+                normalized=result.normalized_token,
+                lemma=result.matched_lemma or result.lemma_candidate,
+            )
             for result, (_, pos_tag, morphology) in zip(
-                classifier.classify_many(surfaces),
+                results,
                 token_metadata,
                 strict=True,
-            ):
-                tokens.append(
-                    AnalyzedToken(
-                        surface_token=result.surface_token,
-                        normalized_token=result.normalized_token,
-                        lemma_candidate=result.lemma_candidate,
-                        pos_tag=pos_tag,
-                        morphology=morphology,
-                        classification=result.classification,
-                        match_source=result.match_source,
-                        matched_lemma=result.matched_lemma,
-                        matched_surface_form=result.matched_surface_form,
-                        suggestions=[
-                            {
-                                "value": suggestion.value,
-                                "score": suggestion.score,
-                                "source_flags": list(suggestion.source_flags),
-                            }
-                            for suggestion in result.suggestions
-                        ],
-                        confidence=result.confidence,
-                        reason_tags=list(result.reason_tags),
-                        status=result.classification,
-                        surface=result.surface_token,
-                        normalized=result.normalized_token,
-                        lemma=result.matched_lemma or result.lemma_candidate,
-                    )
-                )
-        except sqlite3.OperationalError:
-            raise
+            )
+        ]
 
         return tokens
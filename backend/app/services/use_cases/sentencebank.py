@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sqlite3
 from typing import Literal
 
 from app.api.schemas.v1.sentencebank import (
@@ -8,6 +9,7 @@ from app.api.schemas.v1.sentencebank import (
     SentenceSummary,
 )
 from app.db.migrations import get_connection
+from app.db.pool import ConnectionPool
 from app.services.token_classifier import normalize_token
 from app.services.translation import TranslationService
 
@@ -21,9 +23,11 @@ class SentencebankUseCase:
         self,
         db_path,
         translation_service: TranslationService | None = None,
+        connection_pool: ConnectionPool | None = None,
     ):
         self._db_path = db_path
         self._translation_service = translation_service
+        self._connection_pool = connection_pool
 
     def add_sentence(self, source_text: str) -> AddSentenceResponse:
         normalized_source_text = _normalize_sentence_text(source_text)
@@ -31,7 +35,7 @@ class SentencebankUseCase:
         if not normalized_source_text or not normalized_key:
             raise ValueError("source_text is required")
 
-        with get_connection(self._db_path) as conn:
+        with self._connect() as conn:
             existing = conn.execute(
                 """
                 SELECT source_sentence, english_translation
@@ -79,7 +83,7 @@ class SentencebankUseCase:
         )
 
     def list_sentences(self) -> SentenceListResponse:
-        with get_connection(self._db_path) as conn:
+        with self._connect(read_only=True) as conn:
             rows = conn.execute(
                 """
                 SELECT id, source_sentence, english_translation, created_at
@@ -100,6 +104,13 @@ class SentencebankUseCase:
             ]
         )
 
+    def _connect(self, *, read_only: bool = False) -> sqlite3.Connection:
+        if self._connection_pool is not None:
+            if read_only:
+                return self._connection_pool.read_connection()
+            return self._connection_pool.connection()
+        return get_connection(self._db_path)
+
     def _lookup_translation(self, source_text: str) -> str | None:
         if self._translation_service is None:
             return None
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-import os
+import sqlite3
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
 from typing import Literal
 
+import orjson
+
 from app.api.schemas.v1.wordbank import (
     AddWordResponse,
     GeneratePhraseTranslationResponse,
@@ -14,11 +20,108 @@ from app.api.schemas.v1.wordbank import (
     ResetDatabaseResponse,
 )
 from app.db.migrations import apply_migrations, get_connection
+from app.db.pool import ConnectionPool
 from app.nlp.adapter import NLPAdapter
-from app.nlp.token_filter import is_wordlike_token
-from app.services.token_classifier import normalize_token
+from app.nlp.token_filter import filter_wordlike_tokens
+from app.services.token_classifier import (
+    ClassificationCache,
+    WordbankSnapshotCache,
+    normalize_token,
+)
 from app.services.translation import TranslationService
 
+# Source tag for words added through the API; one shared constant for SQL params and responses.
+_MANUAL_SOURCE: Literal["manual"] = "manual"
+
+# Wordbank statements, shared by all calls; pooled connections keep them prepared
+# in their statement cache for the lifetime of the worker thread.
+# RETURNING is only attached where the row is consumed (the id, and whether the write
+# inserted); statements whose outcome is unused return nothing for SQLite to materialize.
+_INSERT_LEXEME_SQL = """
+INSERT INTO lexemes (lemma, source, english_translation, translation_provider)
+VALUES (?, ?, ?, ?)
+ON CONFLICT (lemma) DO NOTHING
+RETURNING id
+"""
+_SELECT_LEXEME_ID_SQL = "SELECT id FROM lexemes WHERE lemma = ?"
+_UPDATE_LEXEME_TRANSLATION_SQL = """
+UPDATE lexemes
+SET english_translation = ?, translation_provider = 'deepl'
+WHERE lemma = ?
+RETURNING id
+"""
+_EXISTING_WORD_SQL = """
+SELECT
+    l.english_translation AS lemma_translation,
+    sf.id AS surface_form_id,
+    sf.english_translation AS surface_translation
+FROM lexemes l
+LEFT JOIN surface_forms sf ON sf.lexeme_id = l.id AND sf.form = ?
+WHERE l.lemma = ?
+"""
+_INSERT_SURFACE_FORM_SQL = """
+INSERT INTO surface_forms (
+    lexeme_id,
+    form,
+    source,
+    english_translation,
+    translation_provider,
+    seen_count,
+    last_seen_at
+)
+VALUES (?, ?, ?, ?, ?, 1, CURRENT_TIMESTAMP)
+ON CONFLICT (lexeme_id, form) DO NOTHING
+RETURNING id
+"""
+_TOUCH_SURFACE_FORM_SQL = """
+UPDATE surface_forms
+SET seen_count = seen_count + 1,
+    last_seen_at = CURRENT_TIMESTAMP,
+    english_translation = COALESCE(?1, english_translation),
+    translation_provider = CASE WHEN ?1 IS NULL THEN translation_provider ELSE 'deepl' END
+WHERE lexeme_id = ?2 AND form = ?3
+"""
+_LIST_LEMMAS_SQL = """
+SELECT
+    lemma,
+    CASE
+        WHEN translation_provider = 'deepl' THEN english_translation
+        ELSE NULL
+    END AS english_translation,
+    variation_count
+FROM lexemes
+ORDER BY lemma COLLATE NOCASE
+"""
+_LEMMA_DETAILS_SQL = """
+SELECT
+    l.lemma,
+    CASE
+        WHEN l.translation_provider = 'deepl' THEN l.english_translation
+        ELSE NULL
+    END AS english_translation,
+    sf.form,
+    CASE
+        WHEN sf.translation_provider = 'deepl' THEN sf.english_translation
+        ELSE NULL
+    END AS form_english_translation
+FROM lexemes l
+LEFT JOIN surface_forms sf ON sf.lexeme_id = l.id
+WHERE l.lemma = ?
+ORDER BY sf.form COLLATE NOCASE
+"""
+
+
+@lru_cache(maxsize=8192)
+def _normalize_word(surface_token: str, lemma_candidate: str | None) -> tuple[str, str]:
+    """Return (stored_lemma, normalized_surface); learners re-add the same pairs often."""
+    normalized_surface = normalize_token(surface_token)
+    normalized_lemma = normalize_token(lemma_candidate or "")
+    stored_lemma = normalized_lemma or normalized_surface
+
+    if not stored_lemma:
+        raise ValueError("surface_token or lemma_candidate is required")
+    return stored_lemma, normalized_surface
+
 
 class WordbankUseCase:
     def __init__(
@@ -27,101 +130,162 @@ class WordbankUseCase:
         typo_engine=None,
         translation_service: TranslationService | None = None,
         nlp_adapter: NLPAdapter | None = None,
+        classification_cache: ClassificationCache | None = None,
+        connection_pool: ConnectionPool | None = None,
+        write_lock: threading.Lock | None = None,
+        wordbank_snapshot: WordbankSnapshotCache | None = None,
     ):
         self._db_path = db_path
         self._typo_engine = typo_engine
         self._translation_service = translation_service
         self._nlp_adapter = nlp_adapter
+        self._classification_cache = classification_cache
+        self._connection_pool = connection_pool
+        self._write_lock = write_lock or threading.Lock()
+        self._wordbank_snapshot = wordbank_snapshot
 
     def add_word(self, surface_token: str, lemma_candidate: str | None) -> AddWordResponse:
-        normalized_surface = normalize_token(surface_token)
-        normalized_lemma = normalize_token(lemma_candidate or "")
-        stored_lemma = normalized_lemma or normalized_surface
+        stored_lemma, normalized_surface = _normalize_word(surface_token, lemma_candidate)
+
+        if self._is_already_stored(stored_lemma, normalized_surface):
+            # Repeat vocabulary is the common case; answer it from a read connection
+            # without translation lookups or taking the writer lock.
+            return self._add_word_response(stored_lemma, normalized_surface, inserted=False)
+
+        translations = self._lookup_translations([stored_lemma, normalized_surface])
+        lemma_translation = translations.get(stored_lemma)
+        surface_translation = translations.get(normalized_surface) if normalized_surface else None
+
+        # SQLite allows one writer; queueing on a shared lock keeps concurrent adds from
+        # holding pooled connections while they wait on the database's busy handler.
+        # Translation lookups above stay outside the lock.
+        with self._write_lock, self._connect() as conn:
+            # Take the write lock up front so every statement below lands in one transaction
+            # and can never hit SQLITE_BUSY upgrading from a read lock halfway through; the
+            # connection context commits it, or rolls it back if a statement fails.
+            conn.execute("BEGIN IMMEDIATE")
+            inserted = self._write_word(
+                conn,
+                stored_lemma,
+                normalized_surface,
+                lemma_translation,
+                surface_translation,
+            )
 
-        if not stored_lemma:
-            raise ValueError("surface_token or lemma_candidate is required")
+        self._on_words_inserted([stored_lemma] if inserted else [])
+        return self._add_word_response(stored_lemma, normalized_surface, inserted=inserted)
 
-        inserted_lexeme = False
-        inserted_surface_form = False
-        lemma_translation = self._lookup_translation(stored_lemma)
-        surface_translation = self._lookup_translation(normalized_surface) if normalized_surface else None
+    def add_words(self, words: list[tuple[str, str | None]]) -> list[AddWordResponse]:
+        """Add several (surface_token, lemma_candidate) pairs in one write transaction."""
+        # Validate the whole batch before writing anything.
+        normalized_words = [_normalize_word(surface, lemma) for surface, lemma in words]
 
-        with get_connection(self._db_path) as conn:
-            cursor = conn.execute(
-                """
-                INSERT OR IGNORE INTO lexemes (lemma, source, english_translation, translation_provider)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
+        translations = self._lookup_translations(
+            [value for pair in normalized_words for value in pair]
+        )
+
+        with self._write_lock, self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            inserted_flags = [
+                self._write_word(
+                    conn,
                     stored_lemma,
-                    "manual",
-                    lemma_translation,
-                    "deepl" if lemma_translation else None,
-                ),
-            )
-            inserted_lexeme = cursor.rowcount == 1
+                    normalized_surface,
+                    translations[stored_lemma],
+                    translations.get(normalized_surface),
+                )
+                for stored_lemma, normalized_surface in normalized_words
+            ]
 
-            lexeme_row = conn.execute(
-                "SELECT id FROM lexemes WHERE lemma = ?",
-                (stored_lemma,),
-            ).fetchone()
-            if lexeme_row is None:
-                raise RuntimeError("Failed to create or load lexeme")
+        self._on_words_inserted(
+            [stored_lemma for (stored_lemma, _), inserted in zip(normalized_words, inserted_flags, strict=True) if inserted]
+        )
+        return [
+            self._add_word_response(stored_lemma, normalized_surface, inserted=inserted)
+            for (stored_lemma, normalized_surface), inserted in zip(normalized_words, inserted_flags, strict=True)
+        ]
 
+    def _write_word(
+        self,
+        conn: sqlite3.Connection,
+        stored_lemma: str,
+        normalized_surface: str,
+        lemma_translation: str | None,
+        surface_translation: str | None,
+    ) -> bool:
+        # RETURNING hands back the new id directly; a conflict returns no row, and only
+        # then is the existing lexeme looked up (or updated with its fresh translation).
+        lexeme_row = conn.execute(
+            _INSERT_LEXEME_SQL,
+            (
+                stored_lemma,
+                _MANUAL_SOURCE,
+                lemma_translation,
+                "deepl" if lemma_translation else None,
+            ),
+        ).fetchone()
+        inserted_lexeme = lexeme_row is not None
+        if not inserted_lexeme:
             if lemma_translation:
-                conn.execute(
-                    """
-                    UPDATE lexemes
-                    SET english_translation = ?, translation_provider = 'deepl'
-                    WHERE id = ?
-                    """,
-                    (lemma_translation, lexeme_row["id"]),
-                )
+                lexeme_row = conn.execute(
+                    _UPDATE_LEXEME_TRANSLATION_SQL,
+                    (lemma_translation, stored_lemma),
+                ).fetchone()
+            else:
+                lexeme_row = conn.execute(_SELECT_LEXEME_ID_SQL, (stored_lemma,)).fetchone()
+        if lexeme_row is None:
+            raise RuntimeError("Failed to create or load lexeme")
+        lexeme_id = lexeme_row[0]
 
-            if normalized_surface:
-                cursor = conn.execute(
-                    """
-                    INSERT OR IGNORE INTO surface_forms (
-                        lexeme_id,
-                        form,
-                        source,
-                        english_translation,
-                        translation_provider
-                    )
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (
-                        lexeme_row["id"],
-                        normalized_surface,
-                        "manual",
-                        surface_translation,
-                        "deepl" if surface_translation else None,
-                    ),
-                )
-                inserted_surface_form = cursor.rowcount == 1
-                conn.execute(
-                    """
-                    UPDATE surface_forms
-                    SET seen_count = seen_count + 1,
-                        last_seen_at = CURRENT_TIMESTAMP
-                    WHERE lexeme_id = ? AND form = ?
-                    """,
-                    (lexeme_row["id"], normalized_surface),
-                )
-                if surface_translation:
-                    conn.execute(
-                        """
-                        UPDATE surface_forms
-                        SET english_translation = ?, translation_provider = 'deepl'
-                        WHERE lexeme_id = ? AND form = ?
-                        """,
-                        (surface_translation, lexeme_row["id"], normalized_surface),
-                    )
-
-        inserted = inserted_lexeme or inserted_surface_form
-        if self._typo_engine is not None and inserted:
-            self._typo_engine.add_user_lexeme(stored_lemma)
+        if not normalized_surface:
+            return inserted_lexeme
 
+        inserted_surface_form = (
+            conn.execute(
+                _INSERT_SURFACE_FORM_SQL,
+                (
+                    lexeme_id,
+                    normalized_surface,
+                    _MANUAL_SOURCE,
+                    surface_translation,
+                    "deepl" if surface_translation else None,
+                ),
+            ).fetchone()
+            is not None
+        )
+        if not inserted_surface_form:
+            conn.execute(
+                _TOUCH_SURFACE_FORM_SQL,
+                (surface_translation or None, lexeme_id, normalized_surface),
+            )
+        return inserted_lexeme or inserted_surface_form
+
+    def _on_words_inserted(self, stored_lemmas: list[str]) -> None:
+        if not stored_lemmas:
+            return
+        if self._typo_engine is not None:
+            for stored_lemma in dict.fromkeys(stored_lemmas):
+                self._typo_engine.add_user_lexeme(stored_lemma)
+        if self._wordbank_snapshot is not None:
+            self._wordbank_snapshot.invalidate()
+        if self._classification_cache is not None:
+            self._classification_cache.clear()
+
+    def _is_already_stored(self, stored_lemma: str, normalized_surface: str) -> bool:
+        with self._connect(read_only=True) as conn:
+            row = conn.execute(_EXISTING_WORD_SQL, (normalized_surface, stored_lemma)).fetchone()
+        if row is None:
+            return False
+        if normalized_surface and row["surface_form_id"] is None:
+            return False
+        if self._translation_service is None:
+            return True
+        # With translations available, a repeat add still backfills any that are missing.
+        return bool(row["lemma_translation"]) and (
+            not normalized_surface or bool(row["surface_translation"])
+        )
+
+    def _add_word_response(self, stored_lemma: str, normalized_surface: str, *, inserted: bool) -> AddWordResponse:
         status: Literal["inserted", "exists"] = "inserted" if inserted else "exists"
         message = (
             f"Added '{stored_lemma}' to wordbank."
@@ -129,11 +293,12 @@ class WordbankUseCase:
             else f"'{stored_lemma}' is already in the wordbank."
         )
 
-        return AddWordResponse(
+        # Every field is built here from already-normalized values, so skip revalidation.
+        return AddWordResponse.model_construct(
             status=status,
             stored_lemma=stored_lemma,
             stored_surface_form=normalized_surface or None,
-            source="manual",
+            source=_MANUAL_SOURCE,
             message=message,
         )
 
@@ -147,7 +312,7 @@ class WordbankUseCase:
 
         english_translation = self._lookup_translation(normalized_surface)
         if english_translation:
-            with get_connection(self._db_path) as conn:
+            with self._connect() as conn:
                 conn.execute(
                     """
                     UPDATE surface_forms
@@ -169,7 +334,7 @@ class WordbankUseCase:
         if not normalized_source_text:
             raise ValueError("source_text is required")
 
-        with get_connection(self._db_path) as conn:
+        with self._connect() as conn:
             existing = conn.execute(
                 """
                 SELECT english_translation
@@ -223,82 +388,57 @@ class WordbankUseCase:
         )
 
     def list_lemmas(self) -> LemmaListResponse:
-        with get_connection(self._db_path) as conn:
-            rows = conn.execute(
-                """
-                SELECT
-                    l.lemma,
-                    CASE
-                        WHEN l.translation_provider = 'deepl' THEN l.english_translation
-                        ELSE NULL
-                    END AS english_translation,
-                    COUNT(sf.id) AS variation_count
-                FROM lexemes l
-                LEFT JOIN surface_forms sf ON sf.lexeme_id = l.id
-                GROUP BY l.id, l.lemma
-                ORDER BY l.lemma COLLATE NOCASE
-                """
-            ).fetchall()
-
         return LemmaListResponse(
             items=[
-                LemmaSummary(
-                    lemma=row["lemma"],
-                    english_translation=row["english_translation"],
-                    variation_count=int(row["variation_count"]),
-                )
-                for row in rows
+                LemmaSummary(lemma=row[0], english_translation=row[1], variation_count=row[2])
+                for row in self._lemma_rows()
             ]
         )
 
+    def list_lemmas_json(self) -> bytes:
+        """Same payload as list_lemmas, encoded straight from the rows without model instances."""
+        return orjson.dumps(
+            {
+                "items": [
+                    {"lemma": row[0], "english_translation": row[1], "variation_count": row[2]}
+                    for row in self._lemma_rows()
+                ]
+            }
+        )
+
+    def _lemma_rows(self) -> list[tuple[str, str | None, int]]:
+        with self._connect(read_only=True) as conn:
+            # Plain tuples: positional access skips sqlite3.Row's per-key name lookup.
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            return cursor.execute(_LIST_LEMMAS_SQL).fetchall()
+
     def get_lemma_details(self, lemma: str) -> LemmaDetailsResponse:
         normalized_lemma = normalize_token(lemma)
         if not normalized_lemma:
             raise ValueError("lemma is required")
 
-        with get_connection(self._db_path) as conn:
-            lexeme_row = conn.execute(
-                """
-                SELECT
-                    id,
-                    lemma,
-                    CASE
-                        WHEN translation_provider = 'deepl' THEN english_translation
-                        ELSE NULL
-                    END AS english_translation
-                FROM lexemes
-                WHERE lemma = ?
-                """,
+        with self._connect(read_only=True) as conn:
+            rows = conn.execute(
+                _LEMMA_DETAILS_SQL,
                 (normalized_lemma,),
-            ).fetchone()
-
-            if lexeme_row is None:
-                raise LookupError(f"Lemma '{normalized_lemma}' was not found")
-
-            form_rows = conn.execute(
-                """
-                SELECT
-                    form,
-                    CASE
-                        WHEN translation_provider = 'deepl' THEN english_translation
-                        ELSE NULL
-                    END AS english_translation
-                FROM surface_forms
-                WHERE lexeme_id = ?
-                ORDER BY form COLLATE NOCASE
-                """,
-                (lexeme_row["id"],),
             ).fetchall()
 
+        if not rows:
+            raise LookupError(f"Lemma '{normalized_lemma}' was not found")
+
+        lexeme_row = rows[0]
         lemma_pos_tag, lemma_morphology = self._extract_pos_and_morphology(lexeme_row["lemma"])
 
         surface_forms: list[LemmaDetailsResponse.SurfaceFormDetails] = []
-        for row in form_rows:
+        for row in rows:
+            if row["form"] is None:
+                continue
             pos_tag, morphology = self._extract_pos_and_morphology(row["form"])
             surface_forms.append(
                 LemmaDetailsResponse.SurfaceFormDetails(
                     form=row["form"],
-                    english_translation=row["english_translation"],
+                    english_translation=row["form_english_translation"],
                     pos_tag=pos_tag,
                     morphology=morphology,
                 )
@@ -313,18 +453,37 @@ class WordbankUseCase:
         )
 
 
+    def _replace_with_fresh_database(self) -> None:
+        """Overwrite the database in place with a freshly migrated copy.
+
+        The file is not deleted: connections still open on other threads would keep the
+        unlinked file, and closing them later could remove the new database's -wal file.
+        The backup API writes through SQLite's own locking, so they simply see the new pages.
+        """
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self._db_path.parent) as scratch_dir:
+            fresh_path = Path(scratch_dir) / self._db_path.name
+            apply_migrations(fresh_path)
+            source = sqlite3.connect(fresh_path)
+            target = get_connection(self._db_path)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+                source.close()
+
+    def _connect(self, *, read_only: bool = False) -> sqlite3.Connection:
+        if self._connection_pool is not None:
+            if read_only:
+                return self._connection_pool.read_connection()
+            return self._connection_pool.connection()
+        return get_connection(self._db_path)
+
     def _extract_pos_and_morphology(self, value: str) -> tuple[str | None, str | None]:
         if self._nlp_adapter is None:
             return None, None
 
-        for token in self._nlp_adapter.tokenize(value):
-            surface = token.text
-            if not surface.strip():
-                continue
-            if token.is_punctuation:
-                continue
-            if not is_wordlike_token(surface):
-                continue
+        for token in filter_wordlike_tokens(self._nlp_adapter.tokenize(value)):
             return token.pos, token.morphology
 
         return None, None
@@ -339,6 +498,18 @@ class WordbankUseCase:
         except Exception:
             return None
 
+    def _lookup_translations(self, source_words: list[str]) -> dict[str, str | None]:
+        """Translate distinct non-empty words, in one batched call when the service supports it."""
+        unique = [word for word in dict.fromkeys(source_words) if word]
+        translate_batch = getattr(self._translation_service, "translate_da_to_en_batch", None)
+        if not unique or not callable(translate_batch):
+            return {word: self._lookup_translation(word) for word in unique}
+
+        try:
+            return dict(zip(unique, translate_batch(unique), strict=True))
+        except Exception:
+            return dict.fromkeys(unique)
+
     def _lookup_reverse_translation(self, source_word: str) -> str | None:
         if self._translation_service is None:
             return None
@@ -353,11 +524,18 @@ class WordbankUseCase:
             return None
 
     def reset_database(self) -> ResetDatabaseResponse:
-        if self._db_path.exists():
-            os.remove(self._db_path)
-        apply_migrations(self._db_path)
-        if self._typo_engine is not None:
-            self._typo_engine.invalidate_cache()
+        # Held throughout so no add_word writes into the database while it is replaced.
+        with self._write_lock:
+            if self._connection_pool is not None:
+                # Retire pooled connections; each owning thread reopens on its next checkout.
+                self._connection_pool.close_all()
+            self._replace_with_fresh_database()
+            if self._typo_engine is not None:
+                self._typo_engine.invalidate_cache()
+            if self._wordbank_snapshot is not None:
+                self._wordbank_snapshot.invalidate()
+            if self._classification_cache is not None:
+                self._classification_cache.clear()
 
         return ResetDatabaseResponse(
             status="reset",
@@ -0,0 +1,28 @@
+ALTER TABLE lexemes ADD COLUMN variation_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE lexemes
+SET variation_count = (
+  SELECT COUNT(*)
+  FROM surface_forms sf
+  WHERE sf.lexeme_id = lexemes.id
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_surface_forms_variation_count_insert
+AFTER INSERT ON surface_forms
+BEGIN
+  UPDATE lexemes SET variation_count = variation_count + 1 WHERE id = NEW.lexeme_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_surface_forms_variation_count_delete
+AFTER DELETE ON surface_forms
+BEGIN
+  UPDATE lexemes SET variation_count = variation_count - 1 WHERE id = OLD.lexeme_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_surface_forms_variation_count_move
+AFTER UPDATE OF lexeme_id ON surface_forms
+WHEN NEW.lexeme_id IS NOT OLD.lexeme_id
+BEGIN
+  UPDATE lexemes SET variation_count = variation_count - 1 WHERE id = OLD.lexeme_id;
+  UPDATE lexemes SET variation_count = variation_count + 1 WHERE id = NEW.lexeme_id;
+END;
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 
 import pytest
 from fastapi.testclient import TestClient
 
 from app.core.config import Settings
+from app.db import migrations
 from app.db.migrations import apply_migrations, get_connection
+from app.db.pool import ConnectionPool
 from app.db.seed import seed_starter_data
 from app.main import create_app
 
@@ -46,6 +49,38 @@ def test_db_init_creates_expected_tables(tmp_path) -> None:
     }.issubset(table_names)
 
 
+def test_migrated_db_uses_wal_with_busy_timeout(tmp_path) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+
+    apply_migrations(db_path)
+
+    conn = get_connection(db_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    finally:
+        conn.close()
+
+
+def test_pending_migrations_apply_in_one_transaction(tmp_path, monkeypatch) -> None:
+    good = tmp_path / "001_good.sql"
+    good.write_text("CREATE TABLE good (id INTEGER PRIMARY KEY)", encoding="utf-8")
+    bad = tmp_path / "002_bad.sql"
+    bad.write_text("ALTER TABLE missing ADD COLUMN nope TEXT", encoding="utf-8")
+    monkeypatch.setattr(migrations, "_MIGRATION_FILES", (good, bad))
+    db_path = tmp_path / "danote.sqlite3"
+
+    with pytest.raises(sqlite3.OperationalError):
+        apply_migrations(db_path)
+
+    with get_connection(db_path) as conn:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        versions = conn.execute("SELECT COUNT(*) FROM schema_migrations").fetchone()[0]
+    assert "good" not in tables
+    assert versions == 0
+
+
 def test_backend_startup_recreates_db_after_delete(tmp_path, stub_nlp_adapter_factory) -> None:
     db_path = tmp_path / "danote.sqlite3"
     settings = _test_settings(db_path)
@@ -115,3 +150,118 @@ def test_uniqueness_constraints_reject_duplicates(tmp_path) -> None:
                 "INSERT INTO ignored_tokens (token, scope) VALUES (?, ?)",
                 ("plc", "global"),
             )
+
+
+def test_connection_pool_reuses_wal_connection_per_thread(tmp_path) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    pool = ConnectionPool(db_path)
+
+    first = pool.connection()
+    assert pool.connection() is first
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    pool.close_all()
+    reopened = pool.connection()
+    assert reopened is not first
+    assert reopened.execute("SELECT COUNT(*) FROM lexemes").fetchone()[0] == 0
+    pool.close()
+
+
+def test_pooled_connections_map_the_database_file(tmp_path) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    pool = ConnectionPool(db_path)
+
+    for conn in (pool.connection(), pool.read_connection()):
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -131072
+    assert pool.connection().execute("PRAGMA page_size").fetchone()[0] == 4096
+    pool.close()
+
+
+def test_variation_count_tracks_surface_form_inserts_and_deletes(tmp_path) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+
+    with get_connection(db_path) as conn:
+        conn.execute("INSERT INTO lexemes (lemma) VALUES ('bog')")
+        lexeme_id = conn.execute("SELECT id FROM lexemes WHERE lemma = 'bog'").fetchone()["id"]
+        conn.executemany(
+            "INSERT INTO surface_forms (lexeme_id, form) VALUES (?, ?)",
+            [(lexeme_id, "bogen"), (lexeme_id, "bøger")],
+        )
+        after_insert = conn.execute("SELECT variation_count FROM lexemes WHERE id = ?", (lexeme_id,)).fetchone()
+        conn.execute("DELETE FROM surface_forms WHERE form = 'bogen'")
+        after_delete = conn.execute("SELECT variation_count FROM lexemes WHERE id = ?", (lexeme_id,)).fetchone()
+
+    assert after_insert["variation_count"] == 2
+    assert after_delete["variation_count"] == 1
+
+
+def test_wordbank_lookups_search_unique_indexes(tmp_path) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+
+    with get_connection(db_path) as conn:
+        lemma_plan = " ".join(
+            str(row["detail"])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM lexemes WHERE lemma = ?",
+                ("bog",),
+            ).fetchall()
+        )
+        form_plan = " ".join(
+            str(row["detail"])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM surface_forms WHERE lexeme_id = ? AND form = ?",
+                (1, "bogen"),
+            ).fetchall()
+        )
+
+    assert "USING COVERING INDEX sqlite_autoindex_lexemes_1" in lemma_plan
+    assert "USING COVERING INDEX sqlite_autoindex_surface_forms_1" in form_plan
+
+
+def test_connection_pool_read_connection_rejects_writes(tmp_path) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    pool = ConnectionPool(db_path)
+
+    reader = pool.read_connection()
+    assert reader is pool.read_connection()
+    assert reader is not pool.connection()
+    with pytest.raises(sqlite3.OperationalError):
+        reader.execute("INSERT INTO lexemes (lemma) VALUES ('bog')")
+    pool.close()
+
+
+def test_connection_pool_close_all_leaves_other_threads_connections_open(tmp_path) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    pool = ConnectionPool(db_path)
+    checked_out = threading.Event()
+    retired = threading.Event()
+    results: dict[str, object] = {}
+
+    def worker() -> None:
+        conn = pool.connection()
+        checked_out.set()
+        retired.wait()
+        # Still usable mid-"request" after another thread retired the pool.
+        results["count"] = conn.execute("SELECT COUNT(*) FROM lexemes").fetchone()[0]
+        results["reopened"] = pool.connection() is not conn
+        try:
+            conn.execute("SELECT 1")
+        except sqlite3.ProgrammingError:
+            results["stale_closed"] = True
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    checked_out.wait()
+    pool.close_all()
+    retired.set()
+    thread.join()
+
+    assert results == {"count": 0, "reopened": True, "stale_closed": True}
+    pool.close()
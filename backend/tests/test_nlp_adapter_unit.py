@@ -1,11 +1,25 @@
 from __future__ import annotations
 
 import sys
+import threading
+import time
 import types
 
+import pytest
+
 from app.core.config import Settings
+from app.nlp.adapter import NLPToken
+from app.nlp import danish
+from app.nlp.batching import BatchingNLPAdapter
 from app.nlp.danish import DaCyLemmyNLPAdapter
 from app.nlp.danish import load_danish_nlp_adapter
+from app.nlp.lemma_candidate_ranker import (
+    merge_candidates,
+    normalize_candidate,
+    pick_best_candidate,
+    rank_candidates,
+    rank_candidates_batched,
+)
 
 
 class _FakeToken:
@@ -92,6 +106,139 @@ def test_adapter_tokenize_exposes_pos_and_morphology(monkeypatch) -> None:
     assert token.morphology == "Case=Nom|Person=1"
 
 
+def test_adapter_caches_lemma_candidates_per_surface(monkeypatch) -> None:
+    fake_nlp = _FakeNLP()
+    calls: list[str] = []
+    original_call = fake_nlp.__class__.__call__
+    monkeypatch.setattr(_FakeNLP, "__call__", lambda self, text: calls.append(text) or original_call(self, text))
+    monkeypatch.setitem(sys.modules, "dacy", types.SimpleNamespace(load=lambda _model: fake_nlp))
+    monkeypatch.setitem(sys.modules, "lemmy", types.SimpleNamespace(load=lambda _lang: _FakeLemmy()))
+    monkeypatch.setattr(danish, "package_version", lambda _name: "3.7.0")
+
+    adapter = DaCyLemmyNLPAdapter("fake-model")
+
+    first = adapter.lemma_candidates_for_token("bogen")
+    first.append("mutated")
+
+    assert adapter.lemma_candidates_for_token(" bogen ")[0] == "bog"
+    assert "mutated" not in adapter.lemma_candidates_for_token("bogen")
+    assert adapter.lemma_for_token("bogen") == "bog"
+    assert calls == ["bogen"]
+
+
+def test_adapter_caches_lemmatizer_output_per_word_class(monkeypatch) -> None:
+    lemmatize_calls: list[tuple[str, str]] = []
+
+    class _CountingLemmy(_FakeLemmy):
+        def lemmatize(self, word_class: str, full_form: str):
+            lemmatize_calls.append((word_class, full_form))
+            return super().lemmatize(word_class, full_form)
+
+    monkeypatch.setitem(sys.modules, "dacy", types.SimpleNamespace(load=lambda _model: _FakeNLP()))
+    monkeypatch.setitem(sys.modules, "lemmy", types.SimpleNamespace(load=lambda _lang: _CountingLemmy()))
+    monkeypatch.setattr(danish, "package_version", lambda _name: "3.7.0")
+
+    adapter = DaCyLemmyNLPAdapter("fake-model")
+    adapter.tokenize("hus")
+    adapter.tokenize("hus")
+
+    assert adapter.lemma_for_token("hus") == "hus"
+    assert lemmatize_calls == [("NOUN", "hus"), ("", "hus")]
+
+
+def test_adapter_batches_uncached_lemma_candidates_through_pipe(monkeypatch) -> None:
+    fake_nlp = _FakeNLP()
+    piped: list[list[str]] = []
+
+    def pipe(texts, batch_size):
+        texts = list(texts)
+        piped.append(texts)
+        return [fake_nlp(text) for text in texts]
+
+    fake_nlp.pipe = pipe
+    monkeypatch.setitem(sys.modules, "dacy", types.SimpleNamespace(load=lambda _model: fake_nlp))
+    monkeypatch.setitem(sys.modules, "lemmy", types.SimpleNamespace(load=lambda _lang: _FakeLemmy()))
+    monkeypatch.setattr(danish, "package_version", lambda _name: "3.7.0")
+
+    adapter = DaCyLemmyNLPAdapter("fake-model")
+    adapter.lemma_candidates_for_token("kan")
+
+    batched = adapter.lemma_candidates_many(["bogen", "kan", "", "bogen"])
+
+    assert [candidates[:1] for candidates in batched] == [["bog"], ["kunne"], [], ["bog"]]
+    assert piped == [["bogen"]]
+
+
+def test_rank_candidates_batched_matches_per_token_ranking() -> None:
+    surfaces = ["Bogen", "bogen", "hus", "kan"]
+    tags = ["NOUN", "noun", "NOUN", "AUX"]
+    candidate_lists = [["bogen", "bog"], ["bogen", "bog"], ["hu", "hus"], ["kan", "kunne"]]
+    primary_lists = [["bog"], ["bog"], ["hu"], None]
+
+    batched = rank_candidates_batched(surfaces, tags, candidate_lists, primary_lists)
+    batched[0].append("mutated")
+
+    assert batched[1:] == [
+        rank_candidates(surface, tag, candidates, primary)
+        for surface, tag, candidates, primary in list(zip(surfaces, tags, candidate_lists, primary_lists))[1:]
+    ]
+    assert "mutated" not in batched[1]
+
+
+def test_pick_best_candidate_matches_top_of_full_ranking() -> None:
+    cases = [
+        ("hus", "NOUN", ["hu"], ["hus", "hu", "huse"]),
+        ("husets", "X", ["husets"], ["hus"]),
+        ("lærer", "NOUN", ["lærer", "lære"], ["lære", "lærer"]),
+        ("kan", "VERB", ["kunne"], ["kan"]),
+        ("x", None, [], []),
+    ]
+    for surface, tag, primary, fallback in cases:
+        ranked = rank_candidates(surface, tag, merge_candidates(primary, fallback), primary)
+        assert pick_best_candidate(surface, tag, primary, fallback) == (ranked[0] if ranked else None)
+
+
+def test_normalize_candidate_fast_path_matches_full_normalization() -> None:
+    for text in ["bog", "bogen", "kæreste", "  BoG  ", "kan\tlide", "kan lide", "ord\u00a0bog", "123", ""]:
+        assert normalize_candidate(text) == " ".join(text.strip().split()).lower()
+
+
+def test_adapter_runs_single_word_lookups_through_enabled_components(monkeypatch) -> None:
+    fake_nlp = _FakeNLP()
+    applied: list[str] = []
+
+    def tagger(doc):
+        applied.append("tagger")
+        return doc
+
+    make_doc = _FakeNLP.__call__
+    fake_nlp.make_doc = lambda text: make_doc(fake_nlp, text)
+    fake_nlp.pipeline = [("tagger", tagger)]
+    monkeypatch.setattr(_FakeNLP, "__call__", lambda self, text: pytest.fail("nlp() called for one word"))
+    monkeypatch.setitem(sys.modules, "dacy", types.SimpleNamespace(load=lambda _model: fake_nlp))
+    monkeypatch.setitem(sys.modules, "lemmy", types.SimpleNamespace(load=lambda _lang: _FakeLemmy()))
+    monkeypatch.setattr(danish, "package_version", lambda _name: "3.7.0")
+
+    adapter = DaCyLemmyNLPAdapter("fake-model")
+
+    assert adapter.lemma_for_token("bogen") == "bog"
+    assert applied == ["tagger"]
+
+
+def test_adapter_disables_pipes_it_does_not_read(monkeypatch) -> None:
+    fake_nlp = _FakeNLP()
+    fake_nlp.pipe_names = ["transformer", "tagger", "morphologizer", "parser", "ner", "trainable_lemmatizer"]
+    disabled: list[str] = []
+    fake_nlp.select_pipes = lambda *, disable: disabled.extend(disable)
+    monkeypatch.setitem(sys.modules, "dacy", types.SimpleNamespace(load=lambda _model: fake_nlp))
+    monkeypatch.setitem(sys.modules, "lemmy", types.SimpleNamespace(load=lambda _lang: _FakeLemmy()))
+    monkeypatch.setattr(danish, "package_version", lambda _name: "3.7.0")
+
+    DaCyLemmyNLPAdapter("fake-model")
+
+    assert disabled == ["parser", "ner", "trainable_lemmatizer"]
+
+
 def test_load_adapter_falls_back_when_requested_model_unavailable(monkeypatch, tmp_path) -> None:
     def _load(model_name: str):
         if model_name == "fallback-model":
@@ -117,3 +264,158 @@ def test_load_adapter_falls_back_when_requested_model_unavailable(monkeypatch, t
     adapter = load_danish_nlp_adapter(settings)
     assert isinstance(adapter, DaCyLemmyNLPAdapter)
     assert adapter.model_name == "fallback-model"
+
+
+def test_batching_adapter_coalesces_concurrent_tokenize_calls() -> None:
+    class _RecordingAdapter:
+        def __init__(self):
+            self.batches: list[list[str]] = []
+
+        def tokenize_many(self, texts: list[str]) -> list[list[NLPToken]]:
+            self.batches.append(list(texts))
+            # Model work: callers arriving meanwhile queue up for the next batch.
+            time.sleep(0.05)
+            return [
+                [NLPToken(text=text, lemma=None, pos=None, morphology=None, is_punctuation=False)]
+                for text in texts
+            ]
+
+    inner = _RecordingAdapter()
+    adapter = BatchingNLPAdapter(inner, max_wait_seconds=0.2)
+    texts = [f"note {index}" for index in range(6)]
+    results: dict[str, list[NLPToken]] = {}
+    barrier = threading.Barrier(len(texts))
+
+    def worker(text: str) -> None:
+        barrier.wait()
+        results[text] = adapter.tokenize(text)
+
+    threads = [threading.Thread(target=worker, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert {text: tokens[0].text for text, tokens in results.items()} == {text: text for text in texts}
+    assert sorted(text for batch in inner.batches for text in batch) == sorted(texts)
+    assert len(inner.batches) < len(texts)
+
+
+def test_batching_adapter_recovers_when_inner_adapter_raises() -> None:
+    class _Abort(BaseException):
+        pass
+
+    class _FailingAdapter:
+        def __init__(self):
+            self.failures: list[BaseException] = [ValueError("model failed"), _Abort()]
+
+        def tokenize_many(self, texts: list[str]) -> list[list[NLPToken]]:
+            if self.failures:
+                raise self.failures.pop(0)
+            return [
+                [NLPToken(text=text, lemma=None, pos=None, morphology=None, is_punctuation=False)]
+                for text in texts
+            ]
+
+    adapter = BatchingNLPAdapter(_FailingAdapter(), max_wait_seconds=0)
+
+    with pytest.raises(ValueError):
+        adapter.tokenize("første")
+    with pytest.raises(_Abort):
+        adapter.tokenize("anden")
+
+    # Leadership was released, so a later call runs its own batch instead of blocking.
+    results: list[list[NLPToken]] = []
+    thread = threading.Thread(target=lambda: results.append(adapter.tokenize("tredje")), daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert [token.text for token in results[0]] == ["tredje"]
+
+
+def _tokens_for(texts: list[str]) -> list[list[NLPToken]]:
+    return [[NLPToken(text=text, lemma=None, pos=None, morphology=None, is_punctuation=False)] for text in texts]
+
+
+def test_batching_adapter_skips_batch_wait_for_a_lone_caller() -> None:
+    class _InstantAdapter:
+        def tokenize_many(self, texts: list[str]) -> list[list[NLPToken]]:
+            return _tokens_for(texts)
+
+    adapter = BatchingNLPAdapter(_InstantAdapter(), max_wait_seconds=5.0)
+
+    started = time.perf_counter()
+    tokens = adapter.tokenize("alene")
+
+    assert [token.text for token in tokens] == ["alene"]
+    assert time.perf_counter() - started < 1.0
+
+
+def test_batching_adapter_leader_runs_only_its_own_batch() -> None:
+    first_batch_running = threading.Event()
+    release_first_batch = threading.Event()
+
+    class _BlockingAdapter:
+        def __init__(self):
+            self.batches: list[tuple[str, list[str]]] = []
+
+        def tokenize_many(self, texts: list[str]) -> list[list[NLPToken]]:
+            self.batches.append((threading.current_thread().name, list(texts)))
+            if not first_batch_running.is_set():
+                first_batch_running.set()
+                release_first_batch.wait()
+            return _tokens_for(texts)
+
+    inner = _BlockingAdapter()
+    # A full batch ends the wait early, so the 5 s ceiling is never reached.
+    adapter = BatchingNLPAdapter(inner, max_batch_size=2, max_wait_seconds=5.0)
+    results: dict[str, str] = {}
+
+    def worker(text: str) -> None:
+        results[text] = adapter.tokenize(text)[0].text
+
+    first = threading.Thread(target=worker, args=("første",), name="første", daemon=True)
+    first.start()
+    first_batch_running.wait(timeout=5)
+    followers = [
+        threading.Thread(target=worker, args=(text,), name=text, daemon=True)
+        for text in ("anden", "tredje", "fjerde")
+    ]
+    for thread in followers:
+        thread.start()
+    while len(adapter._queue) < len(followers):
+        time.sleep(0.001)
+    started = time.perf_counter()
+    release_first_batch.set()
+    for thread in [first, *followers]:
+        thread.join(timeout=5)
+
+    assert results == {text: text for text in ("første", "anden", "tredje", "fjerde")}
+    assert time.perf_counter() - started < 2.0
+    assert inner.batches[0] == ("første", ["første"])
+    # Each batch is run by one of its own callers, not by the first leader.
+    assert all(runner in texts for runner, texts in inner.batches)
+    assert len(inner.batches) == 3
+
+
+def test_batching_adapter_fails_whole_batch_on_result_count_mismatch() -> None:
+    class _ShortAdapter:
+        def tokenize_many(self, texts: list[str]) -> list[list[NLPToken]]:
+            return _tokens_for(texts[:-1])
+
+    adapter = BatchingNLPAdapter(_ShortAdapter(), max_wait_seconds=0)
+
+    errors: list[BaseException] = []
+
+    def worker() -> None:
+        try:
+            adapter.tokenize("kort")
+        except ValueError as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert len(errors) == 1
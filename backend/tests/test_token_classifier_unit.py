@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from app.db.migrations import apply_migrations, get_connection
 from app.services import token_classifier
 from app.services.token_classifier import LemmaAwareClassifier, normalize_token
 from app.services.typo.typo_engine import TypoResult, TypoSuggestion
@@ -96,6 +97,14 @@ def test_normalize_token_trims_collapses_whitespace_and_lowercases() -> None:
     assert normalize_token("  kan   lide  ") == "kan lide"
 
 
+def test_normalize_token_memoizes_repeated_inputs() -> None:
+    normalize_token("Hyggelig")
+    hits_before = normalize_token.cache_info().hits
+
+    assert normalize_token("Hyggelig") == "hyggelig"
+    assert normalize_token.cache_info().hits == hits_before + 1
+
+
 def test_exact_match_priority_beats_lemma_match(monkeypatch) -> None:
     responses = {
         ("surface", "bogen"): {"lemma": "bog", "form": "bogen"},
@@ -183,3 +192,168 @@ def test_unknown_can_fallback_to_typo_engine(monkeypatch) -> None:
     assert result.match_source == "none"
     assert result.suggestions
     assert result.suggestions[0].value == "spiser"
+
+
+def _traced_wordbank(tmp_path, monkeypatch) -> list[str]:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    with get_connection(db_path) as conn:
+        conn.execute("INSERT INTO lexemes (lemma, source) VALUES ('bog', 'manual'), ('kat', 'manual')")
+        conn.execute(
+            "INSERT INTO surface_forms (lexeme_id, form, source) "
+            "SELECT id, 'bogen', 'manual' FROM lexemes WHERE lemma = 'bog'"
+        )
+
+    statements: list[str] = []
+
+    def traced_connection(path):
+        conn = get_connection(path)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(token_classifier, "get_connection", traced_connection)
+    return statements
+
+
+def test_classify_many_reuses_cached_results(tmp_path, monkeypatch) -> None:
+    statements = _traced_wordbank(tmp_path, monkeypatch)
+    cache = token_classifier.new_classification_cache()
+    classifier = LemmaAwareClassifier(
+        tmp_path / "danote.sqlite3",
+        nlp_adapter=_StubNLPAdapter({"bogen": "bog"}),
+        cache=cache,
+    )
+
+    first = classifier.classify_many(["bogen", "bogen"])
+    statements_after_first = len(statements)
+    second = classifier.classify_many(["bogen"])
+
+    assert [result.classification for result in first] == ["known", "known"]
+    assert second[0] is first[0]
+    assert len(statements) == statements_after_first
+
+
+def test_classify_many_drops_cached_results_when_ignored_tokens_change(tmp_path) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+
+    class _IgnoreAwareTypoEngine(_StubTypoEngine):
+        changed = False
+
+        def refresh_ignored_tokens(self) -> bool:
+            return self.changed
+
+    engine = _IgnoreAwareTypoEngine()
+    classifier = LemmaAwareClassifier(db_path, typo_engine=engine, cache=token_classifier.new_classification_cache())
+
+    first = classifier.classify_many(["spisr"])
+    assert classifier.classify_many(["spisr"])[0] is first[0]
+    engine.changed = True
+
+    assert classifier.classify_many(["spisr"])[0] is not first[0]
+
+
+def test_classify_shares_interned_results_with_classify_many(tmp_path, monkeypatch) -> None:
+    statements = _traced_wordbank(tmp_path, monkeypatch)
+    classifier = LemmaAwareClassifier(
+        tmp_path / "danote.sqlite3",
+        nlp_adapter=_StubNLPAdapter({"bogen": "bog"}),
+        cache=token_classifier.new_classification_cache(),
+    )
+
+    batched = classifier.classify_many(["kat", "bogen"])
+    statements_after_batch = len(statements)
+
+    assert classifier.classify("bogen") is batched[1]
+    assert classifier.classify("bogen") is batched[1]
+    assert len(statements) == statements_after_batch
+
+
+def test_classify_many_batches_wordbank_lookups(tmp_path, monkeypatch) -> None:
+    statements = _traced_wordbank(tmp_path, monkeypatch)
+    classifier = LemmaAwareClassifier(
+        tmp_path / "danote.sqlite3",
+        nlp_adapter=_StubNLPAdapter({"bøgerne": "bog", "hunden": "hund"}),
+    )
+
+    results = classifier.classify_many(["kat", "bogen", "kat", "bøgerne", "hunden", "bogen"])
+
+    assert [result.classification for result in results] == [
+        "known",
+        "known",
+        "known",
+        "variation",
+        "new",
+        "known",
+    ]
+    assert statements[0] == "BEGIN"
+    # Exact forms plus exact lemmas, then candidate lemmas: two queries whatever the token count.
+    assert len([sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]) == 2
+
+
+def test_classify_many_prefetches_candidates_for_unknown_tokens_once(tmp_path) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    with get_connection(db_path) as conn:
+        conn.execute("INSERT INTO lexemes (lemma, source) VALUES ('bog', 'manual')")
+
+    class _BatchingStub(_StubNLPAdapter):
+        def __init__(self, mapping):
+            super().__init__(mapping)
+            self.batches: list[list[str]] = []
+            self.single_calls: list[str] = []
+
+        def lemma_candidates_for_token(self, token: str) -> list[str]:
+            self.single_calls.append(token)
+            return super().lemma_candidates_for_token(token)
+
+        def lemma_candidates_many(self, tokens: list[str]) -> list[list[str]]:
+            self.batches.append(list(tokens))
+            return [super(_BatchingStub, self).lemma_candidates_for_token(token) for token in tokens]
+
+    adapter = _BatchingStub({"bogen": "bog"})
+    classifier = LemmaAwareClassifier(db_path, nlp_adapter=adapter)
+
+    results = classifier.classify_many(["Bog", "bogen", "huset", "bogen"])
+
+    assert [result.classification for result in results] == ["known", "variation", "new", "variation"]
+    assert adapter.batches == [["bogen", "huset"]]
+    # "huset" has no candidates, so only its lemma_for_token fallback may ask again.
+    assert "bogen" not in adapter.single_calls
+
+
+def test_classify_skips_lookups_for_non_word_tokens(tmp_path, monkeypatch) -> None:
+    statements = _traced_wordbank(tmp_path, monkeypatch)
+    classifier = LemmaAwareClassifier(
+        tmp_path / "danote.sqlite3",
+        nlp_adapter=_StubNLPAdapter({}),
+    )
+
+    result = classifier.classify("?!")
+    batched = classifier.classify_many(["...", "🙂"])
+
+    assert result.classification == "new"
+    assert result.match_source == "none"
+    assert [item.classification for item in batched] == ["new", "new"]
+    assert not [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+
+
+def test_wordbank_snapshot_replaces_per_batch_queries(tmp_path, monkeypatch) -> None:
+    statements = _traced_wordbank(tmp_path, monkeypatch)
+    classifier = LemmaAwareClassifier(
+        tmp_path / "danote.sqlite3",
+        nlp_adapter=_StubNLPAdapter({"bøgerne": "bog", "hunden": "hund"}),
+        wordbank_snapshot=token_classifier.WordbankSnapshotCache(),
+    )
+
+    first = classifier.classify_many(["kat", "bogen", "bøgerne", "hunden"])
+    selects_after_load = len([sql for sql in statements if sql.lstrip().upper().startswith("SELECT")])
+    second = classifier.classify_many(["bøgerne", "bogen"])
+    single = classifier.classify("kat")
+
+    assert [result.classification for result in first] == ["known", "known", "variation", "new"]
+    assert [result.classification for result in second] == ["variation", "known"]
+    assert second[1].matched_surface_form == "bogen"
+    assert single.classification == "known"
+    assert selects_after_load == 2
+    assert len([sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]) == 2
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from app.nlp.token_filter import is_wordlike_token
+from app.nlp.adapter import NLPToken
+from app.nlp.token_filter import filter_wordlike_tokens, is_wordlike_token
 
 
 def test_is_wordlike_token_filters_symbols_and_keeps_words_numbers() -> None:
@@ -10,3 +11,14 @@ def test_is_wordlike_token_filters_symbols_and_keeps_words_numbers() -> None:
     assert not is_wordlike_token("🙂")
     assert not is_wordlike_token(">")
     assert not is_wordlike_token("   ")
+
+
+def test_filter_wordlike_tokens_drops_punctuation_and_symbols() -> None:
+    tokens = [
+        NLPToken(text="Hej", lemma="hej", pos="INTJ", morphology=None, is_punctuation=False),
+        NLPToken(text=",", lemma=None, pos="PUNCT", morphology=None, is_punctuation=True),
+        NLPToken(text=" ", lemma=None, pos=None, morphology=None, is_punctuation=False),
+        NLPToken(text="_", lemma=None, pos=None, morphology=None, is_punctuation=False),
+        NLPToken(text="2", lemma="2", pos="NUM", morphology=None, is_punctuation=False),
+    ]
+    assert [token.text for token in filter_wordlike_tokens(tokens)] == ["Hej", "2"]
@@ -25,6 +25,7 @@ def test_feedback_and_ignore_endpoints_persist_rows(tmp_path, stub_nlp_adapter_f
 
     with TestClient(app) as client:
         ignore = client.post("/api/tokens/ignore", json={"token": "PLC", "scope": "global"})
+        app.state.classification_cache.set(("spisr", False), object())
         feedback = client.post(
             "/api/tokens/feedback",
             json={
@@ -40,6 +41,7 @@ def test_feedback_and_ignore_endpoints_persist_rows(tmp_path, stub_nlp_adapter_f
     assert ignore.json()["status"] == "ignored"
     assert feedback.status_code == 200
     assert feedback.json()["status"] == "recorded"
+    assert app.state.classification_cache.get(("spisr", False)) is None
 
     with get_connection(db_path) as conn:
         ignored = conn.execute("SELECT token FROM ignored_tokens WHERE token = ?", ("plc",)).fetchone()
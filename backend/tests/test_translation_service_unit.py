@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
 import httpx
 import pytest
 
@@ -108,18 +111,18 @@ def test_translation_service_does_not_retry_non_retryable_status(monkeypatch) ->
     assert fake_client.calls == 1
 
 
-def test_translation_service_disambiguates_is_when_provider_echoes_identity(monkeypatch) -> None:
+def test_translation_service_asks_homographs_with_disambiguation_context_first(monkeypatch) -> None:
     service = DeepLTranslationService(api_key="test-key", max_retries=0)
     fake_client = _FakeClient(
         sequence=[
-            _FakeResponse(payload={"translations": [{"text": "is"}]}),
             _FakeResponse(payload={"translations": [{"text": "ice cream"}]}),
         ]
     )
     monkeypatch.setattr(service, "_ensure_client", lambda: fake_client)
     assert service.translate_da_to_en("is") == "ice cream"
-    assert fake_client.calls == 2
-    assert fake_client.requests[1]["json"]["context"] != fake_client.requests[0]["json"]["context"]
+    assert fake_client.calls == 1
+    assert fake_client.requests[0]["json"]["context"] != service.context_template
+    assert "is" in fake_client.requests[0]["json"]["context"]
 
 
 def test_translation_service_uses_fallback_when_disambiguation_response_is_still_identity(monkeypatch) -> None:
@@ -127,22 +130,129 @@ def test_translation_service_uses_fallback_when_disambiguation_response_is_still
     fake_client = _FakeClient(
         sequence=[
             _FakeResponse(payload={"translations": [{"text": "is"}]}),
-            _FakeResponse(payload={"translations": [{"text": "is"}]}),
         ]
     )
     monkeypatch.setattr(service, "_ensure_client", lambda: fake_client)
     assert service.translate_da_to_en("is") == "ice cream"
-    assert fake_client.calls == 2
+    assert fake_client.calls == 1
 
 
 def test_translation_service_uses_fallback_if_disambiguation_call_fails(monkeypatch) -> None:
     service = DeepLTranslationService(api_key="test-key", max_retries=0)
     fake_client = _FakeClient(
         sequence=[
-            _FakeResponse(payload={"translations": [{"text": "is"}]}),
             httpx.ConnectError("transport failed"),
         ]
     )
     monkeypatch.setattr(service, "_ensure_client", lambda: fake_client)
     assert service.translate_da_to_en("is") == "ice cream"
+    assert fake_client.calls == 1
+
+
+def test_translation_service_uses_generic_context_for_homograph_without_fallback(monkeypatch) -> None:
+    service = DeepLTranslationService(api_key="test-key", max_retries=0, homograph_fallback_translations={})
+    fake_client = _FakeClient(
+        sequence=[
+            _FakeResponse(payload={"translations": [{"text": "is"}]}),
+            _FakeResponse(payload={"translations": [{"text": "ice"}]}),
+        ]
+    )
+    monkeypatch.setattr(service, "_ensure_client", lambda: fake_client)
+    assert service.translate_da_to_en("is") == "ice"
+    assert fake_client.calls == 2
+    assert fake_client.requests[1]["json"]["context"] == service.context_template
+
+
+def test_translation_service_caches_results_per_direction(monkeypatch) -> None:
+    service = DeepLTranslationService(api_key="test-key:fx", min_request_interval_seconds=0)
+    fake_client = _FakeClient(_FakeResponse())
+    monkeypatch.setattr(service, "_ensure_client", lambda: fake_client)
+
+    assert service.translate_da_to_en("bog") == "book"
+    assert service.translate_da_to_en("  bog ") == "book"
+    assert service.translate_en_to_da("bog") == "book"
+    assert fake_client.calls == 2
+
+
+def test_translation_service_warm_up_swallows_transport_errors(monkeypatch) -> None:
+    service = DeepLTranslationService(api_key="test-key:fx")
+    requested: list[str] = []
+
+    class _UnreachableClient:
+        def get(self, url, **_kwargs):
+            requested.append(url)
+            raise httpx.ConnectError("offline")
+
+    monkeypatch.setattr(service, "_ensure_client", lambda: _UnreachableClient())
+
+    service.warm_up()
+
+    assert requested == ["/v2/usage"]
+
+
+def test_translation_service_returns_letterless_input_without_calling_api(monkeypatch) -> None:
+    service = DeepLTranslationService(api_key="test-key:fx")
+    fake_client = _FakeClient(_FakeResponse())
+    monkeypatch.setattr(service, "_ensure_client", lambda: fake_client)
+
+    assert service.translate_da_to_en(" 42 ") == "42"
+    assert service.translate_en_to_da("3.14 %") == "3.14 %"
+    assert fake_client.calls == 0
+
+
+def test_translation_service_batches_texts_into_one_request(monkeypatch) -> None:
+    service = DeepLTranslationService(api_key="test-key:fx", min_request_interval_seconds=0)
+    fake_client = _FakeClient(
+        _FakeResponse(payload={"translations": [{"text": "book"}, {"text": "the house"}]})
+    )
+    monkeypatch.setattr(service, "_ensure_client", lambda: fake_client)
+
+    translated = service.translate_da_to_en_batch(["bog", " huset", "", "42", "bog"])
+
+    assert translated == ["book", "the house", None, "42", "book"]
+    assert fake_client.calls == 1
+    assert fake_client.requests[0]["json"]["text"] == ["bog", "huset"]
+    assert service.translate_da_to_en("huset") == "the house"
+    assert fake_client.calls == 1
+
+
+def test_translation_service_reuses_one_keepalive_client_until_closed() -> None:
+    with DeepLTranslationService(api_key="test-key:fx") as service:
+        client = service._ensure_client()
+        assert service._ensure_client() is client
+
+    assert client.is_closed
+    assert service._client is None
+
+
+def test_translation_service_caches_empty_results_until_ttl(monkeypatch) -> None:
+    service = DeepLTranslationService(
+        api_key="test-key:fx",
+        min_request_interval_seconds=0,
+        empty_result_ttl_seconds=0,
+    )
+    fake_client = _FakeClient(_FakeResponse(payload={"translations": [{"text": "  "}]}))
+    monkeypatch.setattr(service, "_ensure_client", lambda: fake_client)
+
+    assert service.translate_da_to_en("bog") is None
+    assert service.translate_da_to_en("bog") is None
     assert fake_client.calls == 2
+
+    service.empty_result_ttl_seconds = 60
+    service.translate_da_to_en("hus")
+    assert service.translate_da_to_en("hus") is None
+    assert fake_client.calls == 3
+
+
+def test_translation_service_backoff_uses_full_jitter_and_http_date_retry_after(monkeypatch) -> None:
+    service = DeepLTranslationService(api_key="test-key:fx", backoff_seconds=1.0, max_backoff_seconds=8.0)
+    sleeps: list[float] = []
+    monkeypatch.setattr("app.services.translation.time.sleep", sleeps.append)
+    monkeypatch.setattr("app.services.translation.random.uniform", lambda low, high: high / 2)
+
+    service._sleep_before_retry(attempt=2, response=None)
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    service._sleep_before_retry(attempt=0, response=_http_status_error(429, retry_after=retry_at).response)
+
+    assert sleeps[0] == 2.0
+    assert sleeps[1] == 8.0
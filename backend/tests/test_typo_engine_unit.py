@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import pytest
+
+from app.core.cache import LRUCache
 from app.db.migrations import apply_migrations, get_connection
-from app.services.typo.typo_engine import TypoEngine
+from app.services.typo import candidates, typo_engine
+from app.services.typo.gating import should_run_typo_check
+from app.services.typo.normalization import comparison_forms, normalize_for_typo_compare
+from app.services.typo.typo_engine import TypoEngine, TypoSuggestion
 
 
 def _seed_lemma(db_path, lemma: str) -> None:
@@ -40,6 +46,22 @@ def test_typo_engine_skips_acronym_and_digits(tmp_path) -> None:
     assert "gating_skip_digit_ratio" in digits.reason_tags
 
 
+def test_gating_skips_emails_urls_and_paths() -> None:
+    cases = {
+        "ole@example.dk": "gating_skip_email",
+        "https://danote.dk/noter": "gating_skip_url",
+        "WWW.danote.dk": "gating_skip_url",
+        "/home/ole/noter": "gating_skip_path",
+        "c:\\noter": "gating_skip_path",
+    }
+    for token, tag in cases.items():
+        result = should_run_typo_check(token=token, normalized=token.lower())
+        assert not result.should_run
+        assert result.reason_tags == (tag,)
+
+    assert should_run_typo_check(token="og/eller", normalized="og/eller").should_run
+
+
 def test_typo_engine_uses_multiple_dictionaries(tmp_path) -> None:
     db_path = tmp_path / "danote.sqlite3"
     apply_migrations(db_path)
@@ -71,3 +93,251 @@ def test_typo_engine_updates_in_memory_ignored_cache_on_add(tmp_path) -> None:
 
     assert result.status == "new"
     assert "gating_skip_ignored" in result.reason_tags
+
+
+def test_typo_engine_reloads_ignored_tokens_when_an_ignore_expires(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    dictionary_path = tmp_path / "da_words.txt"
+    dictionary_path.write_text("sensor\n", encoding="utf-8")
+    engine = TypoEngine(db_path=db_path, dictionary_path=dictionary_path)
+    engine.add_ignored_token("sensro", expires_at="9999-01-01 00:00:00")
+    assert "gating_skip_ignored" in engine.classify_unknown(token="sensro").reason_tags
+
+    with get_connection(db_path) as conn:
+        conn.execute("UPDATE ignored_tokens SET expires_at = '2000-01-01 00:00:00'")
+    assert engine.refresh_ignored_tokens() is False
+    started = typo_engine.time.monotonic()
+    monkeypatch.setattr(typo_engine.time, "monotonic", lambda: started + 61.0)
+
+    assert engine.refresh_ignored_tokens() is True
+    assert "gating_skip_ignored" not in engine.classify_unknown(token="sensro").reason_tags
+
+
+def test_typo_engine_schedules_ignored_token_reload_at_earliest_expiry(tmp_path) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    dictionary_path = tmp_path / "da_words.txt"
+    dictionary_path.write_text("sensor\n", encoding="utf-8")
+    engine = TypoEngine(db_path=db_path, dictionary_path=dictionary_path)
+    engine.add_ignored_token("plc")
+    with get_connection(db_path) as conn:
+        conn.execute(
+            "INSERT INTO ignored_tokens (token, scope, expires_at) VALUES ('sensro', 'global', datetime('now', '+5 seconds'))"
+        )
+
+    _, reload_in = engine._ignored_tokens_from_db()
+
+    assert 0.0 < reload_in <= 5.0
+
+
+def test_typo_suggestion_payload_is_built_once() -> None:
+    suggestion = TypoSuggestion(value="spiser", score=0.9, source_flags=("from_symspell",))
+
+    payload = suggestion.as_dict
+
+    assert payload == {"value": "spiser", "score": 0.9, "source_flags": ["from_symspell"]}
+    assert suggestion.as_dict is payload
+
+
+def test_candidate_fallback_without_symspell_matches_pure_python_distance(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    _seed_lemma(db_path, "spiser")
+    dictionary_path = tmp_path / "da_words.txt"
+    dictionary_path.write_text("spise\nspiste\nhus\nhyggelig\n", encoding="utf-8")
+    monkeypatch.setattr(candidates, "SymSpell", None)
+    provider = candidates.CandidateProvider(db_path=db_path, dictionary_path=dictionary_path)
+
+    with_rapidfuzz = provider.suggest("spisr")
+    monkeypatch.setattr(candidates, "RapidLevenshtein", None)
+    pure_python = provider.suggest("spisr")
+
+    assert [candidate.value for candidate in with_rapidfuzz] == ["spiser", "spise", "spiste"]
+    assert with_rapidfuzz == pure_python
+
+
+def test_candidate_index_cache_is_reused_and_user_lemmas_apply_as_delta(tmp_path, monkeypatch) -> None:
+    if candidates.SymSpell is None:
+        pytest.skip("symspellpy not installed")
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    _seed_lemma(db_path, "spiser")
+    dictionary_path = tmp_path / "da_words.txt"
+    dictionary_path.write_text("spise\nhus\n", encoding="utf-8")
+    index_path = tmp_path / "index.pkl.gz"
+    candidates.CandidateProvider(db_path=db_path, dictionary_path=dictionary_path, index_cache_path=index_path)
+    assert index_path.exists()
+
+    def fail_build(self):
+        raise AssertionError("general index should be loaded from the cache")
+
+    monkeypatch.setattr(candidates.CandidateProvider, "_build_general_index", fail_build)
+    provider = candidates.CandidateProvider(
+        db_path=db_path, dictionary_path=dictionary_path, index_cache_path=index_path
+    )
+    assert [candidate.value for candidate in provider.suggest("spisr")] == ["spiser", "spise"]
+
+    _seed_lemma(db_path, "huse")
+    with get_connection(db_path) as conn:
+        conn.execute("DELETE FROM lexemes WHERE lemma = 'spiser'")
+    provider.refresh_user_lexicon()
+
+    assert [candidate.value for candidate in provider.suggest("spisr")] == ["spise"]
+    assert "huse" in [candidate.value for candidate in provider.suggest("husee")]
+
+
+def test_comparison_forms_swaps_each_danish_digraph_independently() -> None:
+    assert comparison_forms("Hus!").alternates == ("hus",)
+    assert comparison_forms("blåbær").alternates == ("blaabær", "blåbaer", "blåbær")
+    assert comparison_forms("soe").alternates == ("soe", "sø")
+
+
+@pytest.mark.parametrize(
+    ("token", "expected"),
+    [
+        ("...", ""),
+        ("«hus»", "hus"),
+        ("!?hus.!?", "hus"),
+        ("-.-hus-.-", "hus"),
+        ("(hus)\n.", "hus"),
+        ("’hus’", "hus"),
+        ("_hus_", "_hus_"),
+        ("!a!b!", "a!b"),
+    ],
+)
+def test_normalize_for_typo_compare_strips_edges_in_one_pass(token: str, expected: str) -> None:
+    assert normalize_for_typo_compare(token) == expected
+
+
+def test_lru_cache_get_and_set_refresh_recency() -> None:
+    cache = LRUCache[str, int](max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    cache.set("a", 10)
+    cache.set("d", 4)
+    assert cache.get("a") == 10
+    assert cache.get("c") is None
+    assert cache.get("missing") is None
+
+
+def test_is_valid_word_skips_database_for_unknown_lemmas(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    _seed_lemma(db_path, "spiser")
+    dictionary_path = tmp_path / "da_words.txt"
+    dictionary_path.write_text("hus\n", encoding="utf-8")
+    provider = candidates.CandidateProvider(db_path=db_path, dictionary_path=dictionary_path)
+    provider.add_user_lexeme("kage")
+    with get_connection(db_path) as conn:
+        conn.execute("INSERT INTO lexemes (lemma, source) VALUES ('kage', 'manual')")
+
+    def fail_connection(*args, **kwargs):
+        raise AssertionError("unknown words should not hit SQLite")
+
+    real_connection = candidates.get_connection
+    monkeypatch.setattr(candidates, "get_connection", fail_connection)
+    assert provider.is_valid_word("hus")
+    assert not provider.is_valid_word("bogen")
+
+    monkeypatch.setattr(candidates, "get_connection", real_connection)
+    assert provider.is_valid_word("spiser")
+    assert provider.is_valid_word("kage")
+
+
+def test_candidate_fallback_uses_cached_user_lemmas(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    _seed_lemma(db_path, "spiser")
+    dictionary_path = tmp_path / "da_words.txt"
+    dictionary_path.write_text("spise\n", encoding="utf-8")
+    monkeypatch.setattr(candidates, "SymSpell", None)
+    provider = candidates.CandidateProvider(db_path=db_path, dictionary_path=dictionary_path)
+    provider.add_user_lexeme("spisen")
+
+    def fail_load(self):
+        raise AssertionError("fallback suggestions should not rescan lexemes")
+
+    monkeypatch.setattr(candidates.CandidateProvider, "_load_user_lemmas", fail_load)
+    suggestions = provider.suggest("spisr")
+
+    assert [candidate.value for candidate in suggestions] == ["spiser", "spise", "spisen"]
+    assert suggestions[0].source_flags == ("from_user_dict",)
+
+
+def test_suggest_many_computes_each_normalized_form_once(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    dictionary_path = tmp_path / "da_words.txt"
+    dictionary_path.write_text("spise\nhus\n", encoding="utf-8")
+    provider = candidates.CandidateProvider(db_path=db_path, dictionary_path=dictionary_path)
+    expected = {token: provider.suggest(token) for token in ("spisr", "Spisr.", "huus")}
+    calls: list[str] = []
+    original_suggest = provider.suggest
+
+    def counting_suggest(token, **kwargs):
+        calls.append(token)
+        return original_suggest(token, **kwargs)
+
+    monkeypatch.setattr(provider, "suggest", counting_suggest)
+    results = provider.suggest_many(["spisr", "Spisr.", "huus", "spisr"])
+
+    assert results == expected
+    assert calls == ["spisr", "huus"]
+
+
+def test_typo_engine_caches_known_lemmas_until_lexicon_changes(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    _seed_lemma(db_path, "spiser")
+    dictionary_path = tmp_path / "da_words.txt"
+    dictionary_path.write_text("spise\n", encoding="utf-8")
+    engine = TypoEngine(db_path=db_path, dictionary_path=dictionary_path)
+
+    assert engine._known_lemmas() == {"spiser"}
+    _seed_lemma(db_path, "kage")
+    assert engine._known_lemmas() == {"spiser"}
+
+    engine.add_user_lexeme("kage")
+    assert engine._known_lemmas() == {"spiser", "kage"}
+
+
+def test_typo_engine_batch_writes_token_events_on_exit(tmp_path) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    _seed_lemma(db_path, "spiser")
+    dictionary_path = tmp_path / "da_words.txt"
+    dictionary_path.write_text("spiser\nspise\n", encoding="utf-8")
+    engine = TypoEngine(db_path=db_path, dictionary_path=dictionary_path)
+
+    def event_count() -> int:
+        with get_connection(db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM token_events").fetchone()[0]
+
+    with engine.batch():
+        engine.classify_unknown(token="spisr")
+        engine.classify_unknown(token="huus")
+        with engine.batch():
+            engine.classify_unknown(token="kage")
+        assert event_count() == 0
+
+    assert event_count() == 3
+    engine.classify_unknown(token="bogg")
+    assert event_count() == 4
+
+
+def test_add_user_lexeme_does_not_mutate_set_seen_by_readers(tmp_path) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    dictionary_path = tmp_path / "da_words.txt"
+    dictionary_path.write_text("hus\n", encoding="utf-8")
+    provider = candidates.CandidateProvider(db_path=db_path, dictionary_path=dictionary_path)
+    snapshot = provider._known_user_lemmas
+
+    provider.add_user_lexeme("kage")
+
+    assert "kage" not in snapshot
+    assert "kage" in provider._known_user_lemmas
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import random
+
 from app.services.typo.candidates import Candidate
 from app.services.typo.decision import decide_status
-from app.services.typo.ranking import rank_candidates
+from app.services.typo.ranking import _weighted_edit_cost, rank_candidates
 
 
 def test_rank_candidates_prefers_danish_diacritic_substitution() -> None:
@@ -83,3 +85,58 @@ def test_decide_status_promotes_distance_one_high_likelihood_to_typo() -> None:
 
     assert result.status == "typo_likely"
     assert "distance_one_boost" in result.reason_tags
+
+
+def _reference_weighted_edit_cost(observed: str, candidate: str) -> float:
+    # Straightforward full-matrix OSA recurrence the optimized version must match.
+    costs = {("a", "å"): 0.35, ("å", "a"): 0.35, ("o", "ø"): 0.35, ("ø", "o"): 0.35, ("e", "æ"): 0.45, ("æ", "e"): 0.45}
+    a, b = observed.lower(), candidate.lower()
+    dp = [[float(i + j) if i == 0 or j == 0 else 0.0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            replace = 0.0 if a[i - 1] == b[j - 1] else costs.get((a[i - 1], b[j - 1]), 1.0)
+            best = min(dp[i - 1][j] + 1.0, dp[i][j - 1] + 1.0, dp[i - 1][j - 1] + replace)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                best = min(best, dp[i - 2][j - 2] + 0.6)
+            dp[i][j] = best
+    return dp[len(a)][len(b)]
+
+
+def test_weighted_edit_cost_matches_reference_recurrence() -> None:
+    rng = random.Random(7)
+    alphabet = "aåoøeæbst"
+    for _ in range(2000):
+        observed = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+        candidate = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+        assert _weighted_edit_cost(observed, candidate) == _reference_weighted_edit_cost(observed, candidate)
+
+
+def test_weighted_edit_cost_band_matches_full_dp_for_any_bound() -> None:
+    rng = random.Random(11)
+    alphabet = "aåoøeæbst"
+    for _ in range(2000):
+        observed = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+        candidate = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+        max_cost = rng.randint(0, 3)
+        assert _weighted_edit_cost(observed, candidate, max_cost=max_cost) == _reference_weighted_edit_cost(
+            observed, candidate
+        )
+
+
+def test_rank_candidates_limit_returns_prefix_of_full_ranking() -> None:
+    candidates = [
+        Candidate(value=value, distance=distance, source_flags=("from_symspell",), frequency=frequency)
+        for value, distance, frequency in [
+            ("spiser", 1, 10),
+            ("spise", 1, 10),
+            ("spids", 2, 3),
+            ("spist", 2, 10),
+            ("spiste", 2, 10),
+        ]
+    ]
+
+    full = rank_candidates(token="spisr", candidates=candidates, known_lemmas={"spise"})
+    top = rank_candidates(token="spisr", candidates=candidates, known_lemmas={"spise"}, limit=3)
+
+    assert top == full[:3]
+    assert rank_candidates(token="spisr", candidates=[], known_lemmas=set(), limit=3) == []
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from app.api.schemas.v1.wordbank import LemmaDetailsResponse
-from app.db.migrations import apply_migrations
+from app.db.migrations import apply_migrations, get_connection
+from app.db.pool import ConnectionPool
 from app.services.use_cases.analyze import AnalyzeNoteUseCase, strip_inline_comments
 from app.services.use_cases.sentencebank import SentencebankUseCase
 from app.services.use_cases.wordbank import WordbankUseCase
+from app.services.token_classifier import LemmaAwareClassifier, WordbankSnapshotCache, new_classification_cache
+from app.services.typo import candidates
+from app.services.typo.typo_engine import TypoEngine
 from app.nlp.adapter import NLPToken
 
 
@@ -73,6 +80,93 @@ def test_wordbank_use_case_round_trip(tmp_path: Path) -> None:
     assert listing.items[0].english_translation is None
 
 
+def test_wordbank_repeat_add_word_touches_existing_surface_form(tmp_path: Path) -> None:
+    db_path = _db_path(tmp_path)
+    WordbankUseCase(db_path).add_word("Bogen", "bog")
+
+    repeated = WordbankUseCase(
+        db_path,
+        translation_service=FakeTranslationService({"bog": "book", "bogen": "the book"}),
+    ).add_word("bogen", "bog")
+
+    assert repeated.status == "exists"
+    with get_connection(db_path) as conn:
+        row = conn.execute(
+            """
+            SELECT l.english_translation AS lemma_translation, sf.english_translation, sf.seen_count
+            FROM surface_forms sf
+            JOIN lexemes l ON l.id = sf.lexeme_id
+            WHERE sf.form = 'bogen'
+            """
+        ).fetchone()
+    assert row["lemma_translation"] == "book"
+    assert row["english_translation"] == "the book"
+    assert row["seen_count"] == 2
+
+
+def test_wordbank_repeat_add_word_skips_write_when_already_stored(tmp_path: Path) -> None:
+    db_path = _db_path(tmp_path)
+    use_case = WordbankUseCase(db_path)
+    use_case.add_word("Bogen", "bog")
+
+    repeated = use_case.add_word("bogen", "bog")
+
+    assert repeated.status == "exists"
+    assert repeated.stored_surface_form == "bogen"
+    with get_connection(db_path) as conn:
+        seen_count = conn.execute("SELECT seen_count FROM surface_forms WHERE form = 'bogen'").fetchone()[0]
+    assert seen_count == 1
+
+
+def test_wordbank_list_lemmas_json_matches_model_payload(tmp_path: Path) -> None:
+    use_case = WordbankUseCase(_db_path(tmp_path))
+
+    use_case.add_word("bogen", "bog")
+    use_case.add_word("huse", "hus")
+
+    assert json.loads(use_case.list_lemmas_json()) == use_case.list_lemmas().model_dump()
+
+
+def test_wordbank_concurrent_add_word_shares_write_lock(tmp_path: Path) -> None:
+    pool = ConnectionPool(_db_path(tmp_path))
+    write_lock = threading.Lock()
+
+    def add(index: int) -> str:
+        use_case = WordbankUseCase(pool.db_path, connection_pool=pool, write_lock=write_lock)
+        return use_case.add_word(f"ord{index}", None).status
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = list(executor.map(add, range(32)))
+
+    assert statuses == ["inserted"] * 32
+    assert len(WordbankUseCase(pool.db_path, connection_pool=pool).list_lemmas().items) == 32
+    pool.close()
+
+
+def test_wordbank_add_word_commits_on_autocommit_pool_connection(tmp_path: Path) -> None:
+    pool = ConnectionPool(_db_path(tmp_path))
+    use_case = WordbankUseCase(pool.db_path, connection_pool=pool)
+
+    assert use_case.add_word("Bogen", "bog").status == "inserted"
+
+    writer = pool.connection()
+    assert writer.isolation_level is None
+    assert not writer.in_transaction
+    with get_connection(pool.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM surface_forms").fetchone()[0] == 1
+    pool.close()
+
+
+def test_wordbank_lemma_details_without_surface_forms(tmp_path: Path) -> None:
+    use_case = WordbankUseCase(_db_path(tmp_path))
+
+    use_case.add_word(" ", "bog")
+
+    details = use_case.get_lemma_details("bog")
+    assert details.lemma == "bog"
+    assert details.surface_forms == []
+
+
 def test_wordbank_use_case_stores_deepl_translations_for_lemma_and_surface(tmp_path: Path) -> None:
     use_case = WordbankUseCase(
         _db_path(tmp_path),
@@ -200,6 +294,22 @@ def test_sentencebank_use_case_add_and_list(tmp_path: Path) -> None:
     assert listing.items[0].source_text == "Jeg elsker dansk"
 
 
+def test_sentencebank_use_case_reuses_pooled_connections(tmp_path: Path) -> None:
+    pool = ConnectionPool(_db_path(tmp_path))
+    use_case = SentencebankUseCase(pool.db_path, connection_pool=pool)
+
+    use_case.add_sentence("Jeg elsker dansk")
+    writer = pool.connection()
+    use_case.add_sentence("Hun læser en bog")
+
+    assert pool.connection() is writer
+    assert [item.source_text for item in use_case.list_sentences().items] == [
+        "Hun læser en bog",
+        "Jeg elsker dansk",
+    ]
+    pool.close()
+
+
 
 
 def test_analyze_use_case_propagates_pos_and_morphology(tmp_path: Path) -> None:
@@ -283,3 +393,104 @@ def test_analyze_use_case_ignores_comment_text_after_hash(tmp_path: Path) -> Non
     tokens = use_case.execute("hej # ignore me\nverden")
     surfaces = [token.surface_token for token in tokens]
     assert surfaces == ["hej", "verden"]
+
+
+def test_add_word_invalidates_shared_classification_cache(tmp_path: Path) -> None:
+    db_path = _db_path(tmp_path)
+    cache = new_classification_cache()
+    analyze = AnalyzeNoteUseCase(
+        db_path,
+        nlp_adapter=FakeNLPAdapter(),
+        typo_engine=None,
+        classification_cache=cache,
+    )
+    wordbank = WordbankUseCase(db_path, classification_cache=cache)
+
+    before = analyze.execute("Hej bog")
+    wordbank.add_word("bog", "bog")
+    after = analyze.execute("Hej bog")
+
+    assert before[1].classification == "new"
+    assert after[1].classification == "known"
+
+
+def test_add_word_invalidates_shared_wordbank_snapshot(tmp_path: Path) -> None:
+    db_path = _db_path(tmp_path)
+    snapshot = WordbankSnapshotCache()
+    classifier = LemmaAwareClassifier(db_path, nlp_adapter=FakeNLPAdapter(), wordbank_snapshot=snapshot)
+    wordbank = WordbankUseCase(db_path, wordbank_snapshot=snapshot)
+
+    before = classifier.classify_many(["bog"])
+    wordbank.add_word("bog", "bog")
+    after = classifier.classify_many(["bog"])
+
+    assert before[0].classification == "new"
+    assert after[0].classification == "known"
+
+
+def test_add_words_translates_through_one_batch_call(tmp_path: Path) -> None:
+    class BatchTranslationService(FakeTranslationService):
+        def __init__(self, mapping: dict[str, str]):
+            super().__init__(mapping)
+            self.batches: list[list[str]] = []
+
+        def translate_da_to_en_batch(self, texts: list[str]) -> list[str | None]:
+            self.batches.append(list(texts))
+            return [self._mapping.get(text) for text in texts]
+
+    translation_service = BatchTranslationService({"bog": "book", "bogen": "the book", "hus": "house"})
+    use_case = WordbankUseCase(_db_path(tmp_path), translation_service=translation_service)
+
+    results = use_case.add_words([("bogen", "bog"), ("hus", "hus")])
+
+    assert [result.status for result in results] == ["inserted", "inserted"]
+    assert translation_service.batches == [["bog", "bogen", "hus"]]
+    assert translation_service.calls == []
+    assert use_case.get_lemma_details("bog").english_translation == "book"
+
+
+def test_add_words_leaves_all_untranslated_when_batch_comes_back_short(tmp_path: Path) -> None:
+    class ShortBatchTranslationService(FakeTranslationService):
+        def translate_da_to_en_batch(self, texts: list[str]) -> list[str | None]:
+            return [self._mapping.get(text) for text in texts[:-1]]
+
+    translation_service = ShortBatchTranslationService({"bog": "book", "hus": "house"})
+    use_case = WordbankUseCase(_db_path(tmp_path), translation_service=translation_service)
+
+    use_case.add_words([("bog", "bog"), ("hus", "hus")])
+
+    assert use_case.get_lemma_details("bog").english_translation is None
+    assert use_case.get_lemma_details("hus").english_translation is None
+
+
+def test_wordbank_reset_database_drops_user_lemmas_from_typo_suggestions(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(candidates, "SymSpell", None)
+    db_path = _db_path(tmp_path)
+    dictionary_path = tmp_path / "da_words.txt"
+    dictionary_path.write_text("spise\n", encoding="utf-8")
+    typo_engine = TypoEngine(db_path=db_path, dictionary_path=dictionary_path)
+    use_case = WordbankUseCase(db_path, typo_engine=typo_engine)
+    use_case.add_word("spiser", "spiser")
+    assert "spiser" in [candidate.value for candidate in typo_engine.candidates.suggest("spisr")]
+
+    use_case.reset_database()
+
+    assert [candidate.value for candidate in typo_engine.candidates.suggest("spisr")] == ["spise"]
+
+
+def test_wordbank_reset_database_keeps_in_use_pooled_connections_valid(tmp_path: Path) -> None:
+    pool = ConnectionPool(_db_path(tmp_path))
+    write_lock = threading.Lock()
+    use_case = WordbankUseCase(pool.db_path, connection_pool=pool, write_lock=write_lock)
+    use_case.add_word("Bogen", "bog")
+    in_use = pool.read_connection()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(use_case.reset_database).result()
+
+    # The reader's connection was not closed under it and sees the fresh database.
+    assert in_use.execute("SELECT COUNT(*) FROM lexemes").fetchone()[0] == 0
+    assert pool.read_connection() is not in_use
+    assert use_case.add_word("huset", "hus").status == "inserted"
+    assert [item.lemma for item in use_case.list_lemmas().items] == ["hus"]
+    pool.close()
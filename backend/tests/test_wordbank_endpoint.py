@@ -82,6 +82,38 @@ def test_add_word_duplicate_is_graceful(tmp_path, stub_nlp_adapter_factory) -> N
     assert "already" in second_payload["message"].lower()
 
 
+def test_add_words_batch_inserts_in_one_request(tmp_path, stub_nlp_adapter_factory) -> None:
+    db_path = tmp_path / "danote.sqlite3"
+    apply_migrations(db_path)
+    app = create_app(_test_settings(db_path), nlp_adapter_factory=stub_nlp_adapter_factory)
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/wordbank/lexemes/batch",
+            json={
+                "items": [
+                    {"surface_token": "Bogen", "lemma_candidate": "bog"},
+                    {"surface_token": "bøger", "lemma_candidate": "bog"},
+                    {"surface_token": "bogen", "lemma_candidate": "bog"},
+                ]
+            },
+        )
+        rejected = client.post(
+            "/api/wordbank/lexemes/batch",
+            json={"items": [{"surface_token": "huset"}, {"surface_token": " "}]},
+        )
+
+    assert response.status_code == 200
+    assert [item["status"] for item in response.json()["items"]] == ["inserted", "inserted", "exists"]
+    assert rejected.status_code == 400
+
+    with get_connection(db_path) as conn:
+        forms = {row["form"] for row in conn.execute("SELECT form FROM surface_forms").fetchall()}
+        huset = conn.execute("SELECT 1 FROM lexemes WHERE lemma = 'huset'").fetchone()
+    assert forms == {"bogen", "bøger"}
+    assert huset is None
+
+
 def test_list_lemmas_returns_sorted_lemmas_with_variation_counts(tmp_path, stub_nlp_adapter_factory) -> None:
     db_path = tmp_path / "danote.sqlite3"
     apply_migrations(db_path)